@@ -6,7 +6,9 @@ topic modeling, methodology classification, findings extraction, and comparative
 """
 
 import logging
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import numpy as np
 
 from autonomous_research_agent.core.exceptions import AnalysisError
 from autonomous_research_agent.core.query_processor import StructuredQuery
@@ -28,7 +30,7 @@ class AnalysisManager:
         """Initialize the analysis manager"""
         self.nlp_pipeline = NLPPipeline()
         self.topic_modeler = TopicModeler()
-        self.methodology_classifier = MethodologyClassifier()
+        self.methodology_classifier = MethodologyClassifier(shared_pipeline=self.nlp_pipeline)
         self.findings_extractor = FindingsExtractor()
         self.comparative_analysis = ComparativeAnalysis()
     
@@ -46,23 +48,54 @@ class AnalysisManager:
         logger.info(f"Analyzing {len(papers)} papers")
         
         try:
-            # Step 1: Analyze individual papers
-            analyzed_papers = self._analyze_papers(papers)
+            # Step 1: Analyze individual papers as they complete, collecting the
+            # inputs of the later steps in the same pass
+            analyzed_papers = []
+            abstracts = []
+            topic_texts = []
+            methodologies = []
+            findings_list = []
+            
+            for analyzed_paper in self._iter_analyzed(papers):
+                analyzed_papers.append(analyzed_paper)
+                
+                abstract = analyzed_paper.get('abstract')
+                abstracts.append(abstract or '')
+                
+                # Use title as fallback for topic modeling
+                topic_texts.append(abstract or analyzed_paper.get('title', ''))
+                
+                if 'methodologies' in analyzed_paper:
+                    methodologies.append(analyzed_paper['methodologies'])
+                
+                # Empty list for papers without findings
+                findings_list.append(analyzed_paper.get('findings', []))
+            
+            # Embed findings and abstracts in a single batch
+            finding_embeddings, abstract_embeddings = self._encode_texts(findings_list, abstracts)
             
             # Step 2: Perform topic modeling
-            topic_analysis = self._perform_topic_modeling(analyzed_papers)
+            topic_analysis = self._perform_topic_modeling(topic_texts, analyzed_papers)
             
             # Step 3: Compare methodologies
-            methodology_comparison = self._compare_methodologies(analyzed_papers)
+            methodology_comparison = self._compare_methodologies(methodologies)
             
             # Step 4: Compare findings
-            findings_comparison = self._compare_findings(analyzed_papers)
+            findings_comparison = self._compare_findings(findings_list, analyzed_papers, finding_embeddings)
             
-            # Step 5: Identify research gaps
-            research_gaps = self.comparative_analysis.identify_research_gaps(analyzed_papers)
+            # Step 5: Identify research gaps, reusing the methodology counts
+            methodology_counts = None
+            if methodology_comparison['success']:
+                methodology_counts = methodology_comparison['results']['category_counts']
+            
+            research_gaps = self.comparative_analysis.identify_research_gaps(
+                analyzed_papers, methodology_counts=methodology_counts
+            )
             
             # Step 6: Generate comparison matrix
-            comparison_matrix = self.comparative_analysis.generate_comparison_matrix(analyzed_papers)
+            comparison_matrix = self.comparative_analysis.generate_comparison_matrix(
+                analyzed_papers, abstract_embeddings=abstract_embeddings
+            )
             
             # Combine all analysis results
             analysis_results = {
@@ -82,111 +115,204 @@ class AnalysisManager:
             logger.error(f"Error analyzing papers: {str(e)}")
             raise AnalysisError(f"Analysis failed: {str(e)}")
     
-    def _analyze_papers(self, papers: List[ProcessedPaper]) -> List[Dict]:
+    def _iter_analyzed(self, papers: List[ProcessedPaper]) -> Iterator[Dict]:
+        """
+        Analyze individual papers, yielding results in paper order
+        
+        Args:
+            papers: List of processed papers
+            
+        Yields:
+            Dictionaries with paper analysis results
+        """
+        # Extract entities from all abstracts in one batch
+        entities = self._extract_entities(papers)
+        
+        # Classify the methodologies of all papers in one batch
+        methodology_scores = self._classify_methodologies(papers)
+        
+        # The models are shared and not thread-safe, so papers are analyzed one
+        # at a time; findings extraction batches its model calls within a paper
+        for paper, paper_entities, paper_scores in zip(papers, entities, methodology_scores):
+            yield self._analyze_single(paper, paper_entities, paper_scores)
+    
+    def _extract_entities(self, papers: List[ProcessedPaper]) -> List[Optional[Dict[str, List[str]]]]:
         """
-        Analyze individual papers
+        Extract named entities from paper abstracts in one batch
         
         Args:
             papers: List of processed papers
             
         Returns:
-            List of dictionaries with paper analysis results
+            List of entity dictionaries aligned with papers (None where a paper has no abstract)
         """
-        analyzed_papers = []
+        entities = [None] * len(papers)
         
-        for paper in papers:
-            try:
-                # Create base paper dictionary
-                analyzed_paper = {
-                    'id': paper.id,
-                    'title': paper.title,
-                    'abstract': paper.abstract,
-                    'authors': paper.authors,
-                    'year': paper.year,
-                    'venue': paper.venue,
-                    'doi': paper.doi,
-                    'url': paper.url,
-                    'source': paper.source,
-                    'keywords': paper.keywords,
-                    'categories': paper.categories,
-                    'citation_count': paper.citation_count
-                }
-                
-                # Extract entities from abstract
-                if paper.abstract:
-                    analyzed_paper['entities'] = self.nlp_pipeline.extract_entities(paper.abstract)
-                
-                # Classify methodology
-                methodology_text = ""
-                if paper.structured_content and 'methodology' in paper.structured_content:
-                    methodology_text = paper.structured_content['methodology']
-                elif paper.abstract:
-                    methodology_text = paper.abstract
-                
-                if methodology_text:
-                    analyzed_paper['methodologies'] = self.methodology_classifier.classify_methodology(methodology_text)
-                    analyzed_paper['primary_methodology'] = self.methodology_classifier.get_primary_methodology(methodology_text)
-                
+        abstract_indices = [i for i, paper in enumerate(papers) if paper.abstract]
+        if not abstract_indices:
+            return entities
+        
+        try:
+            batch_entities = self.nlp_pipeline.extract_entities_batch(
+                [papers[i].abstract for i in abstract_indices]
+            )
+        except Exception as e:
+            logger.error(f"Error extracting entities: {str(e)}")
+            return entities
+        
+        for i, paper_entities in zip(abstract_indices, batch_entities):
+            entities[i] = paper_entities
+        
+        return entities
+    
+    def _classify_methodologies(self, papers: List[ProcessedPaper]) -> List[Optional[Dict[str, float]]]:
+        """
+        Classify the methodologies of papers in one batch
+        
+        The methodology section is classified where available, the abstract otherwise.
+        
+        Args:
+            papers: List of processed papers
+            
+        Returns:
+            List of methodology scores aligned with papers (None where a paper has
+            no text to classify)
+        """
+        methodology_scores = [None] * len(papers)
+        
+        methodology_texts = {}
+        for i, paper in enumerate(papers):
+            if paper.structured_content and 'methodology' in paper.structured_content:
+                methodology_texts[i] = paper.structured_content['methodology']
+            elif paper.abstract:
+                methodology_texts[i] = paper.abstract
+        
+        # Skip empty methodology sections
+        indices = [i for i, text in methodology_texts.items() if text]
+        if not indices:
+            return methodology_scores
+        
+        try:
+            batch_scores = self.methodology_classifier.classify_batch([methodology_texts[i] for i in indices])
+        except Exception as e:
+            logger.error(f"Error classifying methodologies: {str(e)}")
+            return methodology_scores
+        
+        for i, scores in zip(indices, batch_scores):
+            methodology_scores[i] = scores
+        
+        return methodology_scores
+    
+    def _analyze_single(self, paper: ProcessedPaper,
+                        entities: Optional[Dict[str, List[str]]] = None,
+                        methodology_scores: Optional[Dict[str, float]] = None) -> Dict:
+        """
+        Analyze a single paper
+        
+        Args:
+            paper: Processed paper
+            entities: Entities already extracted from the paper abstract
+            methodology_scores: Methodology scores already computed for the paper
+            
+        Returns:
+            Dictionary with paper analysis results
+        """
+        try:
+            # Create base paper dictionary
+            analyzed_paper = {
+                'id': paper.id,
+                'title': paper.title,
+                'abstract': paper.abstract,
+                'authors': paper.authors,
+                'year': paper.year,
+                'venue': paper.venue,
+                'doi': paper.doi,
+                'url': paper.url,
+                'source': paper.source,
+                'keywords': paper.keywords,
+                'categories': paper.categories,
+                'citation_count': paper.citation_count
+            }
+            
+            # Attach entities extracted from abstract
+            if entities is not None:
+                analyzed_paper['entities'] = entities
+            
+            # Attach methodology scores, with the highest scoring category as primary
+            # (the first one on ties, as get_primary_methodology picks it)
+            if methodology_scores is not None:
+                analyzed_paper['methodologies'] = methodology_scores
+                analyzed_paper['primary_methodology'] = max(methodology_scores.items(), key=lambda item: item[1])
+            
+            if paper.structured_content:
                 # Extract findings
-                if paper.structured_content:
-                    analyzed_paper['findings'] = self.findings_extractor.extract_findings(
-                        paper.full_text or "", paper.sections
-                    )
-                    
-                    # Categorize findings
-                    if analyzed_paper['findings']:
-                        analyzed_paper['categorized_findings'] = self.findings_extractor.categorize_findings(
-                            analyzed_paper['findings']
-                        )
-                
-                # Extract numerical results
-                if 'findings' in analyzed_paper:
-                    analyzed_paper['numerical_results'] = self.findings_extractor.extract_numerical_results(
-                        analyzed_paper['findings']
-                    )
+                analyzed_paper['findings'] = self.findings_extractor.extract_findings(
+                    paper.full_text or "", paper.sections
+                )
                 
-                # Extract comparative findings
-                if 'findings' in analyzed_paper:
-                    analyzed_paper['comparative_findings'] = self.findings_extractor.extract_comparative_findings(
-                        analyzed_paper['findings']
-                    )
+                # Categorize findings and extract numerical and comparative findings in one pass
+                classified = self.findings_extractor.classify_all(analyzed_paper['findings'])
                 
-                # Add to analyzed papers
-                analyzed_papers.append(analyzed_paper)
+                if analyzed_paper['findings']:
+                    analyzed_paper['categorized_findings'] = classified['categories']
                 
-            except Exception as e:
-                logger.error(f"Error analyzing paper {paper.id}: {str(e)}")
-                # Add basic paper info even if analysis fails
-                analyzed_papers.append({
-                    'id': paper.id,
-                    'title': paper.title,
-                    'abstract': paper.abstract,
-                    'authors': paper.authors,
-                    'year': paper.year,
-                    'analysis_error': str(e)
-                })
+                analyzed_paper['numerical_results'] = classified['numerical']
+                analyzed_paper['comparative_findings'] = classified['comparative']
+            
+            return analyzed_paper
+            
+        except Exception as e:
+            logger.error(f"Error analyzing paper {paper.id}: {str(e)}")
+            # Add basic paper info even if analysis fails
+            return {
+                'id': paper.id,
+                'title': paper.title,
+                'abstract': paper.abstract,
+                'authors': paper.authors,
+                'year': paper.year,
+                'analysis_error': str(e)
+            }
+    
+    def _encode_texts(self, findings_list: List[List[Dict]],
+                      abstracts: List[str]) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Encode all finding texts and abstracts in one batch
         
-        return analyzed_papers
+        Args:
+            findings_list: List of findings lists, one per paper
+            abstracts: Paper abstracts
+            
+        Returns:
+            Tuple of (finding_embeddings, abstract_embeddings), or (None, None)
+            if encoding fails so that each comparison falls back to its own encoding
+        """
+        # Findings are flattened in paper order, matching compare_findings
+        finding_texts = [finding['text'] for findings in findings_list for finding in findings]
+        
+        if not finding_texts and not abstracts:
+            return None, None
+        
+        try:
+            embeddings = self.comparative_analysis.encode_all(finding_texts + abstracts)
+        except Exception as e:
+            logger.warning(f"Error encoding texts in batch: {str(e)}")
+            return None, None
+        
+        # Split the batch back into findings and abstracts
+        num_findings = len(finding_texts)
+        return embeddings[:num_findings], embeddings[num_findings:]
     
-    def _perform_topic_modeling(self, papers: List[Dict]) -> Dict:
+    def _perform_topic_modeling(self, texts: List[str], papers: List[Dict]) -> Dict:
         """
         Perform topic modeling on papers
         
         Args:
+            texts: Text of each paper (abstract, or title as fallback)
             papers: List of analyzed papers
             
         Returns:
             Dictionary with topic modeling results
         """
-        # Extract text for topic modeling
-        texts = []
-        for paper in papers:
-            if paper.get('abstract'):
-                texts.append(paper['abstract'])
-            else:
-                # Use title as fallback
-                texts.append(paper.get('title', ''))
-        
         # Skip if no texts available
         if not texts:
             return {
@@ -218,22 +344,16 @@ class AnalysisManager:
                 'error': str(e)
             }
     
-    def _compare_methodologies(self, papers: List[Dict]) -> Dict:
+    def _compare_methodologies(self, methodologies: List[Dict]) -> Dict:
         """
         Compare methodologies across papers
         
         Args:
-            papers: List of analyzed papers
+            methodologies: Methodology scores of the papers that have them
             
         Returns:
             Dictionary with methodology comparison results
         """
-        # Extract methodologies
-        methodologies = []
-        for paper in papers:
-            if 'methodologies' in paper:
-                methodologies.append(paper['methodologies'])
-        
         # Skip if no methodologies available
         if not methodologies:
             return {
@@ -257,24 +377,19 @@ class AnalysisManager:
                 'error': str(e)
             }
     
-    def _compare_findings(self, papers: List[Dict]) -> Dict:
+    def _compare_findings(self, findings_list: List[List[Dict]], papers: List[Dict],
+                          embeddings: Optional[np.ndarray] = None) -> Dict:
         """
         Compare findings across papers
         
         Args:
+            findings_list: List of findings lists, one per paper
             papers: List of analyzed papers
+            embeddings: Precomputed embeddings of the flattened finding texts
             
         Returns:
             Dictionary with findings comparison results
         """
-        # Extract findings
-        findings_list = []
-        for paper in papers:
-            if 'findings' in paper:
-                findings_list.append(paper['findings'])
-            else:
-                findings_list.append([])  # Empty list for papers without findings
-        
         # Skip if no findings available
         if not any(findings_list):
             return {
@@ -284,7 +399,7 @@ class AnalysisManager:
         
         try:
             # Compare findings
-            comparison = self.comparative_analysis.compare_findings(findings_list)
+            comparison = self.comparative_analysis.compare_findings(findings_list, embeddings=embeddings)
             
             # Compare numerical results
             numerical_comparison = self.comparative_analysis.compare_numerical_results(papers)
@@ -5,24 +5,98 @@ This module compares methodologies, findings, and results across multiple resear
 identifying similarities, differences, and trends in the literature.
 """
 
+import hashlib
 import logging
+import re
+from collections import OrderedDict
 from typing import Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
-from sentence_transformers import SentenceTransformer, util
+import torch
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 
+from autonomous_research_agent.analysis.models import get_sentence_transformer
 from autonomous_research_agent.core.exceptions import ModelError
 
 logger = logging.getLogger(__name__)
 
+def _metric_stats(values: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Compute min, max, mean and population standard deviation in a single pass
+    
+    Args:
+        values: 1-D float64 array with at least one value
+        
+    Returns:
+        Tuple of (min, max, mean, std)
+    """
+    minimum = values[0]
+    maximum = values[0]
+    mean = 0.0
+    m2 = 0.0
+    
+    # Welford's online algorithm
+    for i in range(values.shape[0]):
+        value = values[i]
+        if value < minimum:
+            minimum = value
+        if value > maximum:
+            maximum = value
+        delta = value - mean
+        mean += delta / (i + 1)
+        m2 += delta * (value - mean)
+    
+    return minimum, maximum, mean, np.sqrt(m2 / values.shape[0])
+
+try:
+    from numba import njit
+    _metric_stats = njit(cache=True)(_metric_stats)
+except ImportError:
+    logger.debug("Numba not available, metric statistics run in pure Python")
+
 class ComparativeAnalysis:
     """
     Compares methodologies, findings, and results across research papers
     """
     
-    def __init__(self):
-        """Initialize the comparative analysis module"""
+    # Cosine similarity above which two findings are linked into one cluster
+    similarity_threshold = 0.7
+    
+    # Below this many findings the dense similarity matrix is cheaper than a neighbor search
+    dense_similarity_limit = 500
+    
+    # Number of nearest neighbors searched per finding for large collections
+    neighbor_count = 50
+    
+    def __init__(self, embedding_cache_size: int = 100000):
+        """
+        Initialize the comparative analysis module
+        
+        Args:
+            embedding_cache_size: Maximum number of text embeddings kept in the LRU cache
+        """
         self.sentence_transformer = None
+        self.embedding_cache_size = embedding_cache_size
+        self._embedding_cache: 'OrderedDict[bytes, np.ndarray]' = OrderedDict()
+        
+        # Cheap prefilter: findings without digits cannot report a metric value
+        self.digit_pattern = re.compile(r'\d')
+        
+        # Pattern for metrics like "accuracy of X%" or "F1 score of X"; longer names
+        # come first, so "RMSE of X" is counted as rmse only, not also as mse
+        self.metric_pattern = re.compile(
+            r'(?P<metric>accuracy|precision|recall|f1 score|f1|auc|roc|rmse|mae|mse|error rate)'
+            r'\s+(?:of|is|was|:)?\s*(?P<value>\d+(?:\.\d+)?)\s*(?P<percent>%|percent)?',
+            re.IGNORECASE
+        )
+        
+        # Pattern for limitations mentioned in findings
+        self.limitation_pattern = re.compile(
+            r'limitation|future work|further research|drawback|'
+            r'shortcoming|constraint|challenge|open problem',
+            re.IGNORECASE
+        )
         
         # Initialize models
         self._initialize_models()
@@ -31,13 +105,102 @@ class ComparativeAnalysis:
         """Initialize models for comparative analysis"""
         try:
             # Initialize sentence transformer for semantic similarity
-            self.sentence_transformer = SentenceTransformer('all-MiniLM-L6-v2')
-            logger.info("Loaded Sentence Transformer model: all-MiniLM-L6-v2")
+            self.sentence_transformer = get_sentence_transformer('all-MiniLM-L6-v2')
             
         except Exception as e:
             logger.error(f"Error initializing comparative analysis models: {str(e)}")
             raise ModelError("Comparative Analysis", f"Initialization error: {str(e)}")
     
+    def encode_all(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode a batch of texts in a single forward pass
+        
+        Args:
+            texts: List of texts to encode
+            
+        Returns:
+            Array of L2-normalized embeddings, one row per text
+        """
+        if not self.sentence_transformer:
+            raise ModelError("Comparative Analysis", "Sentence Transformer model not initialized")
+        
+        return self._encode_cached(texts)
+    
+    def _encode_cached(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts, reusing cached embeddings of previously seen texts
+        
+        Texts are keyed by a content hash; only distinct texts missing from the
+        cache are encoded, in a single batch.
+        
+        Args:
+            texts: List of texts to encode
+            
+        Returns:
+            Array of L2-normalized embeddings, one row per text
+        """
+        if not texts:
+            dimension = self.sentence_transformer.get_sentence_embedding_dimension()
+            return np.zeros((0, dimension), dtype=np.float32)
+        
+        keys = [hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest() for text in texts]
+        
+        # Collect distinct texts that are not cached yet
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in self._embedding_cache and key not in missing:
+                missing[key] = text
+        
+        if missing:
+            new_embeddings = self._encode_smart_batched(list(missing.values()))
+            for key, embedding in zip(missing, new_embeddings):
+                self._embedding_cache[key] = embedding
+        
+        embeddings = np.stack([self._embedding_cache[key] for key in keys])
+        
+        # Mark entries as recently used and evict the least recently used ones
+        for key in keys:
+            self._embedding_cache.move_to_end(key)
+        while len(self._embedding_cache) > self.embedding_cache_size:
+            self._embedding_cache.popitem(last=False)
+        
+        return embeddings
+    
+    def _encode_smart_batched(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Encode texts in length-homogeneous batches
+        
+        Texts are sorted by length so that each mini-batch is padded only to the
+        longest text it contains, and the embeddings are returned in input order.
+        
+        Args:
+            texts: List of texts to encode
+            batch_size: Number of texts per mini-batch (defaults to 128 on GPU, 32 on CPU)
+            
+        Returns:
+            Array of L2-normalized float32 embeddings, one row per text
+        """
+        if batch_size is None:
+            batch_size = 128 if self.sentence_transformer.device.type == 'cuda' else 32
+        
+        lengths = [len(text.split()) for text in texts]
+        order = np.argsort(lengths, kind='stable')
+        
+        embeddings = self.sentence_transformer.encode(
+            [texts[i] for i in order],
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        
+        # Invert the permutation to restore input order
+        inverse = np.empty_like(order)
+        inverse[order] = np.arange(len(order))
+        
+        # Half-precision models return float16; similarity and search run in float32
+        return embeddings[inverse].astype(np.float32, copy=False)
+    
     def compare_methodologies(self, methodologies: List[Dict]) -> Dict:
         """
         Compare methodologies across papers
@@ -49,13 +212,7 @@ class ComparativeAnalysis:
             Dictionary with comparison results
         """
         # Count methodology categories
-        category_counts = {}
-        for methodology in methodologies:
-            for category, score in methodology.items():
-                if score > 0.3:  # Only count if confidence is high enough
-                    if category not in category_counts:
-                        category_counts[category] = 0
-                    category_counts[category] += 1
+        category_counts = self._count_methodologies(methodologies)
         
         # Calculate methodology diversity
         unique_categories = len(category_counts)
@@ -78,32 +235,66 @@ class ComparativeAnalysis:
         
         return comparison
     
-    def compare_findings(self, findings_list: List[List[Dict]]) -> Dict:
+    def _count_methodologies(self, methodologies: List[Dict[str, float]]) -> Dict[str, int]:
+        """
+        Count papers per methodology category
+        
+        Scores are laid out as a papers x categories array over the vocabulary of
+        categories seen, so the count is a single vectorized comparison.
+        
+        Args:
+            methodologies: List of methodology dictionaries mapping categories to scores
+            
+        Returns:
+            Dictionary mapping categories to the number of papers using them
+        """
+        # Fixed category vocabulary, in order of first appearance
+        categories = list(dict.fromkeys(
+            category for methodology in methodologies for category in methodology
+        ))
+        if not categories:
+            return {}
+        
+        scores = np.array(
+            [[methodology.get(category, 0.0) for category in categories] for methodology in methodologies],
+            dtype=np.float32
+        )
+        
+        # Only count if confidence is high enough
+        counts = np.count_nonzero(scores > 0.3, axis=0)
+        
+        return {category: int(count) for category, count in zip(categories, counts) if count > 0}
+    
+    def compare_findings(self, findings_list: List[List[Dict]],
+                         embeddings: Optional[np.ndarray] = None) -> Dict:
         """
         Compare findings across papers
         
         Args:
             findings_list: List of findings lists from different papers
+            embeddings: Precomputed normalized embeddings of the finding texts,
+                        in the same order as the flattened findings
             
         Returns:
             Dictionary with comparison results
         """
-        if not self.sentence_transformer:
+        if embeddings is None and not self.sentence_transformer:
             raise ModelError("Comparative Analysis", "Sentence Transformer model not initialized")
         
-        # Extract all finding texts
-        all_findings = []
-        for paper_idx, findings in enumerate(findings_list):
-            for finding in findings:
-                all_findings.append({
-                    'paper_idx': paper_idx,
-                    'text': finding['text'],
-                    'confidence': finding['confidence'],
-                    'source': finding.get('source', 'unknown')
-                })
+        # Flatten findings into parallel columns
+        texts = [finding['text'] for findings in findings_list for finding in findings]
+        sources = [finding.get('source', 'unknown') for findings in findings_list for finding in findings]
+        paper_indices = np.fromiter(
+            (paper_idx for paper_idx, findings in enumerate(findings_list) for _ in findings),
+            dtype=np.int32, count=len(texts)
+        )
+        confidences = np.fromiter(
+            (finding['confidence'] for findings in findings_list for finding in findings),
+            dtype=np.float64, count=len(texts)
+        )
         
         # If no findings, return empty comparison
-        if not all_findings:
+        if not texts:
             return {
                 'clusters': [],
                 'agreement_score': 0,
@@ -112,14 +303,24 @@ class ComparativeAnalysis:
             }
         
         # Compute embeddings for all findings
-        texts = [finding['text'] for finding in all_findings]
-        embeddings = self.sentence_transformer.encode(texts, convert_to_tensor=True)
-        
-        # Compute similarity matrix
-        similarity_matrix = util.pytorch_cos_sim(embeddings, embeddings).numpy()
+        if embeddings is None:
+            embeddings = self.encode_all(texts)
+        else:
+            embeddings = self._normalize(embeddings)
+        
+        # Link findings whose similarity exceeds the threshold
+        if self.sentence_transformer is not None and self.sentence_transformer.device.type == 'cuda':
+            adjacency = self._gpu_similarity_graph(embeddings)
+        elif len(embeddings) < self.dense_similarity_limit:
+            similarity_matrix = self._similarity_matrix(embeddings)
+            adjacency = csr_matrix(similarity_matrix > self.similarity_threshold)
+        else:
+            adjacency = self._neighbor_graph(embeddings)
         
         # Cluster similar findings
-        clusters = self._cluster_findings(all_findings, similarity_matrix)
+        clusters = self._cluster_findings(
+            texts, paper_indices, confidences, sources, adjacency, embeddings
+        )
         
         # Calculate agreement and contradiction scores
         agreement_score, contradiction_score = self._calculate_agreement_contradiction(clusters)
@@ -134,46 +335,186 @@ class ComparativeAnalysis:
         
         return comparison
     
-    def _cluster_findings(self, findings: List[Dict], similarity_matrix: np.ndarray) -> List[Dict]:
+    def _normalize(self, embeddings: np.ndarray) -> np.ndarray:
+        """
+        Prepare precomputed embeddings for cosine similarity via matmul
+        
+        Embeddings from encode_all are already L2-normalized and are only made
+        contiguous float32 for BLAS; other embeddings are normalized here.
+        
+        Args:
+            embeddings: Embeddings, one row per text
+            
+        Returns:
+            Contiguous float32 array of L2-normalized embeddings
+        """
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        if np.allclose(norms, 1.0, atol=1e-3):
+            return embeddings
+        
+        return embeddings / np.maximum(norms, 1e-12)
+    
+    def _similarity_matrix(self, embeddings: np.ndarray, block_size: int = 1024) -> np.ndarray:
+        """
+        Compute a half-precision cosine similarity matrix
+        
+        Rows are computed in float32 blocks and stored as float16, which halves the
+        memory of the full matrix without ever materializing it in float32. The
+        0.7 clustering threshold is far coarser than float16 resolution.
+        
+        Args:
+            embeddings: Normalized embeddings, one row per text
+            block_size: Number of rows computed per block
+            
+        Returns:
+            Matrix of similarity scores in float16
+        """
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        num_texts = len(embeddings)
+        
+        similarity_matrix = np.empty((num_texts, num_texts), dtype=np.float16)
+        for start in range(0, num_texts, block_size):
+            end = min(start + block_size, num_texts)
+            similarity_matrix[start:end] = embeddings[start:end] @ embeddings.T
+        
+        return similarity_matrix
+    
+    def _neighbor_graph(self, embeddings: np.ndarray, block_size: int = 1024) -> csr_matrix:
+        """
+        Build a sparse similarity graph from each finding's nearest neighbors
+        
+        Only the top neighbors of each finding are searched, so the dense N x N
+        similarity matrix is never materialized. Uses a FAISS inner-product index
+        when FAISS is installed and a blocked NumPy search otherwise.
+        
+        Args:
+            embeddings: Normalized embeddings, one row per finding
+            block_size: Number of rows searched per block in the NumPy fallback
+            
+        Returns:
+            Sparse boolean adjacency matrix of findings above the similarity threshold
+        """
+        num_texts = len(embeddings)
+        k = min(self.neighbor_count, num_texts)
+        
+        try:
+            import faiss
+            
+            # Inner product equals cosine similarity for normalized embeddings
+            index = faiss.IndexFlatIP(embeddings.shape[1])
+            index.add(embeddings)
+            scores, neighbors = index.search(embeddings, k)
+            
+        except ImportError:
+            scores = np.empty((num_texts, k), dtype=np.float32)
+            neighbors = np.empty((num_texts, k), dtype=np.int64)
+            
+            for start in range(0, num_texts, block_size):
+                end = min(start + block_size, num_texts)
+                block_scores = embeddings[start:end] @ embeddings.T
+                block_neighbors = np.argpartition(-block_scores, k - 1, axis=1)[:, :k]
+                neighbors[start:end] = block_neighbors
+                scores[start:end] = np.take_along_axis(block_scores, block_neighbors, axis=1)
+        
+        # Keep only neighbor pairs above the threshold
+        rows = np.repeat(np.arange(num_texts), k)
+        keep = scores.ravel() > self.similarity_threshold
+        
+        return csr_matrix(
+            (np.ones(np.count_nonzero(keep), dtype=bool), (rows[keep], neighbors.ravel()[keep])),
+            shape=(num_texts, num_texts)
+        )
+    
+    def _gpu_similarity_graph(self, embeddings: np.ndarray, block_size: int = 4096) -> csr_matrix:
+        """
+        Build the similarity graph on the GPU
+        
+        Similarities are computed and thresholded on the device block by block,
+        and only the indices of the linked pairs are copied back to the host,
+        so the dense matrix never crosses to host memory.
+        
+        Args:
+            embeddings: Normalized embeddings, one row per finding
+            block_size: Number of rows computed per block
+            
+        Returns:
+            Sparse boolean adjacency matrix of findings above the similarity threshold
+        """
+        num_texts = len(embeddings)
+        device_embeddings = torch.from_numpy(embeddings).to(
+            device=self.sentence_transformer.device, dtype=torch.float16
+        )
+        
+        rows = []
+        cols = []
+        with torch.no_grad():
+            for start in range(0, num_texts, block_size):
+                block_similarity = device_embeddings[start:start + block_size] @ device_embeddings.T
+                edges = (block_similarity > self.similarity_threshold).nonzero(as_tuple=False).cpu().numpy()
+                rows.append(edges[:, 0] + start)
+                cols.append(edges[:, 1])
+        
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        
+        return csr_matrix(
+            (np.ones(len(rows), dtype=bool), (rows, cols)),
+            shape=(num_texts, num_texts)
+        )
+    
+    def _cluster_findings(self, texts: List[str], paper_indices: np.ndarray,
+                          confidences: np.ndarray, sources: List[str],
+                          adjacency: csr_matrix, embeddings: np.ndarray) -> List[Dict]:
         """
         Cluster similar findings
         
         Args:
-            findings: List of finding dictionaries
-            similarity_matrix: Matrix of similarity scores between findings
+            texts: Finding texts
+            paper_indices: Index of the paper each finding comes from
+            confidences: Confidence of each finding
+            sources: Section each finding was extracted from
+            adjacency: Sparse matrix linking findings above the similarity threshold
+            embeddings: Normalized embeddings of the findings
             
         Returns:
             List of cluster dictionaries
         """
-        # Set similarity threshold
-        threshold = 0.7
+        # Take connected components of the similarity graph as clusters
+        num_clusters, labels = connected_components(adjacency, directed=False)
         
-        # Initialize clusters
-        clusters = []
-        used_indices = set()
+        # Group finding indices by cluster label with a single stable sort
+        order = np.argsort(labels, kind='stable')
+        boundaries = np.cumsum(np.bincount(labels, minlength=num_clusters))[:-1]
         
-        # Cluster similar findings
-        for i in range(len(findings)):
-            if i in used_indices:
-                continue
-            
-            # Find similar findings
-            similar_indices = [j for j in range(len(findings)) 
-                             if similarity_matrix[i, j] > threshold and j not in used_indices]
+        clusters = []
+        for members in np.split(order, boundaries):
+            # Use the finding most similar to the rest of its cluster as representative;
+            # its mean similarity to the members is its dot product with their summed embeddings
+            member_embeddings = embeddings[members]
+            representative = members[np.argmax(member_embeddings @ member_embeddings.sum(axis=0))]
             
-            # Create cluster
             cluster = {
-                'findings': [findings[i]] + [findings[j] for j in similar_indices],
-                'papers': set([findings[i]['paper_idx']] + [findings[j]['paper_idx'] for j in similar_indices]),
-                'representative': findings[i]['text'],
-                'size': 1 + len(similar_indices)
+                'findings': [
+                    {
+                        'paper_idx': paper_idx,
+                        'text': texts[j],
+                        'confidence': confidence,
+                        'source': sources[j]
+                    }
+                    for j, paper_idx, confidence in zip(
+                        members.tolist(),
+                        paper_indices[members].tolist(),
+                        confidences[members].tolist()
+                    )
+                ],
+                'papers': set(np.unique(paper_indices[members]).tolist()),
+                'representative': texts[representative],
+                'size': len(members)
             }
             
             clusters.append(cluster)
-            
-            # Mark indices as used
-            used_indices.add(i)
-            used_indices.update(similar_indices)
         
         # Sort clusters by size
         clusters = sorted(clusters, key=lambda x: x['size'], reverse=True)
@@ -218,49 +559,50 @@ class ComparativeAnalysis:
                 continue
             
             for finding in paper['findings']:
-                # Look for patterns like "accuracy of X%" or "F1 score of X"
-                import re
+                text = finding['text']
+                if not self.digit_pattern.search(text):
+                    continue
                 
-                # Metrics to look for
-                metrics = [
-                    'accuracy', 'precision', 'recall', 'f1', 'f1 score',
-                    'auc', 'roc', 'mae', 'mse', 'rmse', 'error rate'
-                ]
+                # Record the first value reported for each metric in the finding
+                seen_metrics = set()
                 
-                for metric in metrics:
-                    pattern = rf'{metric}\s+(?:of|is|was|:)?\s*(\d+(?:\.\d+)?)\s*(?:%|percent)?'
-                    match = re.search(pattern, finding['text'], re.IGNORECASE)
+                for match in self.metric_pattern.finditer(text):
+                    metric = match.group('metric').lower()
+                    if metric in seen_metrics:
+                        continue
+                    seen_metrics.add(metric)
+                    
+                    value = float(match.group('value'))
+                    
+                    # Adjust percentage values
+                    if match.group('percent'):
+                        if value > 1:  # Assume it's already a percentage
+                            value = value / 100
+                    
+                    if metric not in numerical_results:
+                        numerical_results[metric] = []
                     
-                    if match:
-                        value = float(match.group(1))
-                        
-                        # Adjust percentage values
-                        if '%' in match.group(0) or 'percent' in match.group(0).lower():
-                            if value > 1:  # Assume it's already a percentage
-                                value = value / 100
-                        
-                        if metric not in numerical_results:
-                            numerical_results[metric] = []
-                        
-                        numerical_results[metric].append({
-                            'paper_idx': paper_idx,
-                            'value': value,
-                            'text': finding['text']
-                        })
+                    numerical_results[metric].append({
+                        'paper_idx': paper_idx,
+                        'value': value,
+                        'text': text
+                    })
         
         # Calculate statistics for each metric
         metric_stats = {}
         for metric, results in numerical_results.items():
-            values = [r['value'] for r in results]
+            values = np.fromiter((r['value'] for r in results), dtype=np.float64, count=len(results))
             
-            if not values:
+            if not len(values):
                 continue
             
+            minimum, maximum, mean, std = _metric_stats(values)
+            
             metric_stats[metric] = {
-                'min': min(values),
-                'max': max(values),
-                'mean': sum(values) / len(values),
-                'std': np.std(values) if len(values) > 1 else 0,
+                'min': float(minimum),
+                'max': float(maximum),
+                'mean': float(mean),
+                'std': float(std),
                 'count': len(values),
                 'results': results
             }
@@ -270,12 +612,15 @@ class ComparativeAnalysis:
             'has_comparable_results': len(metric_stats) > 0
         }
     
-    def identify_research_gaps(self, papers: List[Dict]) -> List[str]:
+    def identify_research_gaps(self, papers: List[Dict],
+                               methodology_counts: Optional[Dict[str, int]] = None) -> List[str]:
         """
         Identify potential research gaps based on paper analysis
         
         Args:
             papers: List of paper dictionaries
+            methodology_counts: Precomputed papers per methodology category
+                                (the category_counts of compare_methodologies)
             
         Returns:
             List of potential research gaps
@@ -283,16 +628,10 @@ class ComparativeAnalysis:
         gaps = []
         
         # Check methodology coverage
-        methodology_counts = {}
-        for paper in papers:
-            if 'methodologies' not in paper:
-                continue
-            
-            for methodology, score in paper['methodologies'].items():
-                if score > 0.3:
-                    if methodology not in methodology_counts:
-                        methodology_counts[methodology] = 0
-                    methodology_counts[methodology] += 1
+        if methodology_counts is None:
+            methodology_counts = self._count_methodologies(
+                [paper['methodologies'] for paper in papers if 'methodologies' in paper]
+            )
         
         # Identify underrepresented methodologies
         total_papers = len(papers)
@@ -301,20 +640,13 @@ class ComparativeAnalysis:
                 gaps.append(f"Limited research using {methodology} methodology")
         
         # Check for limitations mentioned in papers
-        limitation_keywords = [
-            'limitation', 'future work', 'further research', 'drawback',
-            'shortcoming', 'constraint', 'challenge', 'open problem'
-        ]
-        
         for paper in papers:
             if 'findings' not in paper:
                 continue
             
             for finding in paper['findings']:
-                for keyword in limitation_keywords:
-                    if keyword in finding['text'].lower():
-                        gaps.append(f"Potential gap: {finding['text']}")
-                        break
+                if self.limitation_pattern.search(finding['text']):
+                    gaps.append(f"Potential gap: {finding['text']}")
         
         # Identify contradictions as potential areas for further research
         if 'findings_comparison' in papers and 'contradiction_score' in papers['findings_comparison']:
@@ -323,12 +655,15 @@ class ComparativeAnalysis:
         
         return gaps
     
-    def generate_comparison_matrix(self, papers: List[Dict]) -> Dict:
+    def generate_comparison_matrix(self, papers: List[Dict],
+                                   abstract_embeddings: Optional[np.ndarray] = None) -> Dict:
         """
         Generate a comparison matrix of papers
         
         Args:
             papers: List of paper dictionaries
+            abstract_embeddings: Precomputed normalized embeddings of the paper abstracts;
+                                 when omitted, the abstracts are encoded here
             
         Returns:
             Dictionary with comparison matrix data
@@ -346,7 +681,7 @@ class ComparativeAnalysis:
         matrix = {
             'papers': [paper.get('title', f"Paper {i}") for i, paper in enumerate(papers)],
             'attributes': {},
-            'similarity': np.zeros((len(papers), len(papers)))
+            'similarity': [[0.0] * len(papers) for _ in papers]
         }
         
         # Fill attribute data
@@ -359,17 +694,23 @@ class ComparativeAnalysis:
                 else:
                     matrix['attributes'][attr].append(None)
         
-        # Calculate paper similarity if sentence transformer is available
-        if self.sentence_transformer:
+        # Calculate paper similarity if embeddings or sentence transformer are available
+        if abstract_embeddings is not None:
+            # Reuse embeddings computed by the caller
+            embeddings = self._normalize(abstract_embeddings)
+        elif self.sentence_transformer:
             # Extract abstracts
-            abstracts = [paper.get('abstract', '') for paper in papers]
+            abstracts = [paper.get('abstract') or '' for paper in papers]
             
             # Compute embeddings
-            embeddings = self.sentence_transformer.encode(abstracts, convert_to_tensor=True)
-            
-            # Compute similarity matrix
-            similarity_matrix = util.pytorch_cos_sim(embeddings, embeddings).numpy()
-            
-            matrix['similarity'] = similarity_matrix.tolist()
+            embeddings = self.encode_all(abstracts)
+        else:
+            embeddings = None
+        
+        if embeddings is not None:
+            # Compute similarity matrix (embeddings are normalized) in float32 and
+            # return it as lists so the results stay JSON-serializable
+            matrix['similarity'] = (embeddings @ embeddings.T).tolist()
         
         return matrix
+
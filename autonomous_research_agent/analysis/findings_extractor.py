@@ -5,44 +5,218 @@ This module extracts key findings, results, and conclusions from research papers
 enabling synthesis and comparison across multiple studies.
 """
 
+import hashlib
 import logging
 import re
-from typing import Dict, List, Optional, Set, Tuple, Union
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Literal, Optional, Tuple, Union
 
 import nltk
+import numpy as np
+import regex
 from nltk.tokenize import sent_tokenize
-from transformers import pipeline
 
+from autonomous_research_agent.analysis.models import get_pipeline
+from autonomous_research_agent.config.settings import settings
 from autonomous_research_agent.core.exceptions import ModelError
 
 logger = logging.getLogger(__name__)
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+    logger.debug("Hyperscan not available, finding patterns are matched with re")
+
+try:
+    import blingfire
+except ImportError:
+    blingfire = None
+    logger.debug("Bling Fire not available, sentences are split with NLTK")
+
+def _select_unique(tokens: np.ndarray, offsets: np.ndarray, threshold: float, limit: int) -> np.ndarray:
+    """
+    Greedily select texts that are not near-duplicates of an earlier selected text
+    
+    Args:
+        tokens: Concatenated token hashes of all texts, sorted and unique within each text
+        offsets: Start offset of each text in tokens, followed by the total length
+        threshold: Jaccard similarity at or above which a text is a duplicate
+        limit: Maximum number of texts to select
+        
+    Returns:
+        Boolean mask of the selected texts
+    """
+    num_texts = offsets.shape[0] - 1
+    selected = np.zeros(num_texts, dtype=np.bool_)
+    kept = np.empty(num_texts, dtype=np.int64)
+    num_kept = 0
+    
+    # 64-bit fingerprint of each token set, one bit per token hash
+    fingerprints = np.zeros(num_texts, dtype=np.uint64)
+    for i in range(num_texts):
+        for k in range(offsets[i], offsets[i + 1]):
+            fingerprints[i] |= np.uint64(1) << np.uint64(tokens[k] & 63)
+    
+    # Each bit set in only one fingerprint comes from a token outside the
+    # intersection, so the XOR popcount bounds the symmetric difference D.
+    # Jaccard >= t requires D <= (1 - t) * (|A| + |B|) / (1 + t).
+    difference_ratio = (1 - threshold) / (1 + threshold)
+    
+    for i in range(num_texts):
+        start_i = offsets[i]
+        size_i = offsets[i + 1] - start_i
+        is_duplicate = False
+        
+        for k in range(num_kept):
+            j = kept[k]
+            start_j = offsets[j]
+            size_j = offsets[j + 1] - start_j
+            
+            # Jaccard similarity is at most the ratio of the set sizes
+            if min(size_i, size_j) / max(size_i, size_j, 1) < threshold:
+                continue
+            
+            # Cheap fingerprint check before the exact intersection
+            difference = fingerprints[i] ^ fingerprints[j]
+            difference_bits = 0
+            while difference:
+                difference &= difference - np.uint64(1)
+                difference_bits += 1
+            if difference_bits > difference_ratio * (size_i + size_j) + 1e-9:
+                continue
+            
+            # Two-pointer intersection of sorted token arrays
+            a = 0
+            b = 0
+            intersection = 0
+            while a < size_i and b < size_j:
+                token_a = tokens[start_i + a]
+                token_b = tokens[start_j + b]
+                if token_a == token_b:
+                    intersection += 1
+                    a += 1
+                    b += 1
+                elif token_a < token_b:
+                    a += 1
+                else:
+                    b += 1
+            
+            union = size_i + size_j - intersection
+            if union > 0 and intersection / union >= threshold:
+                is_duplicate = True
+                break
+        
+        if not is_duplicate:
+            selected[i] = True
+            kept[num_kept] = i
+            num_kept += 1
+            if num_kept == limit:
+                break
+    
+    return selected
+
+try:
+    from numba import njit
+    _select_unique = njit(cache=True)(_select_unique)
+except ImportError:
+    logger.debug("Numba not available, findings are deduplicated in pure Python")
+
+def _collect_match_end(pattern_id: int, start: int, end: int, flags: int, context: List[int]) -> None:
+    """Hyperscan match handler that records the end offset of every match"""
+    context.append(end)
+
 class FindingsExtractor:
     """
     Extracts key findings and results from research papers
     """
     
-    def __init__(self, use_transformer: bool = True):
+    # Jaccard similarity above which two findings are duplicates
+    duplicate_threshold = 0.8
+    
+    # (summarizer, QA model) names per model size; the small models are distilled students
+    model_sizes = {
+        'small': ('sshleifer/distilbart-cnn-6-6', 'distilbert-base-cased-distilled-squad'),
+        'base': ('facebook/bart-large-cnn', 'deepset/roberta-base-squad2')
+    }
+    
+    # Remaining questions are skipped for a section when all its answers to
+    # the leading questions score above early_exit_score
+    early_exit_questions = 2
+    early_exit_score = 0.7
+    
+    # Long QA contexts are read in overlapping token windows rather than truncated
+    qa_window_tokens = 384
+    qa_window_stride = 128
+    qa_batch_size = 16
+    
+    # Sections summarized per forward pass; longer inputs are truncated to the
+    # summarizer's maximum input length
+    summary_batch_size = 8
+    
+    def __init__(self, use_transformer: bool = True, quantize: bool = True,
+                 model_size: Optional[Literal['small', 'base']] = None,
+                 max_findings: Optional[int] = None, summary_skip_count: int = 3,
+                 summary_skip_confidence: float = 0.5, sentence_classifier_path: Optional[str] = None):
         """
         Initialize the findings extractor
         
         Args:
             use_transformer: Whether to use transformer models (True) or rule-based approach (False)
+            quantize: Whether to run the transformer models as INT8 ONNX Runtime models
+                on CPU when optimum is installed
+            model_size: 'small' for distilled models or 'base' for the full-size ones;
+                defaults to the model_size parameter of the findings_extractor model
+                configuration, or 'small'
+            max_findings: Maximum number of findings kept per paper, highest
+                confidence first (None keeps all)
+            summary_skip_count: Number of QA findings above summary_skip_confidence
+                at which a section is not summarized
+            summary_skip_confidence: Confidence a QA finding needs to count
+                towards summary_skip_count
+            sentence_classifier_path: Path to a linear finding-sentence classifier used
+                alongside the patterns in rule-based extraction; defaults to the path of
+                the finding_sentence_classifier model configuration, if any
         """
+        if model_size is None:
+            model_config = settings.models.get('findings_extractor')
+            model_size = model_config.parameters.get('model_size', 'small') if model_config else 'small'
+        
+        if model_size not in self.model_sizes:
+            raise ValueError(f"Model size must be one of {list(self.model_sizes)}")
+        
         self.use_transformer = use_transformer
+        self.quantize = quantize
+        self.model_size = model_size
+        self.max_findings = max_findings
+        self.summary_skip_count = summary_skip_count
+        self.summary_skip_confidence = summary_skip_confidence
+        
+        # Lowercased text and token set per finding text, computed once and
+        # shared by deduplication and classification
+        self._text_view = lru_cache(maxsize=4096)(self._build_text_view)
         self.summarizer = None
         self.qa_model = None
+        self.summarizer_model_name, self.qa_model_name = self.model_sizes[model_size]
         
-        # Ensure NLTK resources are available
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt', quiet=True)
+        # Ensure NLTK resources are available when NLTK splits sentences
+        if blingfire is None:
+            try:
+                nltk.data.find('tokenizers/punkt')
+            except LookupError:
+                nltk.download('punkt', quiet=True)
         
         # Initialize models if using transformer approach
         if self.use_transformer:
             self._initialize_models()
         
+        # Cache of model outputs keyed by content hash, shared across runs
+        self._inference_cache = self._open_inference_cache() if self.use_transformer else None
+        self._inference_cache_lock = threading.Lock()
+        
         # Patterns for finding statements
         self.finding_patterns = [
             r'(?:we|our|this study|this paper|this research|this work)\s+(?:found|show(?:s|ed)|demonstrat(?:e|es|ed)|indicat(?:e|es|ed)|reveal(?:s|ed)|confirm(?:s|ed)|identif(?:y|ies|ied))',
@@ -53,7 +227,40 @@ class FindingsExtractor:
             r'(?:the|our|main|key)\s+(?:contribution|achievement|advancement|improvement)'
         ]
         
-        # Questions for QA model
+        # All finding patterns as one alternation, so each sentence is scanned once
+        self.finding_pattern = re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in self.finding_patterns),
+            re.IGNORECASE
+        )
+        
+        # Hyperscan database scanning all finding patterns in a single pass
+        self._hyperscan_db = self._compile_hyperscan_db()
+        self._hyperscan_local = threading.local()
+        
+        # Patterns for categorizing findings, checked in order
+        self.category_patterns = [
+            ('results', re.compile(r'(result|found|show|demonstrate|indicate|reveal)')),
+            ('conclusions', re.compile(r'(conclude|conclusion|summary|therefore|thus)')),
+            ('contributions', re.compile(r'(contribution|advance|improve|enhance|novel|new)')),
+            ('limitations', re.compile(r'(limitation|drawback|shortcoming|constraint|future work)'))
+        ]
+        
+        # Pattern for numerical values with potential units or metrics; possessive
+        # quantifiers stop the regex engine from backtracking into matched digits
+        self.numerical_pattern = regex.compile(
+            r'\b\d++(?:\.\d++)?+(?:\s*+(?:%|percent|p[<>=]\d++(?:\.\d++)?+|±\s*+\d++(?:\.\d++)?+|accuracy|precision|recall|f1|auc|mae|mse|rmse))?+'
+        )
+        
+        # Pattern for comparative statements
+        self.comparative_pattern = regex.compile(
+            r'\b(better|worse|higher|lower|more|less|increase|decrease|improve|reduce|outperform|exceed|surpass|compared to|than|versus|vs\.)\b',
+            regex.IGNORECASE
+        )
+        
+        # Optional linear classifier for finding sentences the patterns miss
+        self.sentence_classifier = self._load_sentence_classifier(sentence_classifier_path)
+        
+        # Questions for QA model, most informative first since later ones may be skipped
         self.finding_questions = [
             "What are the main findings of this research?",
             "What are the key results of this study?",
@@ -67,18 +274,14 @@ class FindingsExtractor:
         """Initialize transformer models for findings extraction"""
         try:
             # Initialize summarizer
-            self.summarizer = pipeline(
-                "summarization",
-                model="facebook/bart-large-cnn",
-                device=-1  # Use CPU
-            )
+            self.summarizer = get_pipeline("summarization", self.summarizer_model_name, self.quantize)
             
             # Initialize QA model
-            self.qa_model = pipeline(
-                "question-answering",
-                model="deepset/roberta-base-squad2",
-                device=-1  # Use CPU
-            )
+            self.qa_model = get_pipeline("question-answering", self.qa_model_name, self.quantize)
+            
+            # Cached outputs are only valid for the exact model that produced them
+            self._summary_cache_prefix = self._model_cache_prefix("summary", self.summarizer_model_name, self.summarizer)
+            self._qa_cache_prefix = self._model_cache_prefix("qa", self.qa_model_name, self.qa_model)
             
             logger.info("Initialized transformer models for findings extraction")
             
@@ -87,6 +290,107 @@ class FindingsExtractor:
             logger.warning("Falling back to rule-based extraction")
             self.use_transformer = False
     
+    @staticmethod
+    def _model_cache_prefix(kind: str, model_name: str, model_pipeline) -> str:
+        """Build the cache key prefix identifying a model and how it is run"""
+        model = model_pipeline.model
+        return f"{kind}|{model_name}|{type(model).__name__}|{getattr(model, 'dtype', '')}"
+    
+    def _open_inference_cache(self):
+        """
+        Open the cache of QA answers and summaries
+        
+        Returns:
+            Disk cache under the cache directory if diskcache is installed,
+            an in-memory LRU dictionary otherwise, or None if caching is disabled
+        """
+        if not settings.cache.enabled:
+            return None
+        
+        try:
+            import diskcache
+            return diskcache.Cache(str(Path(settings.cache_dir) / "findings"))
+            
+        except ImportError:
+            logger.debug("diskcache not available, caching model outputs in memory")
+            
+        except Exception as e:
+            logger.warning(f"Error opening findings cache, caching in memory: {str(e)}")
+        
+        return OrderedDict()
+    
+    def _cache_get(self, key: str):
+        """
+        Look up a cached model output
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value, or None on a miss
+        """
+        if self._inference_cache is None:
+            return None
+        
+        if isinstance(self._inference_cache, OrderedDict):
+            with self._inference_cache_lock:
+                value = self._inference_cache.get(key)
+                if value is not None:
+                    self._inference_cache.move_to_end(key)
+                return value
+        
+        return self._inference_cache.get(key)
+    
+    def _cache_set(self, key: str, value):
+        """
+        Store a model output in the cache
+        
+        Args:
+            key: Cache key
+            value: Model output
+        """
+        if self._inference_cache is None:
+            return
+        
+        if isinstance(self._inference_cache, OrderedDict):
+            with self._inference_cache_lock:
+                self._inference_cache[key] = value
+                while len(self._inference_cache) > settings.cache.max_size:
+                    self._inference_cache.popitem(last=False)
+        else:
+            self._inference_cache.set(key, value)
+    
+    @staticmethod
+    def _text_digest(text: str) -> str:
+        """Hash text content for use in cache keys"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _compile_hyperscan_db(self):
+        """
+        Compile the finding patterns into a Hyperscan block-mode database
+        
+        Returns:
+            Hyperscan database, or None if Hyperscan is unavailable
+        """
+        if hyperscan is None:
+            return None
+        
+        try:
+            # UTF8 and UCP make \s, \w and \b match Unicode text, as they do in re
+            flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+            
+            db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            db.compile(
+                expressions=[pattern.encode('utf-8') for pattern in self.finding_patterns],
+                ids=list(range(len(self.finding_patterns))),
+                flags=[flags] * len(self.finding_patterns)
+            )
+            return db
+            
+        except Exception as e:
+            logger.warning(f"Error compiling Hyperscan database, using re instead: {str(e)}")
+            return None
+    
     def extract_findings(self, content: str, sections: Dict[str, str]) -> List[Dict[str, str]]:
         """
         Extract key findings from paper content
@@ -98,22 +402,14 @@ class FindingsExtractor:
         Returns:
             List of findings with metadata
         """
-        # First try to extract from results and conclusion sections
-        findings = []
-        
-        # Extract from results section
-        if 'results' in sections and sections['results']:
-            results_findings = self._extract_from_section(
-                sections['results'], 'results'
-            )
-            findings.extend(results_findings)
-        
-        # Extract from conclusion section
-        if 'conclusion' in sections and sections['conclusion']:
-            conclusion_findings = self._extract_from_section(
-                sections['conclusion'], 'conclusion'
-            )
-            findings.extend(conclusion_findings)
+        # First try to extract from results and conclusion sections together,
+        # so transformer inference is batched across both
+        section_items = [
+            (sections[section_name], section_name)
+            for section_name in ('results', 'conclusion')
+            if section_name in sections and sections[section_name]
+        ]
+        findings = self._extract_from_sections(section_items)
         
         # If no findings extracted from specific sections, try abstract
         if not findings and 'abstract' in sections and sections['abstract']:
@@ -144,18 +440,131 @@ class FindingsExtractor:
         Returns:
             List of findings with metadata
         """
+        return self._extract_from_sections([(section_text, section_name)])
+    
+    def _extract_from_sections(self, sections: List[Tuple[str, str]]) -> List[Dict[str, str]]:
+        """
+        Extract findings from several sections at once
+        
+        Args:
+            sections: List of (section text, section name) tuples
+            
+        Returns:
+            List of findings with metadata, grouped by section in input order
+        """
+        if not sections:
+            return []
+        
         if self.use_transformer and self.summarizer and self.qa_model:
-            return self._extract_with_transformer(section_text, section_name)
-        else:
-            return self._extract_with_rules(section_text, section_name)
+            return self._extract_with_transformer(sections)
+        
+        findings = []
+        for section_text, section_name in sections:
+            findings.extend(self._extract_with_rules(section_text, section_name))
+        
+        return findings
+    
+    def _answer_questions(self, texts: List[str]) -> List[List[Dict]]:
+        """
+        Answer the finding questions for each text with batched QA calls
+        
+        The leading questions are asked first for all texts in one batch. A
+        text whose leading answers all score above the early-exit threshold
+        skips the remaining questions, which mostly paraphrase them; the rest
+        are asked for the other texts in a second batch.
+        
+        Args:
+            texts: Context texts
+            
+        Returns:
+            List with the QA answers for each text, one per question asked
+        """
+        leading_questions = self.finding_questions[:self.early_exit_questions]
+        remaining_questions = self.finding_questions[self.early_exit_questions:]
+        
+        # Ask the leading questions for every text
+        answers = self._run_qa([
+            (question, text)
+            for text in texts
+            for question in leading_questions
+        ])
+        
+        num_leading = len(leading_questions)
+        section_answers = [
+            answers[i:i + num_leading]
+            for i in range(0, len(answers), num_leading)
+        ]
+        
+        # Ask the remaining questions only where the leading answers are not all confident
+        pending = [
+            index for index, leading_answers in enumerate(section_answers)
+            if not all(answer['score'] > self.early_exit_score for answer in leading_answers)
+        ]
+        answers = self._run_qa([
+            (question, texts[index])
+            for index in pending
+            for question in remaining_questions
+        ])
+        
+        num_remaining = len(remaining_questions)
+        for offset, index in enumerate(pending):
+            section_answers[index].extend(answers[offset * num_remaining:(offset + 1) * num_remaining])
+        
+        return section_answers
+    
+    def _run_qa(self, queries: List[Tuple[str, str]]) -> List[Dict]:
+        """
+        Answer (question, context) pairs in one batched QA call
+        
+        The pipeline splits each context into overlapping token windows, runs
+        every (question, window) pair in batches and keeps the best-scoring
+        answer per question, so the whole text is read.
+        
+        Args:
+            queries: List of (question, context) tuples
+            
+        Returns:
+            QA answer for each query
+        """
+        if not queries:
+            return []
+        
+        # Answers are cached per question and context, so repeated sections
+        # hit the cache however they are grouped
+        digests = {}
+        keys = []
+        for question, text in queries:
+            if text not in digests:
+                digests[text] = self._text_digest(text)
+            keys.append(f"{self._qa_cache_prefix}|{question}|{digests[text]}")
+        answers = [self._cache_get(key) for key in keys]
+        
+        # Only run the model for queries without a cached answer
+        missing = [i for i, answer in enumerate(answers) if answer is None]
+        if missing:
+            results = self.qa_model(
+                [{'question': queries[i][0], 'context': queries[i][1]} for i in missing],
+                batch_size=self.qa_batch_size,
+                max_seq_len=self.qa_window_tokens,
+                doc_stride=self.qa_window_stride
+            )
+            
+            # Pipelines return a bare dict for a single query
+            if isinstance(results, dict):
+                results = [results]
+            
+            for i, result in zip(missing, results):
+                answers[i] = result
+                self._cache_set(keys[i], result)
+        
+        return answers
     
-    def _extract_with_transformer(self, text: str, section_name: str) -> List[Dict[str, str]]:
+    def _extract_with_transformer(self, sections: List[Tuple[str, str]]) -> List[Dict[str, str]]:
         """
         Extract findings using transformer models
         
         Args:
-            text: Text to extract findings from
-            section_name: Name of the section
+            sections: List of (section text, section name) tuples
             
         Returns:
             List of findings with metadata
@@ -163,65 +572,147 @@ class FindingsExtractor:
         findings = []
         
         try:
-            # Truncate text if too long
-            max_length = 1024
-            words = text.split()
-            if len(words) > max_length:
-                text = ' '.join(words[:max_length])
+            # Use QA model to extract findings for all sections at once
+            try:
+                section_answers = self._answer_questions([text for text, _ in sections])
+            except Exception as e:
+                logger.warning(f"Error with QA model: {str(e)}")
+                section_answers = [[] for _ in sections]
             
-            # Use QA model to extract findings
-            for question in self.finding_questions:
-                try:
-                    answer = self.qa_model(
-                        question=question,
-                        context=text
-                    )
-                    
-                    if answer and answer['score'] > 0.3:
-                        findings.append({
-                            'text': answer['answer'],
-                            'confidence': answer['score'],
-                            'source': section_name,
-                            'extraction_method': 'qa_model'
-                        })
-                except Exception as e:
-                    logger.warning(f"Error with QA model for question '{question}': {str(e)}")
-            
-            # Use summarizer to extract key points
-            if len(text.split()) > 50:  # Only summarize if text is long enough
-                try:
-                    summary = self.summarizer(
-                        text, 
-                        max_length=150, 
-                        min_length=30, 
-                        do_sample=False
-                    )
-                    
-                    summary_text = summary[0]['summary_text']
-                    
-                    # Split summary into sentences
-                    summary_sentences = sent_tokenize(summary_text)
-                    
-                    for sentence in summary_sentences:
-                        # Check if sentence looks like a finding
-                        if self._is_finding_sentence(sentence):
-                            findings.append({
-                                'text': sentence,
-                                'confidence': 0.8,  # Arbitrary confidence for summarizer
-                                'source': section_name,
-                                'extraction_method': 'summarizer'
-                            })
-                except Exception as e:
-                    logger.warning(f"Error with summarizer: {str(e)}")
+            section_qa_findings = []
+            for (_, section_name), answers in zip(sections, section_answers):
+                section_qa_findings.append([
+                    {
+                        'text': answer['answer'],
+                        'confidence': answer['score'],
+                        'source': section_name,
+                        'extraction_method': 'qa_model'
+                    }
+                    for answer in answers
+                    if answer and answer['score'] > 0.3
+                ])
+            
+            # Only summarize sections where QA found too few confident findings,
+            # as the summarizer is by far the most expensive model call
+            pending = [
+                index for index, qa_findings in enumerate(section_qa_findings)
+                if sum(finding['confidence'] > self.summary_skip_confidence for finding in qa_findings)
+                < self.summary_skip_count
+            ]
+            section_texts = [sections[index][0] for index in pending]
+            section_names = [sections[index][1] for index in pending]
+            
+            # Summarize the remaining sections in one batched summarizer call
+            summaries = self._summarize_sections(section_texts, section_names)
+            
+            section_summaries = [[] for _ in sections]
+            for index, summary_findings in zip(pending, summaries):
+                section_summaries[index] = summary_findings
+            
+            for qa_findings, summary_findings in zip(section_qa_findings, section_summaries):
+                findings.extend(qa_findings)
+                findings.extend(summary_findings)
             
             return findings
             
         except Exception as e:
             logger.error(f"Error extracting findings with transformer: {str(e)}")
             logger.warning("Falling back to rule-based extraction")
-            return self._extract_with_rules(text, section_name)
+            findings = []
+            for text, section_name in sections:
+                findings.extend(self._extract_with_rules(text, section_name))
+            return findings
+    
+    def _summarize_sections(self, texts: List[str], section_names: List[str]) -> List[List[Dict[str, str]]]:
+        """
+        Extract findings from summaries of several sections
+        
+        Args:
+            texts: Section texts
+            section_names: Names of the sections
+            
+        Returns:
+            List of findings with metadata for each section, in input order
+        """
+        # Truncate texts for the summarizer if too long
+        max_length = 1024
+        truncated = []
+        for text in texts:
+            words = text.split()
+            if len(words) > max_length:
+                text = ' '.join(words[:max_length])
+            truncated.append(text)
+        
+        # Only summarize if text is long enough
+        indices = [i for i, text in enumerate(truncated) if len(text.split()) > 50]
+        summary_texts = [None] * len(texts)
+        
+        keys = {i: f"{self._summary_cache_prefix}|{self._text_digest(truncated[i])}" for i in indices}
+        for i in indices:
+            summary_texts[i] = self._cache_get(keys[i])
+        
+        # Use summarizer to extract key points for uncached sections in batches
+        missing = [i for i in indices if summary_texts[i] is None]
+        if missing:
+            try:
+                summaries = self._run_summarizer([truncated[i] for i in missing])
+            except Exception as e:
+                # Retry one section at a time so that one failing section does
+                # not cost the summaries of the others
+                logger.warning(f"Error with batched summarizer, retrying per section: {str(e)}")
+                summaries = []
+                for i in missing:
+                    try:
+                        summaries.extend(self._run_summarizer([truncated[i]]))
+                    except Exception as e:
+                        logger.warning(f"Error with summarizer: {str(e)}")
+                        summaries.append(None)
+            
+            for i, summary in zip(missing, summaries):
+                if summary is not None:
+                    summary_texts[i] = summary
+                    self._cache_set(keys[i], summary)
+        
+        section_findings = [[] for _ in texts]
+        for i in indices:
+            if summary_texts[i] is None:
+                continue
+            
+            # Split summary into sentences
+            summary_sentences = self._split_sentences(summary_texts[i])
+            
+            # Keep sentences that look like findings
+            for index in self._find_finding_sentences(summary_sentences):
+                section_findings[i].append({
+                    'text': summary_sentences[index],
+                    'confidence': 0.8,  # Arbitrary confidence for summarizer
+                    'source': section_names[i],
+                    'extraction_method': 'summarizer'
+                })
+        
+        return section_findings
+    
+    def _run_summarizer(self, texts: List[str]) -> List[str]:
+        """
+        Summarize texts with the summarizer pipeline
+        
+        Args:
+            texts: Texts to summarize
+            
+        Returns:
+            Summary text for each input text
+        """
+        summaries = self.summarizer(
+            texts,
+            max_length=150,
+            min_length=30,
+            do_sample=False,
+            truncation=True,
+            batch_size=self.summary_batch_size
+        )
+        return [summary['summary_text'] for summary in summaries]
     
-    def _extract_with_rules(self, text: str, section_name: str) -> List[Dict[str, str]]:
+    def _extract_with_rules(self, text: str, section_name: str) -> Iterator[Dict[str, str]]:
         """
         Extract findings using rule-based approach
         
@@ -230,41 +721,171 @@ class FindingsExtractor:
             section_name: Name of the section
             
         Returns:
-            List of findings with metadata
+            Iterator over findings with metadata
         """
-        findings = []
-        
         # Split text into sentences
-        sentences = sent_tokenize(text)
+        sentences = self._split_sentences(text)
+        matched = self._find_finding_sentences(sentences)
         
-        for sentence in sentences:
-            # Check if sentence contains finding patterns
-            if self._is_finding_sentence(sentence):
-                findings.append({
-                    'text': sentence,
+        # In results and conclusions, let the sentence classifier pick up
+        # findings phrased in ways the patterns miss
+        classified = []
+        if self.sentence_classifier is not None and section_name in ('results', 'conclusion'):
+            matched_set = set(matched)
+            unmatched = [index for index in range(len(sentences)) if index not in matched_set]
+            classified = [unmatched[i] for i in self._classify_sentences([sentences[index] for index in unmatched])]
+        
+        # Yield findings in sentence order
+        classified_set = set(classified)
+        for index in sorted(matched + classified):
+            if index in classified_set:
+                yield {
+                    'text': sentences[index],
+                    'confidence': 0.5,  # Arbitrary confidence for classified sentences
+                    'source': section_name,
+                    'extraction_method': 'classifier'
+                }
+            else:
+                yield {
+                    'text': sentences[index],
                     'confidence': 0.6,  # Arbitrary confidence for rule-based approach
                     'source': section_name,
                     'extraction_method': 'rule_based'
-                })
+                }
+    
+    def _load_sentence_classifier(self, path: Optional[str]):
+        """
+        Load the linear finding-sentence classifier
         
-        return findings
+        The file is a NumPy .npz archive with a 'coef' weight vector over
+        HashingVectorizer(n_features=len(coef), ngram_range=(1, 2),
+        alternate_sign=False) features and a scalar 'intercept', e.g. taken
+        from a LogisticRegression trained offline on labeled sentences.
+        
+        Args:
+            path: Path to the classifier file, or None
+            
+        Returns:
+            Tuple of (vectorizer, weights, intercept), or None if no classifier is configured
+        """
+        if path is None:
+            model_config = settings.models.get('finding_sentence_classifier')
+            path = model_config.path if model_config else None
+        
+        if not path:
+            return None
+        
+        try:
+            from sklearn.feature_extraction.text import HashingVectorizer
+            
+            with np.load(path, allow_pickle=False) as data:
+                weights = data['coef'].astype(np.float64).ravel()
+                intercept = float(data['intercept'])
+            
+            vectorizer = HashingVectorizer(
+                n_features=weights.shape[0],
+                ngram_range=(1, 2),
+                alternate_sign=False
+            )
+            
+            logger.info(f"Loaded finding sentence classifier from {path}")
+            return vectorizer, weights, intercept
+            
+        except Exception as e:
+            logger.warning(f"Error loading finding sentence classifier, using patterns only: {str(e)}")
+            return None
+    
+    def _classify_sentences(self, sentences: List[str]) -> List[int]:
+        """
+        Find the sentences the linear classifier labels as findings
+        
+        Args:
+            sentences: Sentences to classify
+            
+        Returns:
+            Indices of the sentences classified as findings
+        """
+        if not sentences:
+            return []
+        
+        vectorizer, weights, intercept = self.sentence_classifier
+        
+        # One sparse matrix-vector product scores all sentences
+        scores = vectorizer.transform(sentences) @ weights + intercept
+        
+        return np.flatnonzero(scores > 0).tolist()
+    
+    def _split_sentences(self, text: str) -> List[str]:
+        """
+        Split text into sentences, with Bling Fire when available
+        
+        Args:
+            text: Text to split
+            
+        Returns:
+            List of sentences
+        """
+        if blingfire is not None:
+            sentences = blingfire.text_to_sentences(text)
+            return sentences.split('\n') if sentences else []
+        
+        return sent_tokenize(text)
     
-    def _is_finding_sentence(self, sentence: str) -> bool:
+    def _find_finding_sentences(self, sentences: List[str]) -> List[int]:
         """
-        Check if a sentence contains finding patterns
+        Find the sentences that contain finding patterns
+        
+        With Hyperscan, all sentences are joined with a sentinel and scanned in
+        one call; match offsets are mapped back to sentences by binary search
+        over their start offsets. The patterns cannot match across the sentinel.
         
         Args:
-            sentence: Sentence to check
+            sentences: Sentences to check
             
         Returns:
-            True if sentence contains finding patterns, False otherwise
+            Sorted indices of the sentences containing finding patterns
         """
-        # Check if sentence matches any finding pattern
-        for pattern in self.finding_patterns:
-            if re.search(pattern, sentence, re.IGNORECASE):
-                return True
+        if not sentences:
+            return []
+        
+        # re spends its time matching, not in per-call overhead, so a joined
+        # buffer gains nothing there
+        if self._hyperscan_db is None:
+            return [
+                index for index, sentence in enumerate(sentences)
+                if self.finding_pattern.search(sentence)
+            ]
+        
+        # Hyperscan works on bytes and reports match end offsets
+        encoded = [sentence.encode('utf-8') for sentence in sentences]
+        joined = b'\x00'.join(encoded)
+        lengths = [len(sentence) + 1 for sentence in encoded]
+        
+        match_ends = []
+        self._hyperscan_db.scan(
+            joined,
+            match_event_handler=_collect_match_end,
+            context=match_ends,
+            scratch=self._hyperscan_scratch()
+        )
+        match_offsets = [end - 1 for end in match_ends]
+        
+        if not match_offsets:
+            return []
+        
+        starts = np.cumsum([0] + lengths[:-1])
+        indices = np.searchsorted(starts, match_offsets, side='right') - 1
         
-        return False
+        return np.unique(indices).tolist()
+    
+    def _hyperscan_scratch(self):
+        """Get this thread's Hyperscan scratch space, which cannot be shared between concurrent scans"""
+        scratch = getattr(self._hyperscan_local, 'scratch', None)
+        if scratch is None:
+            scratch = hyperscan.Scratch(self._hyperscan_db)
+            self._hyperscan_local.scratch = scratch
+        
+        return scratch
     
     def _extract_from_full_text(self, content: str) -> List[Dict[str, str]]:
         """
@@ -282,34 +903,33 @@ class FindingsExtractor:
         results_pattern = r'(?:^|\n)(?:results|findings)(?:\s|:|\n)+(.*?)(?=(?:^|\n)(?:discussion|conclusion|references))'
         conclusion_pattern = r'(?:^|\n)(?:conclusion|conclusions|summary)(?:\s|:|\n)+(.*?)(?=(?:^|\n)(?:references|acknowledgments|bibliography))'
         
+        section_items = []
+        
         # Extract results section
         results_match = re.search(results_pattern, content, re.IGNORECASE | re.MULTILINE | re.DOTALL)
         if results_match:
-            results_text = results_match.group(1)
-            results_findings = self._extract_from_section(results_text, 'results')
-            findings.extend(results_findings)
+            section_items.append((results_match.group(1), 'results'))
         
         # Extract conclusion section
         conclusion_match = re.search(conclusion_pattern, content, re.IGNORECASE | re.MULTILINE | re.DOTALL)
         if conclusion_match:
-            conclusion_text = conclusion_match.group(1)
-            conclusion_findings = self._extract_from_section(conclusion_text, 'conclusion')
-            findings.extend(conclusion_findings)
+            section_items.append((conclusion_match.group(1), 'conclusion'))
+        
+        findings.extend(self._extract_from_sections(section_items))
         
         # If still no findings, search for finding sentences in the entire text
         if not findings:
             # Split text into sentences
-            sentences = sent_tokenize(content)
-            
-            for sentence in sentences:
-                # Check if sentence contains finding patterns
-                if self._is_finding_sentence(sentence):
-                    findings.append({
-                        'text': sentence,
-                        'confidence': 0.4,  # Lower confidence for full text extraction
-                        'source': 'full_text',
-                        'extraction_method': 'rule_based'
-                    })
+            sentences = self._split_sentences(content)
+            
+            # Keep sentences that contain finding patterns
+            for index in self._find_finding_sentences(sentences):
+                findings.append({
+                    'text': sentences[index],
+                    'confidence': 0.4,  # Lower confidence for full text extraction
+                    'source': 'full_text',
+                    'extraction_method': 'rule_based'
+                })
         
         return findings
     
@@ -317,38 +937,45 @@ class FindingsExtractor:
         """
         Deduplicate findings based on text similarity
         
+        Findings are visited from highest to lowest confidence, and a finding is
+        kept unless it is similar to one already kept, until max_findings are kept.
+        
         Args:
             findings: List of findings to deduplicate
             
         Returns:
-            Deduplicated list of findings
+            Deduplicated list of findings, highest confidence first
         """
         if not findings:
             return []
         
-        # Sort findings by confidence
+        limit = self.max_findings or len(findings)
+        
+        # Compare all pairs over sorted token hashes, in compiled code when numba is available
         sorted_findings = sorted(findings, key=lambda x: x['confidence'], reverse=True)
+        token_hashes = [
+            np.unique(np.fromiter(
+                map(hash, self._text_view(finding['text'])[1]), dtype=np.int64
+            ))
+            for finding in sorted_findings
+        ]
+        offsets = np.zeros(len(token_hashes) + 1, dtype=np.int64)
+        np.cumsum([hashes.shape[0] for hashes in token_hashes], out=offsets[1:])
         
-        # Keep track of unique findings
-        unique_findings = []
-        finding_texts = set()
+        selected = _select_unique(np.concatenate(token_hashes), offsets, self.duplicate_threshold, limit)
+        return [finding for finding, keep in zip(sorted_findings, selected) if keep]
+    
+    def _build_text_view(self, text: str) -> Tuple[str, FrozenSet[str]]:
+        """
+        Build the lowercased text and normalized token set of a finding text
         
-        for finding in sorted_findings:
-            # Normalize text for comparison
-            normalized_text = self._normalize_text(finding['text'])
-            
-            # Check if similar text already exists
-            is_duplicate = False
-            for existing_text in finding_texts:
-                if self._is_similar(normalized_text, existing_text):
-                    is_duplicate = True
-                    break
+        Args:
+            text: Finding text
             
-            if not is_duplicate:
-                unique_findings.append(finding)
-                finding_texts.add(normalized_text)
-        
-        return unique_findings
+        Returns:
+            Tuple of (lowercased text, set of normalized tokens)
+        """
+        return text.lower(), frozenset(self._normalize_text(text).split())
     
     def _normalize_text(self, text: str) -> str:
         """
@@ -371,32 +998,6 @@ class FindingsExtractor:
         
         return normalized
     
-    def _is_similar(self, text1: str, text2: str, threshold: float = 0.8) -> bool:
-        """
-        Check if two texts are similar
-        
-        Args:
-            text1: First text
-            text2: Second text
-            threshold: Similarity threshold
-            
-        Returns:
-            True if texts are similar, False otherwise
-        """
-        # Simple Jaccard similarity
-        words1 = set(text1.split())
-        words2 = set(text2.split())
-        
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        if not union:
-            return False
-        
-        similarity = len(intersection) / len(union)
-        
-        return similarity >= threshold
-    
     def categorize_findings(self, findings: List[Dict[str, str]]) -> Dict[str, List[Dict[str, str]]]:
         """
         Categorize findings by type
@@ -416,25 +1017,13 @@ class FindingsExtractor:
         }
         
         for finding in findings:
-            text = finding['text'].lower()
-            
-            # Check for result patterns
-            if re.search(r'(result|found|show|demonstrate|indicate|reveal)', text):
-                categories['results'].append(finding)
-            
-            # Check for conclusion patterns
-            elif re.search(r'(conclude|conclusion|summary|therefore|thus)', text):
-                categories['conclusions'].append(finding)
+            text = self._text_view(finding['text'])[0]
             
-            # Check for contribution patterns
-            elif re.search(r'(contribution|advance|improve|enhance|novel|new)', text):
-                categories['contributions'].append(finding)
-            
-            # Check for limitation patterns
-            elif re.search(r'(limitation|drawback|shortcoming|constraint|future work)', text):
-                categories['limitations'].append(finding)
-            
-            # Default to other
+            # Use the first matching category, defaulting to other
+            for category, pattern in self.category_patterns:
+                if pattern.search(text):
+                    categories[category].append(finding)
+                    break
             else:
                 categories['other'].append(finding)
         
@@ -452,14 +1041,11 @@ class FindingsExtractor:
         """
         numerical_findings = []
         
-        # Pattern for numerical values with potential units or metrics
-        numerical_pattern = r'\b\d+(?:\.\d+)?(?:\s*(?:%|percent|p[<>=]\d+(?:\.\d+)?|±\s*\d+(?:\.\d+)?|accuracy|precision|recall|f1|auc|mae|mse|rmse))?'
-        
         for finding in findings:
-            text = finding['text']
+            text = self._text_view(finding['text'])[0]
             
             # Check if finding contains numerical values
-            if re.search(numerical_pattern, text):
+            if self.numerical_pattern.search(text):
                 numerical_findings.append(finding)
         
         return numerical_findings
@@ -476,18 +1062,63 @@ class FindingsExtractor:
         """
         comparative_findings = []
         
-        # Pattern for comparative statements
-        comparative_pattern = r'\b(better|worse|higher|lower|more|less|increase|decrease|improve|reduce|outperform|exceed|surpass|compared to|than|versus|vs\.)\b'
-        
         for finding in findings:
-            text = finding['text']
+            text = self._text_view(finding['text'])[0]
             
             # Check if finding contains comparative statements
-            if re.search(comparative_pattern, text, re.IGNORECASE):
+            if self.comparative_pattern.search(text):
                 comparative_findings.append(finding)
         
         return comparative_findings
     
+    def classify_all(self, findings: List[Dict[str, str]]) -> Dict[str, Union[Dict[str, List[Dict[str, str]]], List[Dict[str, str]]]]:
+        """
+        Categorize findings and select numerical and comparative findings in one pass
+        
+        Equivalent to calling categorize_findings, extract_numerical_results and
+        extract_comparative_findings, but each finding is lowercased and walked once.
+        
+        Args:
+            findings: List of findings
+            
+        Returns:
+            Dictionary with 'categories' (as returned by categorize_findings),
+            'numerical' and 'comparative' lists of findings
+        """
+        categories = {
+            'results': [],
+            'conclusions': [],
+            'contributions': [],
+            'limitations': [],
+            'other': []
+        }
+        numerical_findings = []
+        comparative_findings = []
+        
+        for finding in findings:
+            text = self._text_view(finding['text'])[0]
+            
+            # Use the first matching category, defaulting to other
+            for category, pattern in self.category_patterns:
+                if pattern.search(text):
+                    categories[category].append(finding)
+                    break
+            else:
+                categories['other'].append(finding)
+            
+            # Numerical and comparative checks are case-insensitive
+            if self.numerical_pattern.search(text):
+                numerical_findings.append(finding)
+            
+            if self.comparative_pattern.search(text):
+                comparative_findings.append(finding)
+        
+        return {
+            'categories': categories,
+            'numerical': numerical_findings,
+            'comparative': comparative_findings
+        }
+    
     def summarize_findings(self, findings: List[Dict[str, str]], max_length: int = 3) -> str:
         """
         Generate a summary of key findings
@@ -6,29 +6,142 @@ enabling comparison of approaches across different studies.
 """
 
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
-from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
 
+from autonomous_research_agent.analysis.models import get_pipeline
+from autonomous_research_agent.analysis.nlp_pipeline import NLPPipeline
 from autonomous_research_agent.core.exceptions import ModelError
 
 logger = logging.getLogger(__name__)
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+    logger.debug("pyahocorasick not available, methodology keywords are matched with re")
+
+def _is_word_char(char: str) -> bool:
+    """Return True if the character counts as a word character for \\b"""
+    return char.isalnum() or char == '_'
+
+# Lookup table of ASCII word characters, indexed by byte value
+_ASCII_WORD_CHARS = np.array([_is_word_char(chr(i)) for i in range(128)] + [False] * 128, dtype=np.bool_)
+
+def _count_keywords(
+    text: np.ndarray,
+    word_chars: np.ndarray,
+    bucket_offsets: np.ndarray,
+    keyword_order: np.ndarray,
+    keyword_bytes: np.ndarray,
+    keyword_offsets: np.ndarray,
+    category_offsets: np.ndarray,
+    category_ids: np.ndarray,
+    num_categories: int
+) -> np.ndarray:
+    """
+    Count whole-word, non-overlapping keyword occurrences per category in ASCII text
+    
+    Args:
+        text: Lowercased text as bytes
+        word_chars: Word character lookup table indexed by byte value
+        bucket_offsets: Range of keyword_order holding the keywords that start with each byte
+        keyword_order: Keyword indices sorted by first byte
+        keyword_bytes: Concatenated keyword bytes
+        keyword_offsets: Start offset of each keyword in keyword_bytes, followed by the total length
+        category_offsets: Start offset of each keyword's categories in category_ids, followed by the total
+        category_ids: Category indices of every keyword
+        num_categories: Number of categories
+        
+    Returns:
+        Keyword occurrence count for each category
+    """
+    counts = np.zeros(num_categories, dtype=np.int64)
+    last_end = np.full(keyword_offsets.shape[0] - 1, -1, dtype=np.int64)
+    text_length = text.shape[0]
+    
+    for i in range(text_length):
+        # Keywords start and end with word characters, so matches begin at word starts
+        if i > 0 and word_chars[text[i - 1]]:
+            continue
+        
+        first = text[i]
+        for b in range(bucket_offsets[first], bucket_offsets[first + 1]):
+            k = keyword_order[b]
+            start = keyword_offsets[k]
+            end = i + keyword_offsets[k + 1] - start
+            
+            # Skip matches that run past the text, overlap the last one or end mid-word
+            if end > text_length or i <= last_end[k]:
+                continue
+            if end < text_length and word_chars[text[end]]:
+                continue
+            
+            matched = True
+            for j in range(1, end - i):
+                if text[i + j] != keyword_bytes[start + j]:
+                    matched = False
+                    break
+            
+            if matched:
+                last_end[k] = end - 1
+                for c in range(category_offsets[k], category_offsets[k + 1]):
+                    counts[category_ids[c]] += 1
+    
+    return counts
+
+try:
+    from numba import njit
+    _count_keywords = njit(cache=True, nogil=True)(_count_keywords)
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.debug("Numba not available, methodology keywords are counted in Python")
+
 class MethodologyClassifier:
     """
     Classifier for research methodologies
     """
     
-    def __init__(self, use_transformer: bool = True):
+    # Number of texts per zero-shot forward pass
+    batch_size = 16
+    
+    # Rule-based scoring of at least this many texts is spread over threads; the
+    # compiled keyword counter releases the GIL
+    parallel_min_texts = 256
+    
+    # Short texts whose rule-based scores single out one category skip the
+    # transformer. Keyword scores are not calibrated probabilities, so a decisive
+    # keyword hit can still disagree with the zero-shot model on secondary
+    # categories; disable the fast path when those scores matter.
+    enable_fast_path = True
+    fast_path_max_words = 200
+    fast_path_min_score = 0.9
+    fast_path_max_runner_up = 0.3
+    
+    def __init__(
+        self,
+        use_transformer: bool = True,
+        model_name: str = 'valhalla/distilbart-mnli-12-3',
+        shared_pipeline: Optional[NLPPipeline] = None
+    ):
         """
         Initialize the methodology classifier
         
         Args:
             use_transformer: Whether to use transformer model (True) or rule-based approach (False)
+            model_name: Hugging Face NLI model used for zero-shot classification
+            shared_pipeline: NLP pipeline whose zero-shot classifier is reused instead
+                of loading one for model_name
         """
         self.use_transformer = use_transformer
+        self.model_name = model_name
+        self.shared_pipeline = shared_pipeline
         self.classifier = None
         self.tokenizer = None
         
@@ -156,6 +269,47 @@ class MethodologyClassifier:
             }
         }
         
+        # Build keyword tables for single-pass rule-based matching
+        self._keyword_arrays = self._build_keyword_arrays() if NUMBA_AVAILABLE else None
+        self._keyword_automaton = self._build_keyword_automaton()
+        
+        # Precompile per-keyword patterns when the automaton is unavailable
+        self._keyword_patterns = {}
+        if self._keyword_automaton is None:
+            self._keyword_patterns = {
+                category: [re.compile(r'\b' + re.escape(keyword) + r'\b') for keyword in info['keywords']]
+                for category, info in self.methodology_categories.items()
+            }
+        
+        # Fixed category order for score arrays
+        self._category_names = tuple(self.methodology_categories)
+        self._category_index = {category: i for i, category in enumerate(self._category_names)}
+        
+        # Normalize by number of keywords to avoid bias towards categories with more keywords
+        self._keyword_norms = np.array(
+            [len(info['keywords']) * 0.5 for info in self.methodology_categories.values()],
+            dtype=np.float64
+        )
+        
+        # Patterns for locating a methodology section in full text
+        self._methodology_section_patterns = [
+            re.compile(pattern, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+            for pattern in [
+                r'(?:^|\n)(?:3|III|3\.0)[\s\.]+(?:methodology|methods|approach).*?(?=(?:^|\n)(?:4|IV|4\.0))',
+                r'(?:^|\n)(?:methodology|methods|approach)[\s\n]+(?:[^\n]+\n)+',
+                r'(?:^|\n)(?:methodology|methods|approach)\s*\n+([^\n]+(?:\n+[^\n]+)*)'
+            ]
+        ]
+        
+        # Every section pattern contains one of these headers, so one automaton pass
+        # over the text finds all places where a pattern can match
+        self._section_header_automaton = None
+        if ahocorasick is not None:
+            self._section_header_automaton = ahocorasick.Automaton()
+            for header in ('methodology', 'methods', 'approach'):
+                self._section_header_automaton.add_word(header, len(header))
+            self._section_header_automaton.make_automaton()
+        
         # Initialize models if using transformer approach
         if self.use_transformer:
             self._initialize_models()
@@ -163,20 +317,99 @@ class MethodologyClassifier:
     def _initialize_models(self):
         """Initialize transformer models for methodology classification"""
         try:
-            # Initialize zero-shot classifier
-            self.classifier = pipeline(
-                "zero-shot-classification",
-                model="facebook/bart-large-mnli",
-                device=-1  # Use CPU
-            )
+            # Reuse the shared pipeline's classifier if one was given
+            if self.shared_pipeline is not None:
+                self.classifier = self.shared_pipeline.zero_shot_classifier
+                if self.classifier is None:
+                    raise ModelError("Methodology Classifier", "Shared zero-shot classifier not available")
+                self.model_name = self.shared_pipeline.zero_shot_model_name
+            else:
+                # Initialize zero-shot classifier (FP16 on supported GPUs, INT8 ONNX Runtime on CPU)
+                self.classifier = get_pipeline("zero-shot-classification", self.model_name, compile_model=True)
             
-            logger.info("Initialized zero-shot classifier for methodology classification")
+            logger.info(f"Initialized zero-shot classifier for methodology classification: {self.model_name}")
             
         except Exception as e:
             logger.error(f"Error initializing methodology classifier models: {str(e)}")
             logger.warning("Falling back to rule-based classification")
             self.use_transformer = False
     
+    def _keyword_categories(self) -> Dict[str, List[str]]:
+        """
+        Group categories by lowercased keyword, since some keywords appear in several categories
+        
+        Returns:
+            Dictionary mapping each keyword to the categories it belongs to
+        """
+        keyword_categories = {}
+        for category, info in self.methodology_categories.items():
+            for keyword in info['keywords']:
+                keyword_categories.setdefault(keyword.lower(), []).append(category)
+        
+        return keyword_categories
+    
+    def _build_keyword_arrays(self) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        Flatten the methodology keywords into arrays for the compiled keyword counter
+        
+        Returns:
+            Tuple of arguments for _count_keywords after the text, or None if a
+            keyword is not ASCII
+        """
+        keyword_categories = self._keyword_categories()
+        keywords = list(keyword_categories)
+        if not all(keyword.isascii() for keyword in keywords):
+            return None
+        
+        category_index = {category: i for i, category in enumerate(self.methodology_categories)}
+        
+        # Concatenated keyword bytes with offsets
+        keyword_bytes = np.frombuffer(''.join(keywords).encode('ascii'), dtype=np.uint8)
+        keyword_offsets = np.zeros(len(keywords) + 1, dtype=np.int64)
+        keyword_offsets[1:] = np.cumsum([len(keyword) for keyword in keywords])
+        
+        # Categories of each keyword in CSR layout
+        category_offsets = np.zeros(len(keywords) + 1, dtype=np.int64)
+        category_offsets[1:] = np.cumsum([len(keyword_categories[keyword]) for keyword in keywords])
+        category_ids = np.array(
+            [category_index[category] for keyword in keywords for category in keyword_categories[keyword]],
+            dtype=np.int64
+        )
+        
+        # Bucket keywords by first byte so each position only checks plausible keywords
+        first_bytes = np.array([ord(keyword[0]) for keyword in keywords], dtype=np.int64)
+        keyword_order = np.argsort(first_bytes, kind='stable').astype(np.int64)
+        bucket_offsets = np.searchsorted(first_bytes[keyword_order], np.arange(257)).astype(np.int64)
+        
+        return (
+            _ASCII_WORD_CHARS,
+            bucket_offsets,
+            keyword_order,
+            keyword_bytes,
+            keyword_offsets,
+            category_offsets,
+            category_ids,
+            len(category_index)
+        )
+    
+    def _build_keyword_automaton(self):
+        """
+        Build an Aho-Corasick automaton over all methodology keywords
+        
+        Returns:
+            Automaton mapping each keyword to (keyword length, categories), or None
+            if pyahocorasick is not installed
+        """
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, categories in self._keyword_categories().items():
+            automaton.add_word(keyword, (len(keyword), tuple(categories)))
+        automaton.make_automaton()
+        
+        return automaton
+    
     def classify_methodology(self, text: str) -> Dict[str, float]:
         """
         Classify the research methodology used in the text
@@ -187,12 +420,169 @@ class MethodologyClassifier:
         Returns:
             Dictionary mapping methodology categories to confidence scores
         """
+        return self._scores_to_dict(self._score_text(text))
+    
+    def classify_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Classify the research methodology of several texts at once
+        
+        Args:
+            texts: Texts to classify
+            
+        Returns:
+            List of dictionaries mapping methodology categories to confidence scores,
+            in the same order as the input texts
+        """
+        return [self._scores_to_dict(scores) for scores in self._score_texts(texts)]
+    
+    def _scores_to_dict(self, scores: np.ndarray) -> Dict[str, float]:
+        """
+        Convert a score array to a dictionary keyed by methodology category
+        
+        Args:
+            scores: Scores in category order
+            
+        Returns:
+            Dictionary mapping methodology categories to confidence scores
+        """
+        return dict(zip(self._category_names, scores.tolist()))
+    
+    def _score_text(self, text: str) -> np.ndarray:
+        """
+        Score a text against every methodology category
+        
+        Args:
+            text: Text to classify
+            
+        Returns:
+            Array of confidence scores in category order
+        """
         if self.use_transformer and self.classifier:
+            # Decisive keyword hits on short texts need no transformer pass
+            if self.enable_fast_path:
+                scores = self._classify_with_rules(text)
+                if self._is_decisive(text, scores):
+                    return scores
+            
             return self._classify_with_transformer(text)
         else:
             return self._classify_with_rules(text)
     
-    def _classify_with_transformer(self, text: str) -> Dict[str, float]:
+    def _score_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Score several texts against every methodology category
+        
+        Args:
+            texts: Texts to classify
+            
+        Returns:
+            Array of confidence scores with one row per text, in category order
+        """
+        if not texts:
+            return np.zeros((0, len(self._category_names)), dtype=np.float64)
+        
+        if self.use_transformer and self.classifier:
+            return self._classify_batch_with_fast_path(texts)
+        else:
+            return self._classify_many_with_rules(texts)
+    
+    def classify_many(self, texts: List[str], n_workers: Optional[int] = None) -> List[Dict[str, float]]:
+        """
+        Classify the research methodology of a large corpus
+        
+        Transformer classification runs in length-sorted batches; rule-based
+        classification is split into shards scored on worker threads.
+        
+        Args:
+            texts: Texts to classify
+            n_workers: Number of worker threads for rule-based classification
+                       (defaults to the number of CPUs)
+            
+        Returns:
+            List of dictionaries mapping methodology categories to confidence scores,
+            in the same order as the input texts
+        """
+        if not texts:
+            return []
+        
+        if self.use_transformer and self.classifier:
+            scores = self._classify_batch_with_fast_path(texts, n_workers)
+        else:
+            scores = self._classify_many_with_rules(texts, n_workers)
+        
+        return [self._scores_to_dict(row) for row in scores]
+    
+    def _is_decisive(self, text: str, scores: np.ndarray) -> bool:
+        """
+        Check whether rule-based scores are strong enough to skip the transformer
+        
+        Args:
+            text: Classified text
+            scores: Rule-based scores for the text in category order
+            
+        Returns:
+            True if the text is short and a single category clearly dominates
+        """
+        if scores.max() < self.fast_path_min_score:
+            return False
+        
+        if np.partition(scores, -2)[-2] >= self.fast_path_max_runner_up:
+            return False
+        
+        return len(text.split()) < self.fast_path_max_words
+    
+    def _classify_batch_with_fast_path(self, texts: List[str], n_workers: Optional[int] = None) -> np.ndarray:
+        """
+        Classify several texts, sending only ambiguous ones to the transformer
+        
+        Args:
+            texts: Texts to classify
+            n_workers: Number of worker threads for rule-based classification
+            
+        Returns:
+            Array of confidence scores with one row per text, in category order
+        """
+        if not self.enable_fast_path:
+            return self._classify_batch_with_transformer(texts)
+        
+        scores = self._classify_many_with_rules(texts, n_workers)
+        ambiguous = [i for i, text in enumerate(texts) if not self._is_decisive(text, scores[i])]
+        
+        if ambiguous:
+            scores[ambiguous] = self._classify_batch_with_transformer([texts[i] for i in ambiguous])
+        
+        return scores
+    
+    def _classify_many_with_rules(self, texts: List[str], n_workers: Optional[int] = None) -> np.ndarray:
+        """
+        Classify methodology of several texts with the rule-based approach
+        
+        Args:
+            texts: Texts to classify
+            n_workers: Number of worker threads (defaults to the number of CPUs)
+            
+        Returns:
+            Array of confidence scores with one row per text, in category order
+        """
+        n_workers = min(n_workers or os.cpu_count() or 1, len(texts))
+        
+        # Threads only help when the GIL-free compiled counter is available
+        if n_workers < 2 or self._keyword_arrays is None or len(texts) < self.parallel_min_texts:
+            return np.stack([self._classify_with_rules(text) for text in texts])
+        
+        # Contiguous shards so results concatenate in input order
+        bounds = np.linspace(0, len(texts), n_workers + 1).astype(int)
+        shards = [texts[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+        
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            shard_scores = list(executor.map(
+                lambda shard: np.stack([self._classify_with_rules(text) for text in shard]),
+                shards
+            ))
+        
+        return np.concatenate(shard_scores)
+    
+    def _classify_with_transformer(self, text: str) -> np.ndarray:
         """
         Classify methodology using transformer model
         
@@ -200,11 +590,11 @@ class MethodologyClassifier:
             text: Text to classify
             
         Returns:
-            Dictionary mapping methodology categories to confidence scores
+            Array of confidence scores in category order
         """
         try:
             # Prepare candidate labels
-            labels = list(self.methodology_categories.keys())
+            labels = list(self._category_names)
             
             # Truncate text if too long
             max_length = 1024
@@ -219,17 +609,78 @@ class MethodologyClassifier:
                 multi_label=True  # Allow multiple methodologies
             )
             
-            # Convert to dictionary
-            scores = {label: score for label, score in zip(result['labels'], result['scores'])}
-            
-            return scores
+            return self._result_to_scores(result)
             
         except Exception as e:
             logger.error(f"Error classifying methodology with transformer: {str(e)}")
             logger.warning("Falling back to rule-based classification")
             return self._classify_with_rules(text)
     
-    def _classify_with_rules(self, text: str) -> Dict[str, float]:
+    def _classify_batch_with_transformer(self, texts: List[str]) -> np.ndarray:
+        """
+        Classify methodology of several texts using the transformer model in one call
+        
+        Args:
+            texts: Texts to classify
+            
+        Returns:
+            Array of confidence scores with one row per text, in category order
+        """
+        try:
+            # Prepare candidate labels
+            labels = list(self._category_names)
+            
+            # Truncate texts if too long
+            max_length = 1024
+            truncated = []
+            for text in texts:
+                words = text.split()
+                if len(words) > max_length:
+                    text = ' '.join(words[:max_length])
+                truncated.append(text)
+            
+            # Sort by length so each batch pads to a similar size
+            order = sorted(range(len(truncated)), key=lambda i: len(truncated[i].split()))
+            
+            # Classify all texts in one pipeline call
+            results = self.classifier(
+                [truncated[i] for i in order],
+                labels,
+                multi_label=True,  # Allow multiple methodologies
+                batch_size=self.batch_size
+            )
+            if isinstance(results, dict):
+                results = [results]
+            
+            # Restore input order
+            scores = np.zeros((len(texts), len(labels)), dtype=np.float64)
+            for i, result in zip(order, results):
+                scores[i] = self._result_to_scores(result)
+            
+            return scores
+            
+        except Exception as e:
+            logger.error(f"Error classifying methodology batch with transformer: {str(e)}")
+            logger.warning("Falling back to rule-based classification")
+            return np.stack([self._classify_with_rules(text) for text in texts])
+    
+    def _result_to_scores(self, result: Dict) -> np.ndarray:
+        """
+        Arrange a zero-shot pipeline result in category order
+        
+        Args:
+            result: Pipeline output with parallel labels and scores lists
+            
+        Returns:
+            Array of confidence scores in category order
+        """
+        scores = np.zeros(len(self._category_names), dtype=np.float64)
+        for label, score in zip(result['labels'], result['scores']):
+            scores[self._category_index[label]] = score
+        
+        return scores
+    
+    def _classify_with_rules(self, text: str) -> np.ndarray:
         """
         Classify methodology using rule-based approach
         
@@ -237,32 +688,62 @@ class MethodologyClassifier:
             text: Text to classify
             
         Returns:
-            Dictionary mapping methodology categories to confidence scores
+            Array of confidence scores in category order
         """
         # Convert text to lowercase for case-insensitive matching
         text_lower = text.lower()
         
-        # Initialize scores
-        scores = {category: 0.0 for category in self.methodology_categories}
-        
         # Count keyword occurrences for each category
-        for category, info in self.methodology_categories.items():
-            keywords = info['keywords']
+        if self._keyword_arrays is not None and text_lower.isascii():
+            counts = _count_keywords(
+                np.frombuffer(text_lower.encode('ascii'), dtype=np.uint8),
+                *self._keyword_arrays
+            )
+        elif self._keyword_automaton is not None:
+            category_counts = self._count_keywords_with_automaton(text_lower)
+            counts = np.array([category_counts.get(category, 0) for category in self._category_names])
+        else:
+            counts = np.array([
+                sum(len(pattern.findall(text_lower)) for pattern in self._keyword_patterns[category])
+                for category in self._category_names
+            ])
+        
+        # Calculate score based on keyword occurrences
+        return np.minimum(1.0, counts / self._keyword_norms)
+    
+    def _count_keywords_with_automaton(self, text_lower: str) -> Dict[str, int]:
+        """
+        Count whole-word keyword occurrences per category in a single pass
+        
+        Args:
+            text_lower: Lowercased text to scan
             
-            # Count occurrences of each keyword
-            count = 0
-            for keyword in keywords:
-                # Use word boundary to match whole words
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                matches = re.findall(pattern, text_lower)
-                count += len(matches)
+        Returns:
+            Dictionary mapping methodology categories to keyword occurrence counts
+        """
+        counts = {}
+        last_end = {}
+        text_length = len(text_lower)
+        
+        for end, (length, categories) in self._keyword_automaton.iter(text_lower):
+            start = end - length + 1
+            
+            # Require word boundaries on both sides, as \b does
+            if start > 0 and _is_word_char(text_lower[start - 1]):
+                continue
+            if end + 1 < text_length and _is_word_char(text_lower[end + 1]):
+                continue
             
-            # Calculate score based on keyword occurrences
-            # Normalize by number of keywords to avoid bias towards categories with more keywords
-            if count > 0:
-                scores[category] = min(1.0, count / (len(keywords) * 0.5))
+            # Count non-overlapping occurrences only, as re.findall does
+            keyword = text_lower[start:end + 1]
+            if start <= last_end.get(keyword, -1):
+                continue
+            last_end[keyword] = end
+            
+            for category in categories:
+                counts[category] = counts.get(category, 0) + 1
         
-        return scores
+        return counts
     
     def get_primary_methodology(self, text: str) -> Tuple[str, float]:
         """
@@ -275,14 +756,14 @@ class MethodologyClassifier:
             Tuple of (methodology_category, confidence_score)
         """
         # Classify methodology
-        scores = self.classify_methodology(text)
+        scores = self._score_text(text)
         
         # Get category with highest score
-        if not scores:
+        if not scores.size:
             return ('unknown', 0.0)
         
-        primary_category = max(scores.items(), key=lambda x: x[1])
-        return primary_category
+        primary_index = int(scores.argmax())
+        return (self._category_names[primary_index], float(scores[primary_index]))
     
     def get_methodology_details(self, category: str) -> Dict:
         """
@@ -324,20 +805,95 @@ class MethodologyClassifier:
             text = sections['full_text']
             
             # Try to find methodology section using regex
-            methodology_patterns = [
-                r'(?:^|\n)(?:3|III|3\.0)[\s\.]+(?:methodology|methods|approach).*?(?=(?:^|\n)(?:4|IV|4\.0))',
-                r'(?:^|\n)(?:methodology|methods|approach)[\s\n]+(?:[^\n]+\n)+',
-                r'(?:^|\n)(?:methodology|methods|approach)\s*\n+([^\n]+(?:\n+[^\n]+)*)'
-            ]
-            
-            for pattern in methodology_patterns:
-                match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE | re.DOTALL)
-                if match:
-                    return match.group(0)
+            match = self._search_methodology_section(text)
+            if match:
+                return match.group(0)
         
         # If still not found, return empty string
         return ""
     
+    def _search_methodology_section(self, text: str) -> Optional[re.Match]:
+        """
+        Find the first methodology section pattern that matches the text
+        
+        The header automaton locates candidate headers in one pass, and the
+        patterns are only tried at the line starts those headers imply. The
+        result is the same as searching the whole text with each pattern in turn.
+        
+        Args:
+            text: Full paper text
+            
+        Returns:
+            Leftmost match of the first pattern that matches, or None
+        """
+        text_lower = text.lower()
+        
+        # Positions only carry over if lowercasing kept the text length
+        if self._section_header_automaton is None or len(text_lower) != len(text):
+            for pattern in self._methodology_section_patterns:
+                match = pattern.search(text)
+                if match:
+                    return match
+            return None
+        
+        header_positions = sorted(
+            end - length + 1 for end, length in self._section_header_automaton.iter(text_lower)
+        )
+        if not header_positions:
+            return None
+        
+        numbered_pattern, *header_patterns = self._methodology_section_patterns
+        
+        # Numbered headings start at the numeral, which may precede the header by
+        # several separator characters
+        for start in self._numbered_heading_starts(text_lower, header_positions):
+            match = numbered_pattern.match(text, start)
+            if match:
+                return match
+        
+        # Unnumbered headings start at the header itself, at the beginning of a line
+        for pattern in header_patterns:
+            for position in header_positions:
+                if position == 0 or text[position - 1] == '\n':
+                    match = pattern.match(text, max(position - 1, 0))
+                    if match:
+                        return match
+        
+        return None
+    
+    @staticmethod
+    def _numbered_heading_starts(text_lower: str, header_positions: List[int]) -> List[int]:
+        """
+        Find where a numbered "3." style heading would start for each header
+        
+        Args:
+            text_lower: Lowercased full text
+            header_positions: Start offsets of section headers
+            
+        Returns:
+            Sorted offsets of the line break (or text start) before each numeral
+            that is followed by separators and a header
+        """
+        starts = set()
+        for position in header_positions:
+            # Skip back over the whitespace and dots separating numeral and header
+            numeral_end = position
+            while numeral_end > 0 and (text_lower[numeral_end - 1].isspace() or text_lower[numeral_end - 1] == '.'):
+                numeral_end -= 1
+            if numeral_end == position:
+                continue
+            
+            for numeral in ('3', 'iii', '3.0'):
+                numeral_start = numeral_end - len(numeral)
+                if numeral_start < 0 or text_lower[numeral_start:numeral_end] != numeral:
+                    continue
+                if numeral_start == 0:
+                    starts.add(0)
+                elif text_lower[numeral_start - 1] == '\n':
+                    starts.add(numeral_start - 1)
+        
+        return sorted(starts)
+    
     def compare_methodologies(self, texts: List[str]) -> Dict:
         """
         Compare methodologies across multiple texts
@@ -348,24 +904,33 @@ class MethodologyClassifier:
         Returns:
             Dictionary with comparison results
         """
-        # Classify each text
-        classifications = [self.classify_methodology(text) for text in texts]
+        # Classify all texts in a single batched call into a (texts x categories) matrix
+        scores = self._score_texts(texts)
+        categories = self._category_names
         
         # Get primary methodology for each text
-        primaries = [max(cls.items(), key=lambda x: x[1]) for cls in classifications]
+        primary_indices = scores.argmax(axis=1) if len(texts) else np.zeros(0, dtype=np.int64)
+        primary_scores = scores[np.arange(len(texts)), primary_indices]
+        primaries = [
+            (categories[index], score)
+            for index, score in zip(primary_indices.tolist(), primary_scores.tolist())
+        ]
         
-        # Count occurrences of each methodology
-        methodology_counts = {}
-        for category, score in primaries:
-            if category not in methodology_counts:
-                methodology_counts[category] = 0
-            methodology_counts[category] += 1
+        # Count occurrences of each methodology, in order of first appearance
+        unique_indices, first_positions, counts = np.unique(
+            primary_indices, return_index=True, return_counts=True
+        )
+        methodology_counts = {
+            categories[unique_indices[i]]: int(counts[i])
+            for i in np.argsort(first_positions)
+        }
         
         # Calculate average scores for each methodology
-        methodology_avg_scores = {}
-        for category in self.methodology_categories:
-            scores = [cls.get(category, 0.0) for cls in classifications]
-            methodology_avg_scores[category] = sum(scores) / len(scores) if scores else 0.0
+        if len(texts):
+            average_scores = (scores.sum(axis=0) / len(texts)).tolist()
+        else:
+            average_scores = [0.0] * len(categories)
+        methodology_avg_scores = dict(zip(categories, average_scores))
         
         # Prepare comparison results
         comparison = {
@@ -373,7 +938,7 @@ class MethodologyClassifier:
             'methodology_counts': methodology_counts,
             'methodology_avg_scores': methodology_avg_scores,
             'most_common_methodology': max(methodology_counts.items(), key=lambda x: x[1]) if methodology_counts else None,
-            'methodology_diversity': len([c for c, s in primaries if s > 0.3])
+            'methodology_diversity': int((primary_scores > 0.3).sum())
         }
         
         return comparison
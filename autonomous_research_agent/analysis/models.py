@@ -0,0 +1,311 @@
+"""
+Models Module
+
+This module loads the transformer pipelines and Sentence Transformer models shared by
+the analysis components, once per process and on the best available backend.
+"""
+
+import logging
+import os
+import shutil
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import torch
+from sentence_transformers import SentenceTransformer
+from transformers import pipeline
+
+from autonomous_research_agent.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Guards the first load of each shared model
+_model_lock = threading.Lock()
+
+def _load_quantized_pipeline(task: str, model_name: str):
+    """
+    Load an ONNX Runtime pipeline with dynamically quantized INT8 weights
+    
+    The model is exported and quantized on first use, and the result is
+    kept under the cache directory for later runs.
+    
+    Args:
+        task: Pipeline task: summarization, question-answering, sentiment-analysis or
+            zero-shot-classification
+        model_name: Hugging Face model name
+        
+    Returns:
+        Transformer pipeline, or None if optimum is unavailable or the task is not supported
+    """
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        from optimum.onnxruntime import (
+            ORTModelForQuestionAnswering,
+            ORTModelForSeq2SeqLM,
+            ORTModelForSequenceClassification
+        )
+        from transformers import AutoTokenizer
+    except ImportError:
+        logger.debug("Optimum not available, using full precision transformer models")
+        return None
+    
+    model_classes = {
+        "summarization": ORTModelForSeq2SeqLM,
+        "question-answering": ORTModelForQuestionAnswering,
+        "sentiment-analysis": ORTModelForSequenceClassification,
+        "zero-shot-classification": ORTModelForSequenceClassification
+    }
+    model_class = model_classes.get(task)
+    if model_class is None:
+        logger.debug(f"No ONNX Runtime model class for {task}, using full precision")
+        return None
+    
+    onnx_dir = Path(settings.cache_dir) / "onnx"
+    quantized_dir = onnx_dir / f"{model_name.replace('/', '--')}-opt-int8"
+    
+    if not quantized_dir.exists():
+        logger.info(f"Optimizing and quantizing {model_name} to INT8, this only happens once")
+        
+        # Export to ONNX, then quantize every graph (seq2seq models have several)
+        export_dir = onnx_dir / model_name.replace('/', '--')
+        exported_model = model_class.from_pretrained(model_name, export=True)
+        exported_model.save_pretrained(export_dir)
+        
+        # Fuse attention, LayerNorm and GELU subgraphs before quantizing
+        graphs_dir = export_dir
+        optimized_dir = onnx_dir / f"{export_dir.name}-optimized"
+        try:
+            from optimum.onnxruntime import ORTOptimizer
+            from optimum.onnxruntime.configuration import OptimizationConfig
+            
+            ORTOptimizer.from_pretrained(exported_model).optimize(
+                optimization_config=OptimizationConfig(optimization_level=2),
+                save_dir=optimized_dir
+            )
+            graphs_dir = optimized_dir
+        except Exception as e:
+            logger.warning(f"Graph optimization of {model_name} failed, quantizing the plain export: {str(e)}")
+        
+        # Quantize into a temporary directory so an interrupted run is not reused
+        staging_dir = onnx_dir / f"{quantized_dir.name}.tmp"
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        staging_dir.mkdir(parents=True)
+        
+        for path in graphs_dir.iterdir():
+            # Keep the exported file names, which the ORT model classes look for
+            target = staging_dir / path.name.replace("_optimized", "")
+            if path.suffix == ".onnx":
+                quantize_dynamic(str(path), str(target), weight_type=QuantType.QInt8)
+            elif path.is_file():
+                shutil.copy(path, target)
+        
+        os.replace(staging_dir, quantized_dir)
+        shutil.rmtree(export_dir, ignore_errors=True)
+        shutil.rmtree(optimized_dir, ignore_errors=True)
+    
+    model = model_class.from_pretrained(quantized_dir, provider="CPUExecutionProvider")
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    
+    logger.info(f"Loaded INT8 ONNX model: {model_name}")
+    return pipeline(task, model=model, tokenizer=tokenizer)
+
+def _compile_pipeline_model(model_pipeline) -> None:
+    """
+    Compile a pipeline's PyTorch model with TorchInductor and warm it up
+    
+    The model is left running eagerly if torch.compile is unavailable or
+    compilation fails.
+    
+    Args:
+        model_pipeline: Transformer pipeline wrapping a PyTorch model
+    """
+    if not hasattr(torch, 'compile'):
+        return
+    
+    try:
+        # Reuse compiled kernels across processes where supported
+        import torch._inductor.config as inductor_config
+        if hasattr(inductor_config, 'fx_graph_cache'):
+            inductor_config.fx_graph_cache = True
+        
+        compiled_model = torch.compile(model_pipeline.model, dynamic=True)
+        
+        # Warm up with two input lengths so the first real call does not pay for compilation
+        for text in ("warm up", "warm up the compiled model with a somewhat longer input"):
+            inputs = model_pipeline.tokenizer([text, text], return_tensors='pt').to(model_pipeline.device)
+            with torch.no_grad():
+                compiled_model(**inputs)
+        
+        model_pipeline.model = compiled_model
+        logger.info(f"Compiled {type(compiled_model._orig_mod).__name__} with torch.compile")
+        
+    except Exception as e:
+        logger.warning(f"torch.compile failed, running the model eagerly: {str(e)}")
+
+@lru_cache(maxsize=None)
+def _load_pipeline(task: str, model_name: str, quantize: bool, compile_model: bool):
+    """Load a transformer pipeline on the best available backend (memoized per process)"""
+    # Half precision on Volta or newer GPUs, whose tensor cores run FP16 matmuls
+    if torch.cuda.is_available() and torch.cuda.get_device_capability() >= (7, 0):
+        torch.set_float32_matmul_precision('high')
+        logger.info(f"Loading {model_name} in half precision on GPU")
+        model_pipeline = pipeline(
+            task,
+            model=model_name,
+            device=0,
+            torch_dtype=torch.float16
+        )
+    else:
+        # INT8 ONNX Runtime models on CPU
+        if quantize:
+            try:
+                quantized_pipeline = _load_quantized_pipeline(task, model_name)
+                if quantized_pipeline is not None:
+                    return quantized_pipeline
+            except Exception as e:
+                logger.warning(f"Error loading quantized {model_name}, using full precision: {str(e)}")
+        
+        model_pipeline = pipeline(
+            task,
+            model=model_name,
+            device=-1  # Use CPU
+        )
+    
+    if compile_model:
+        _compile_pipeline_model(model_pipeline)
+    
+    return model_pipeline
+
+def get_pipeline(task: str, model_name: str, quantize: bool = True, compile_model: bool = False):
+    """
+    Get the process-wide transformer pipeline for a task and model, loading it on first use
+    
+    Args:
+        task: Pipeline task
+        model_name: Hugging Face model name
+        quantize: Whether to prefer an INT8 quantized ONNX model when running on CPU
+        compile_model: Whether to compile PyTorch models with torch.compile; only
+            suitable for single forward pass tasks, not generation
+        
+    Returns:
+        Shared transformer pipeline
+    """
+    with _model_lock:
+        return _load_pipeline(task, model_name, quantize, compile_model)
+
+class _ORTFeatureExtractor(torch.nn.Module):
+    """Adapts an ONNX Runtime feature extraction model to the Hugging Face model interface"""
+    
+    def __init__(self, ort_model):
+        super().__init__()
+        self.ort_model = ort_model
+        self.config = ort_model.config
+        
+        # SentenceTransformer.device is the device of the first parameter; the
+        # ONNX model has none, so an empty one keeps the model on CPU
+        self.device_anchor = torch.nn.Parameter(torch.empty(0), requires_grad=False)
+    
+    def forward(self, input_ids, attention_mask, token_type_ids=None, return_dict=False):
+        """Return the token embeddings as the first element of a tuple"""
+        outputs = self.ort_model(
+            input_ids=input_ids,
+            attention_mask=attention_mask,
+            token_type_ids=token_type_ids
+        )
+        return (outputs.last_hidden_state,)
+
+def _load_quantized_feature_extractor(model_name: str) -> Optional[_ORTFeatureExtractor]:
+    """
+    Load a Sentence Transformer's encoder as dynamically quantized INT8 ONNX
+    
+    The encoder is exported and quantized on first use, and the result is
+    kept under the cache directory for later runs.
+    
+    Args:
+        model_name: Name of the Sentence Transformer model
+        
+    Returns:
+        Quantized encoder, or None if optimum is unavailable
+    """
+    try:
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    except ImportError:
+        logger.debug("Optimum not available, using full precision Sentence Transformer")
+        return None
+    
+    # Bare names refer to the sentence-transformers organization on the hub
+    hub_name = model_name if '/' in model_name else f"sentence-transformers/{model_name}"
+    
+    onnx_dir = Path(settings.cache_dir) / "onnx"
+    quantized_dir = onnx_dir / f"{hub_name.replace('/', '--')}-int8"
+    
+    if not quantized_dir.exists():
+        logger.info(f"Quantizing {model_name} to INT8, this only happens once")
+        
+        exported_model = ORTModelForFeatureExtraction.from_pretrained(hub_name, export=True)
+        
+        # Quantize into a temporary directory so an interrupted run is not reused
+        staging_dir = onnx_dir / f"{quantized_dir.name}.tmp"
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        
+        # Dynamic activations, per-channel weights, VNNI integer dot products
+        ORTQuantizer.from_pretrained(exported_model).quantize(
+            save_dir=staging_dir,
+            quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=True)
+        )
+        
+        os.replace(staging_dir, quantized_dir)
+    
+    ort_model = ORTModelForFeatureExtraction.from_pretrained(
+        quantized_dir,
+        file_name="model_quantized.onnx",
+        provider="CPUExecutionProvider"
+    )
+    
+    return _ORTFeatureExtractor(ort_model)
+
+@lru_cache(maxsize=None)
+def _load_sentence_transformer(model_name: str, quantize: bool) -> SentenceTransformer:
+    """Load a Sentence Transformer model (memoized per process)"""
+    if torch.cuda.is_available():
+        device = 'cuda'
+    elif torch.backends.mps.is_available():
+        device = 'mps'
+    else:
+        device = 'cpu'
+    model = SentenceTransformer(model_name, device=device)
+    
+    # Half precision roughly doubles GPU throughput for inference
+    if device == 'cuda':
+        model.half()
+    
+    # On CPU, run the encoder as INT8 ONNX; tokenization, pooling and
+    # normalization stay with the model's own modules
+    elif device == 'cpu' and quantize:
+        try:
+            quantized_encoder = _load_quantized_feature_extractor(model_name)
+            if quantized_encoder is not None:
+                model[0].auto_model = quantized_encoder
+                logger.info(f"Loaded INT8 ONNX encoder for Sentence Transformer: {model_name}")
+        except Exception as e:
+            logger.warning(f"Error loading quantized {model_name}, using full precision: {str(e)}")
+    
+    logger.info(f"Loaded Sentence Transformer model: {model_name} on {device}")
+    return model
+
+def get_sentence_transformer(model_name: str = 'all-MiniLM-L6-v2', quantize: bool = True) -> SentenceTransformer:
+    """
+    Get the process-wide Sentence Transformer model, loading it on first use
+    
+    Args:
+        model_name: Name of the Sentence Transformer model
+        quantize: Whether to run the encoder as an INT8 quantized ONNX model when on CPU
+        
+    Returns:
+        Shared SentenceTransformer instance
+    """
+    with _model_lock:
+        return _load_sentence_transformer(model_name, quantize)
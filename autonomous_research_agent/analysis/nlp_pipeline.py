@@ -5,53 +5,114 @@ This module provides natural language processing capabilities for analyzing
 research papers, including text preprocessing, entity recognition, and semantic analysis.
 """
 
+import hashlib
 import logging
-from typing import Dict, List, Optional, Set, Tuple, Union
+import re
+import threading
+from collections import Counter, OrderedDict
+from functools import cached_property, lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 import nltk
+import numpy as np
 import spacy
 from nltk.corpus import stopwords
-from nltk.tokenize import sent_tokenize, word_tokenize
-from transformers import AutoModel, AutoTokenizer, pipeline
+from nltk.tokenize import sent_tokenize
+from transformers import AutoModel, AutoTokenizer
 
+from autonomous_research_agent.analysis.models import get_pipeline, get_sentence_transformer
 from autonomous_research_agent.config.settings import settings
 from autonomous_research_agent.core.exceptions import ModelError
 
 logger = logging.getLogger(__name__)
 
+# spaCy components needed for named entity recognition; all others are
+# disabled when extracting entities in batch
+ENTITY_COMPONENTS = ('tok2vec', 'transformer', 'ner')
+
+# Alphabetic words of four or more letters, excluding parts of hyphenated,
+# underscored or alphanumeric tokens
+KEYWORD_PATTERN = re.compile(r'(?<![-\w])[^\W\d_]{4,}(?![-\w])')
+
+@lru_cache(maxsize=None)
+def _english_stopwords() -> FrozenSet[str]:
+    """English stopwords (loaded once per process)"""
+    return frozenset(stopwords.words('english'))
+
+# Guards the first load of each shared spaCy model
+_spacy_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _load_spacy_model(model_name: str):
+    """Load a spaCy model without the unused lemmatizer (memoized per process)"""
+    nlp = spacy.load(model_name)
+    
+    # Lemmas are never used, so skip the lemmatizer on every parse
+    if 'lemmatizer' in nlp.pipe_names:
+        nlp.disable_pipe('lemmatizer')
+    
+    logger.info(f"Loaded spaCy model: {model_name}")
+    return nlp
+
+def get_spacy_model(model_name: str):
+    """
+    Get the process-wide spaCy model, loading it on first use
+    
+    Args:
+        model_name: Name of the installed spaCy model package
+        
+    Returns:
+        Shared spaCy language pipeline
+    """
+    with _spacy_lock:
+        return _load_spacy_model(model_name)
+
 class NLPPipeline:
     """
     Natural Language Processing Pipeline for research paper analysis
+    
+    Models are loaded on first use and shared across instances.
     """
     
-    def __init__(self):
-        """Initialize the NLP pipeline"""
-        self.spacy_model = None
-        self.sentence_transformer = None
-        self.summarizer = None
-        self.zero_shot_classifier = None
+    # Default spaCy model; the small model covers NER and noun chunks at a
+    # fraction of the memory of en_core_web_lg
+    default_spacy_model_name = 'en_core_web_sm'
+    
+    # Distilled transformer models, several times faster than the BART-large originals
+    summarizer_model_name = 'sshleifer/distilbart-cnn-12-6'
+    zero_shot_model_name = 'valhalla/distilbart-mnli-12-3'
+    sentence_transformer_model_name = 'all-MiniLM-L6-v2'
+    sentiment_model_name = 'distilbert-base-uncased-finetuned-sst-2-english'
+    
+    # Number of texts per sentence embedding batch
+    embedding_batch_size = 64
+    
+    def __init__(self, doc_cache_size: int = 128, embedding_cache_size: int = 10000):
+        """
+        Initialize the NLP pipeline
         
-        # Initialize models
-        self._initialize_models()
+        Args:
+            doc_cache_size: Maximum number of parsed spaCy documents kept in the LRU cache
+            embedding_cache_size: Maximum number of text embeddings kept in the LRU cache
+        """
+        self.doc_cache_size = doc_cache_size
+        self._doc_cache: 'OrderedDict[str, object]' = OrderedDict()
+        self.embedding_cache_size = embedding_cache_size
+        self._embedding_cache: 'OrderedDict[bytes, np.ndarray]' = OrderedDict()
+        
+        # spaCy model configured in settings, if any
+        model_config = settings.models.get('spacy')
+        self.spacy_model_name = (
+            model_config.parameters.get('model', self.default_spacy_model_name)
+            if model_config else self.default_spacy_model_name
+        )
+        
+        # Initialize NLTK resources
+        self._initialize_nltk_resources()
     
-    def _initialize_models(self):
-        """Initialize NLP models"""
+    def _initialize_nltk_resources(self):
+        """Download the NLTK resources used for tokenization if they are missing"""
         try:
-            # Initialize spaCy model
-            try:
-                self.spacy_model = spacy.load("en_core_web_lg")
-                logger.info("Loaded spaCy model: en_core_web_lg")
-            except OSError:
-                # Try smaller model if large one is not available
-                try:
-                    self.spacy_model = spacy.load("en_core_web_md")
-                    logger.info("Loaded spaCy model: en_core_web_md")
-                except OSError:
-                    # Try smallest model if medium one is not available
-                    self.spacy_model = spacy.load("en_core_web_sm")
-                    logger.info("Loaded spaCy model: en_core_web_sm")
-            
-            # Initialize NLTK resources
             try:
                 nltk.data.find('tokenizers/punkt')
             except LookupError:
@@ -62,41 +123,76 @@ class NLPPipeline:
             except LookupError:
                 nltk.download('stopwords', quiet=True)
             
-            # Initialize transformers models if configured
-            self._initialize_transformer_models()
-            
         except Exception as e:
             logger.error(f"Error initializing NLP models: {str(e)}")
             raise ModelError("NLP Pipeline", f"Initialization error: {str(e)}")
     
-    def _initialize_transformer_models(self):
-        """Initialize transformer models"""
+    @cached_property
+    def spacy_model(self):
+        """spaCy model, loaded on first use (None if no model could be loaded)"""
+        # Fall back to the small model if the configured one is not installed
+        for model_name in dict.fromkeys([self.spacy_model_name, self.default_spacy_model_name]):
+            try:
+                return get_spacy_model(model_name)
+            except OSError as e:
+                logger.warning(f"spaCy model {model_name} not available: {str(e)}")
+        
+        logger.error("Error initializing spaCy model: no model could be loaded")
+        return None
+    
+    @cached_property
+    def entity_disabled_components(self) -> List[str]:
+        """spaCy components not needed for named entity recognition"""
+        if not self.spacy_model:
+            return []
+        
+        return [name for name in self.spacy_model.pipe_names if name not in ENTITY_COMPONENTS]
+    
+    @cached_property
+    def sentence_transformer(self):
+        """Sentence Transformer model for semantic similarity, loaded on first use"""
         try:
-            # Initialize sentence transformer for semantic similarity
-            from sentence_transformers import SentenceTransformer
-            
-            self.sentence_transformer = SentenceTransformer('all-MiniLM-L6-v2')
-            logger.info("Loaded Sentence Transformer model: all-MiniLM-L6-v2")
-            
-            # Initialize summarizer
-            self.summarizer = pipeline(
-                "summarization",
-                model="facebook/bart-large-cnn",
-                device=-1  # Use CPU
-            )
-            logger.info("Loaded summarization model: facebook/bart-large-cnn")
-            
-            # Initialize zero-shot classifier
-            self.zero_shot_classifier = pipeline(
+            return get_sentence_transformer(self.sentence_transformer_model_name)
+        except Exception as e:
+            logger.warning(f"Error initializing Sentence Transformer model: {str(e)}")
+            return None
+    
+    @cached_property
+    def summarizer(self):
+        """Summarization pipeline, loaded on first use (FP16 on supported GPUs, INT8 ONNX Runtime on CPU)"""
+        try:
+            summarizer = get_pipeline("summarization", self.summarizer_model_name)
+            logger.info(f"Loaded summarization model: {self.summarizer_model_name}")
+            return summarizer
+        except Exception as e:
+            logger.warning(f"Error initializing summarization model: {str(e)}")
+            return None
+    
+    @cached_property
+    def zero_shot_classifier(self):
+        """Zero-shot classification pipeline, loaded on first use (FP16 on supported GPUs, INT8 ONNX Runtime on CPU)"""
+        try:
+            classifier = get_pipeline(
                 "zero-shot-classification",
-                model="facebook/bart-large-mnli",
-                device=-1  # Use CPU
+                self.zero_shot_model_name,
+                compile_model=True
             )
-            logger.info("Loaded zero-shot classification model: facebook/bart-large-mnli")
-            
+            logger.info(f"Loaded zero-shot classification model: {self.zero_shot_model_name}")
+            return classifier
+        except Exception as e:
+            logger.warning(f"Error initializing zero-shot classification model: {str(e)}")
+            return None
+    
+    @cached_property
+    def sentiment_analyzer(self):
+        """Sentiment analysis pipeline, loaded on first use (FP16 on supported GPUs, INT8 ONNX Runtime on CPU)"""
+        try:
+            analyzer = get_pipeline("sentiment-analysis", self.sentiment_model_name, compile_model=True)
+            logger.info(f"Loaded sentiment analysis model: {self.sentiment_model_name}")
+            return analyzer
         except Exception as e:
-            logger.warning(f"Error initializing transformer models: {str(e)}")
-            logger.warning("Some advanced NLP features may not be available")
+            logger.warning(f"Error initializing sentiment analysis model: {str(e)}")
+            return None
     
     def preprocess_text(self, text: str) -> str:
         """
@@ -126,10 +222,41 @@ class NLPPipeline:
         if not self.spacy_model:
             raise ModelError("NLP Pipeline", "spaCy model not initialized")
         
-        # Process text with spaCy
-        doc = self.spacy_model(text)
+        return self._collect_entities(self._parse(text))
+    
+    def extract_entities_batch(self, texts: List[str], batch_size: int = 64) -> List[Dict[str, List[str]]]:
+        """
+        Extract named entities from multiple texts in batches
+        
+        Args:
+            texts: Texts to extract entities from
+            batch_size: Number of texts processed per batch
+            
+        Returns:
+            List of dictionaries mapping entity types to lists of entities, one per text
+        """
+        if not self.spacy_model:
+            raise ModelError("NLP Pipeline", "spaCy model not initialized")
+        
+        # Process texts with spaCy, running only the NER components
+        docs = self.spacy_model.pipe(
+            texts,
+            batch_size=batch_size,
+            disable=self.entity_disabled_components
+        )
         
-        # Extract entities
+        return [self._collect_entities(doc) for doc in docs]
+    
+    def _collect_entities(self, doc) -> Dict[str, List[str]]:
+        """
+        Collect named entities from a processed spaCy document
+        
+        Args:
+            doc: spaCy document
+            
+        Returns:
+            Dictionary mapping entity types to lists of entities
+        """
         entities = {}
         for ent in doc.ents:
             entity_type = ent.label_
@@ -155,9 +282,87 @@ class NLPPipeline:
         if not self.spacy_model:
             raise ModelError("NLP Pipeline", "spaCy model not initialized")
         
-        # Process text with spaCy
-        doc = self.spacy_model(text)
+        return self._collect_noun_phrases(self._parse(text))
+    
+    def analyze(self, text: str) -> Dict[str, List]:
+        """
+        Extract named entities and noun phrases from text with a single parse
         
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Dictionary with entities (mapping entity types to lists of entities)
+            and noun_phrases
+        """
+        if not self.spacy_model:
+            raise ModelError("NLP Pipeline", "spaCy model not initialized")
+        
+        doc = self._parse(text)
+        
+        return {
+            'entities': self._collect_entities(doc),
+            'noun_phrases': self._collect_noun_phrases(doc)
+        }
+    
+    def analyze_batch(self, texts: List[str], batch_size: int = 32, n_process: int = 1) -> List[Dict[str, List]]:
+        """
+        Extract named entities and noun phrases from multiple texts in batches
+        
+        Args:
+            texts: Texts to analyze
+            batch_size: Number of texts processed per batch
+            n_process: Number of worker processes used by spaCy
+            
+        Returns:
+            List of analysis dictionaries as returned by analyze, one per text
+        """
+        if not self.spacy_model:
+            raise ModelError("NLP Pipeline", "spaCy model not initialized")
+        
+        docs = self.spacy_model.pipe(texts, batch_size=batch_size, n_process=n_process)
+        
+        return [
+            {
+                'entities': self._collect_entities(doc),
+                'noun_phrases': self._collect_noun_phrases(doc)
+            }
+            for doc in docs
+        ]
+    
+    def _parse(self, text: str):
+        """
+        Parse text with spaCy, reusing the document if the same text was parsed recently
+        
+        Args:
+            text: Text to parse
+            
+        Returns:
+            spaCy document
+        """
+        doc = self._doc_cache.get(text)
+        if doc is None:
+            doc = self.spacy_model(text)
+            self._doc_cache[text] = doc
+            
+            # Evict the least recently used document
+            if len(self._doc_cache) > self.doc_cache_size:
+                self._doc_cache.popitem(last=False)
+        else:
+            self._doc_cache.move_to_end(text)
+        
+        return doc
+    
+    def _collect_noun_phrases(self, doc) -> List[str]:
+        """
+        Collect multi-word noun phrases from a processed spaCy document
+        
+        Args:
+            doc: spaCy document
+            
+        Returns:
+            List of unique noun phrases
+        """
         # Extract noun phrases
         noun_phrases = [chunk.text for chunk in doc.noun_chunks if len(chunk.text.split()) > 1]
         
@@ -180,16 +385,73 @@ class NLPPipeline:
         if not self.sentence_transformer:
             raise ModelError("NLP Pipeline", "Sentence Transformer model not initialized")
         
-        # Encode texts
-        embedding1 = self.sentence_transformer.encode(text1, convert_to_tensor=True)
-        embedding2 = self.sentence_transformer.encode(text2, convert_to_tensor=True)
+        # Cosine similarity of normalized embeddings is their dot product
+        embedding1, embedding2 = self._encode_cached([text1, text2])
         
-        # Compute cosine similarity
-        from torch.nn import CosineSimilarity
-        cos = CosineSimilarity(dim=0)
-        similarity = cos(embedding1, embedding2).item()
+        return float(np.dot(embedding1, embedding2))
+    
+    def compute_pairwise_similarity(self, texts: List[str]) -> np.ndarray:
+        """
+        Compute semantic similarity between every pair of texts
         
-        return similarity
+        Args:
+            texts: List of texts to compare
+            
+        Returns:
+            Square matrix of cosine similarities, one row and column per text
+        """
+        if not self.sentence_transformer:
+            raise ModelError("NLP Pipeline", "Sentence Transformer model not initialized")
+        
+        embeddings = self._encode_cached(texts)
+        
+        return embeddings @ embeddings.T
+    
+    def _encode_cached(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode texts, reusing cached embeddings of previously seen texts
+        
+        Texts are keyed by a content hash; only distinct texts missing from the
+        cache are encoded, in a single batch.
+        
+        Args:
+            texts: List of texts to encode
+            
+        Returns:
+            Array of L2-normalized float32 embeddings, one row per text
+        """
+        if not texts:
+            dimension = self.sentence_transformer.get_sentence_embedding_dimension()
+            return np.zeros((0, dimension), dtype=np.float32)
+        
+        keys = [hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest() for text in texts]
+        
+        # Collect distinct texts that are not cached yet
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in self._embedding_cache and key not in missing:
+                missing[key] = text
+        
+        if missing:
+            new_embeddings = self.sentence_transformer.encode(
+                list(missing.values()),
+                batch_size=self.embedding_batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+            for key, embedding in zip(missing, new_embeddings):
+                self._embedding_cache[key] = embedding.astype(np.float32, copy=False)
+        
+        embeddings = np.stack([self._embedding_cache[key] for key in keys])
+        
+        # Mark entries as recently used and evict the least recently used ones
+        for key in keys:
+            self._embedding_cache.move_to_end(key)
+        while len(self._embedding_cache) > self.embedding_cache_size:
+            self._embedding_cache.popitem(last=False)
+        
+        return embeddings
     
     def compute_embeddings(self, texts: List[str]) -> List:
         """
@@ -205,7 +467,11 @@ class NLPPipeline:
             raise ModelError("NLP Pipeline", "Sentence Transformer model not initialized")
         
         # Encode texts
-        embeddings = self.sentence_transformer.encode(texts)
+        embeddings = self.sentence_transformer.encode(
+            texts,
+            batch_size=self.embedding_batch_size,
+            show_progress_bar=False
+        )
         
         return embeddings
     
@@ -244,6 +510,60 @@ class NLPPipeline:
         
         return summary[0]['summary_text']
     
+    def summarize_batch(
+        self,
+        texts: List[str],
+        max_length: int = 150,
+        min_length: int = 50,
+        batch_size: int = 8
+    ) -> List[str]:
+        """
+        Generate summaries of multiple texts in length-sorted batches
+        
+        Args:
+            texts: Texts to summarize
+            max_length: Maximum summary length in tokens
+            min_length: Minimum summary length in tokens
+            batch_size: Number of texts per generation batch
+            
+        Returns:
+            List of summaries, one per text
+        """
+        if not self.summarizer:
+            raise ModelError("NLP Pipeline", "Summarizer model not initialized")
+        
+        summaries = list(texts)
+        
+        # Texts too short to summarize are returned unchanged
+        max_input_length = 1024
+        pending = {}
+        for i, text in enumerate(texts):
+            words = text.split()
+            if len(words) >= min_length:
+                pending[i] = ' '.join(words[:max_input_length])
+        
+        if not pending:
+            return summaries
+        
+        # Sort by length so each batch pads to a similar size
+        order = sorted(pending, key=lambda i: len(pending[i].split()))
+        
+        outputs = self.summarizer(
+            [pending[i] for i in order],
+            max_length=max_length,
+            min_length=min_length,
+            do_sample=False,
+            truncation=True,
+            batch_size=batch_size
+        )
+        
+        for i, output in zip(order, outputs):
+            if isinstance(output, list):
+                output = output[0]
+            summaries[i] = output['summary_text']
+        
+        return summaries
+    
     def classify_text(self, text: str, labels: List[str]) -> Dict[str, float]:
         """
         Classify text into one or more categories
@@ -266,6 +586,38 @@ class NLPPipeline:
         
         return scores
     
+    def classify_batch(self, texts: List[str], labels: List[str], batch_size: int = 16) -> List[Dict[str, float]]:
+        """
+        Classify multiple texts in length-sorted batches
+        
+        Args:
+            texts: Texts to classify
+            labels: List of possible labels
+            batch_size: Number of texts per forward pass
+            
+        Returns:
+            List of dictionaries mapping labels to confidence scores, one per text
+        """
+        if not self.zero_shot_classifier:
+            raise ModelError("NLP Pipeline", "Zero-shot classifier not initialized")
+        
+        if not texts:
+            return []
+        
+        # Sort by length so each batch pads to a similar size
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i].split()))
+        
+        results = self.zero_shot_classifier([texts[i] for i in order], labels, batch_size=batch_size)
+        if isinstance(results, dict):
+            results = [results]
+        
+        # Restore input order
+        scores = [None] * len(texts)
+        for i, result in zip(order, results):
+            scores[i] = {label: score for label, score in zip(result['labels'], result['scores'])}
+        
+        return scores
+    
     def extract_keywords(self, text: str, top_n: int = 10) -> List[str]:
         """
         Extract keywords from text
@@ -277,16 +629,12 @@ class NLPPipeline:
         Returns:
             List of keywords
         """
-        # Tokenize text
-        words = word_tokenize(text.lower())
+        # Find alphabetic words longer than three letters
+        words = KEYWORD_PATTERN.findall(text.lower())
         
-        # Remove stopwords and short words
-        stop_words = set(stopwords.words('english'))
-        words = [word for word in words if word.isalpha() and word not in stop_words and len(word) > 3]
-        
-        # Count word frequencies
-        from collections import Counter
-        word_counts = Counter(words)
+        # Count word frequencies, skipping stopwords
+        stop_words = _english_stopwords()
+        word_counts = Counter(word for word in words if word not in stop_words)
         
         # Get top keywords
         keywords = [word for word, count in word_counts.most_common(top_n)]
@@ -303,25 +651,43 @@ class NLPPipeline:
         Returns:
             Dictionary with sentiment scores
         """
+        return self.analyze_sentiment_batch([text])[0]
+    
+    def analyze_sentiment_batch(self, texts: List[str], batch_size: int = 16) -> List[Dict[str, float]]:
+        """
+        Analyze sentiment of multiple texts in batches
+        
+        Args:
+            texts: Texts to analyze
+            batch_size: Number of texts per forward pass
+            
+        Returns:
+            List of dictionaries with sentiment scores, one per text
+        """
+        if not texts:
+            return []
+        
         try:
-            # Initialize sentiment analyzer
-            sentiment_analyzer = pipeline(
-                "sentiment-analysis",
-                model="distilbert-base-uncased-finetuned-sst-2-english",
-                device=-1  # Use CPU
-            )
+            if not self.sentiment_analyzer:
+                raise ModelError("NLP Pipeline", "Sentiment analyzer not initialized")
             
             # Analyze sentiment
-            result = sentiment_analyzer(text)
+            results = self.sentiment_analyzer(texts, batch_size=batch_size)
             
-            return {
-                'label': result[0]['label'],
-                'score': result[0]['score']
-            }
+            return [
+                {
+                    'label': result['label'],
+                    'score': result['score']
+                }
+                for result in results
+            ]
             
         except Exception as e:
             logger.error(f"Error analyzing sentiment: {str(e)}")
-            return {
-                'label': 'NEUTRAL',
-                'score': 0.5
-            }
+            return [
+                {
+                    'label': 'NEUTRAL',
+                    'score': 0.5
+                }
+                for _ in texts
+            ]
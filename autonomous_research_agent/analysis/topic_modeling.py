@@ -5,36 +5,188 @@ This module provides functionality to identify and analyze topics across researc
 using techniques like BERTopic, LDA, and other topic modeling approaches.
 """
 
+import hashlib
 import logging
+import os
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
-from bertopic import BERTopic
+import torch
+from scipy.sparse import csr_matrix, load_npz, save_npz, vstack
 from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
-from transformers import pipeline
 
+from autonomous_research_agent.analysis.models import get_sentence_transformer
+from autonomous_research_agent.config.settings import settings
 from autonomous_research_agent.core.exceptions import ModelError
 
 logger = logging.getLogger(__name__)
 
+try:
+    from cuml.cluster import HDBSCAN as cuHDBSCAN
+    from cuml.manifold import UMAP as cuUMAP
+    CUML_AVAILABLE = True
+except ImportError:
+    CUML_AVAILABLE = False
+    logger.debug("cuML not available, BERTopic clusters on CPU")
+
+def _top_k_per_row(components: np.ndarray, k: int) -> np.ndarray:
+    """
+    Find the column indices of the k largest values in each row
+    
+    Each row is scanned once, keeping the current top k in a small sorted
+    buffer, so selection is linear in the number of columns.
+    
+    Args:
+        components: Topic-word weight matrix
+        k: Number of columns to keep per row
+        
+    Returns:
+        Array of shape (n_rows, k) with column indices in descending order of
+        weight; among equal weights the later column comes first
+    """
+    n_rows, n_columns = components.shape
+    k = min(k, n_columns)
+    top = np.empty((n_rows, k), dtype=np.int32)
+    
+    for row in range(n_rows):
+        values = components[row]
+        filled = 0
+        for col in range(n_columns):
+            value = values[col]
+            if filled == k and value < values[top[row, k - 1]]:
+                continue
+            
+            # Insert into the buffer, dropping its smallest entry once full
+            pos = filled if filled < k else k - 1
+            while pos > 0 and values[top[row, pos - 1]] <= value:
+                top[row, pos] = top[row, pos - 1]
+                pos -= 1
+            top[row, pos] = col
+            
+            if filled < k:
+                filled += 1
+    
+    return top
+
+def _bucket_docs_by_topic(topics: np.ndarray, n_topics: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Group document indices by assigned topic
+    
+    Args:
+        topics: Topic of each document
+        n_topics: Number of topics
+        
+    Returns:
+        CSR-style (indptr, indices) pair; the documents of topic t are
+        indices[indptr[t]:indptr[t + 1]], in ascending order
+    """
+    indptr = np.zeros(n_topics + 1, dtype=np.int64)
+    for i in range(topics.shape[0]):
+        indptr[topics[i] + 1] += 1
+    for t in range(n_topics):
+        indptr[t + 1] += indptr[t]
+    
+    fill = indptr[:-1].copy()
+    indices = np.empty(topics.shape[0], dtype=np.int32)
+    for i in range(topics.shape[0]):
+        t = topics[i]
+        indices[fill[t]] = i
+        fill[t] += 1
+    
+    return indptr, indices
+
+class _CachedCountVectorizer(CountVectorizer):
+    """CountVectorizer whose analyzer memoizes the tokens of recently seen documents"""
+    
+    def build_analyzer(self):
+        """Return the analyzer, built once and wrapped in an LRU cache"""
+        analyzer = getattr(self, '_cached_analyzer', None)
+        if analyzer is None:
+            analyzer = lru_cache(maxsize=settings.cache.max_size)(super().build_analyzer())
+            self._cached_analyzer = analyzer
+        return analyzer
+
+try:
+    from numba import njit
+    _top_k_per_row = njit(cache=True)(_top_k_per_row)
+    _bucket_docs_by_topic = njit(cache=True)(_bucket_docs_by_topic)
+except ImportError:
+    logger.debug("Numba not available, LDA topic post-processing runs in pure Python")
+
 class TopicModeler:
     """
     Topic modeling for research papers
     """
     
-    def __init__(self, use_bertopic: bool = True):
+    # Sentence Transformer used to embed documents for BERTopic
+    embedding_model_name = 'all-MiniLM-L6-v2'
+    embedding_batch_size = 64
+    
+    # TF-IDF document vectors used in place of sentence embeddings; the
+    # vocabulary is capped because BERTopic needs a dense matrix
+    tfidf_min_df = 5
+    tfidf_max_features = 5000
+    
+    # Number of documents tokenized at a time when building the LDA corpus
+    lda_chunk_size = 2048
+    
+    def __init__(self, use_bertopic: bool = True, embedding_backend: str = "auto"):
         """
         Initialize the topic modeler
         
         Args:
             use_bertopic: Whether to use BERTopic (True) or LDA (False)
+            embedding_backend: Document embeddings for BERTopic: "sentence_transformer",
+                "tfidf" (much faster on CPU, lower clustering quality), or "auto" to
+                use TF-IDF when no GPU is available
         """
+        allowed_backends = ['auto', 'sentence_transformer', 'tfidf']
+        if embedding_backend not in allowed_backends:
+            raise ValueError(f"Embedding backend must be one of {allowed_backends}")
+        
+        if embedding_backend == 'auto':
+            embedding_backend = 'sentence_transformer' if torch.cuda.is_available() else 'tfidf'
+        
         self.use_bertopic = use_bertopic
+        self.embedding_backend = embedding_backend
+        self.tfidf_vectorizer = None
         self.model = None
         self.vectorizer = None
+        self.dictionary = None
         self.topics = None
         self.topic_words = None
         self.topic_docs = None
+        self.embedding_model = None
+        
+        # Embedding is spread over one process per GPU when there are several
+        self.embedding_devices = [f"cuda:{i}" for i in range(torch.cuda.device_count())]
+        self._encode_pool = None
+        
+        # Run UMAP and HDBSCAN on the GPU when cuML can use one
+        self.use_gpu_clustering = CUML_AVAILABLE and torch.cuda.is_available()
+        
+        # Load the shared embedding model on the best available device
+        if use_bertopic and embedding_backend == 'sentence_transformer':
+            try:
+                self.embedding_model = get_sentence_transformer(self.embedding_model_name)
+            except Exception as e:
+                logger.warning(f"Error loading embedding model, BERTopic will load its own: {str(e)}")
+    
+    def close(self):
+        """Stop the multi-GPU embedding workers, if any were started"""
+        if self._encode_pool is not None:
+            self.embedding_model.stop_multi_process_pool(self._encode_pool)
+            self._encode_pool = None
+    
+    def __del__(self):
+        """Release the embedding workers when the modeler is garbage collected"""
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def fit(self, documents: List[str], num_topics: int = 10) -> Dict:
         """
@@ -63,9 +215,36 @@ class TopicModeler:
         Returns:
             Dictionary with topic model results
         """
+        # Imported here so LDA-only use never pays for BERTopic's dependency tree
+        from bertopic import BERTopic
+        
         try:
+            # Embed documents up front so repeated fits reuse the cached embeddings
+            embeddings = None
+            if self.embedding_backend == 'tfidf':
+                embeddings = self._tfidf_embeddings(documents, fit=True)
+            elif self.embedding_model is not None:
+                embeddings = self._embed_documents(documents)
+            
+            # Replace the CPU dimensionality reduction and clustering models
+            cluster_models = {}
+            if self.use_gpu_clustering:
+                cluster_models['umap_model'] = cuUMAP(
+                    n_neighbors=15,
+                    n_components=5,
+                    min_dist=0.0,
+                    metric='cosine'
+                )
+                cluster_models['hdbscan_model'] = cuHDBSCAN(
+                    min_cluster_size=5,
+                    metric='euclidean',
+                    prediction_data=True
+                )
+            
             # Initialize BERTopic model
             self.model = BERTopic(
+                embedding_model=self.embedding_model,
+                **cluster_models,
                 nr_topics=num_topics,
                 language="english",
                 calculate_probabilities=True,
@@ -73,32 +252,26 @@ class TopicModeler:
             )
             
             # Fit model
-            topics, probs = self.model.fit_transform(documents)
+            topics, probs = self.model.fit_transform(documents, embeddings)
             
             # Store results
             self.topics = topics
             self.topic_words = self.model.get_topics()
-            self.topic_docs = {}
-            
-            # Group documents by topic
-            for i, topic in enumerate(topics):
-                if topic not in self.topic_docs:
-                    self.topic_docs[topic] = []
-                self.topic_docs[topic].append(i)
+            self.topic_docs = self._group_docs_by_topic(topics)
             
             # Get topic info
             topic_info = self.model.get_topic_info()
             
+            # Keep only the words of each topic, skipping the outlier topic
+            topic_ids = [topic for topic in self.topic_words if topic != -1]
+            word_lists = [list(map(itemgetter(0), self.topic_words[topic])) for topic in topic_ids]
+            
             # Format results
             results = {
                 'model_type': 'bertopic',
                 'num_topics': len(self.topic_words),
                 'topics': topics,
-                'topic_words': {
-                    topic: [word for word, score in words]
-                    for topic, words in self.topic_words.items()
-                    if topic != -1  # Skip outlier topic
-                },
+                'topic_words': dict(zip(topic_ids, word_lists)),
                 'topic_docs': self.topic_docs,
                 'topic_info': topic_info.to_dict('records')
             }
@@ -109,6 +282,107 @@ class TopicModeler:
             logger.error(f"Error fitting BERTopic model: {str(e)}")
             raise ModelError("BERTopic", f"Error fitting model: {str(e)}")
     
+    @staticmethod
+    def _group_docs_by_topic(topics: List[int]) -> Dict[int, List[int]]:
+        """
+        Group document indices by assigned topic
+        
+        Args:
+            topics: Topic of each document; may include the -1 outlier topic
+            
+        Returns:
+            Dictionary mapping each topic to its document indices in ascending order
+        """
+        topics = np.asarray(topics, dtype=np.int32)
+        
+        # Stable sort keeps document order within each topic
+        order = np.argsort(topics, kind='stable')
+        unique, first = np.unique(topics[order], return_index=True)
+        
+        return dict(zip(unique.tolist(), [docs.tolist() for docs in np.split(order, first[1:])]))
+    
+    def _tfidf_embeddings(self, documents: List[str], fit: bool = False) -> np.ndarray:
+        """
+        Represent documents by their TF-IDF vectors for use as BERTopic embeddings
+        
+        Args:
+            documents: List of document texts
+            fit: Whether to fit a new vocabulary on these documents
+            
+        Returns:
+            Dense float32 array with one row per document
+        """
+        if fit:
+            # Relax the document frequency floor for small collections
+            self.tfidf_vectorizer = TfidfVectorizer(
+                min_df=min(self.tfidf_min_df, max(1, len(documents) // 10)),
+                max_features=self.tfidf_max_features,
+                stop_words='english'
+            )
+            matrix = self.tfidf_vectorizer.fit_transform(documents)
+        else:
+            matrix = self.tfidf_vectorizer.transform(documents)
+        
+        return matrix.astype(np.float32).toarray()
+    
+    def _embed_documents(self, documents: List[str]) -> np.ndarray:
+        """
+        Embed documents with the Sentence Transformer, caching the result on disk
+        
+        Embeddings are stored as float16 and memory-mapped, so rows are paged
+        in as they are read rather than loaded up front.
+        
+        Args:
+            documents: List of document texts
+            
+        Returns:
+            Read-only array of embeddings with one row per document
+        """
+        # Key the cache on the model and the exact document sequence
+        key = hashlib.blake2b(self.embedding_model_name.encode('utf-8'), digest_size=16)
+        for document in documents:
+            encoded = document.encode('utf-8')
+            key.update(len(encoded).to_bytes(8, 'little'))
+            key.update(encoded)
+        
+        cache_path = Path(settings.cache_dir) / f"emb_{key.hexdigest()}.npy"
+        if cache_path.exists():
+            return np.load(cache_path, mmap_mode='r')
+        
+        if len(self.embedding_devices) > 1:
+            # Workers are started on first use and kept until close()
+            if self._encode_pool is None:
+                self._encode_pool = self.embedding_model.start_multi_process_pool(
+                    target_devices=self.embedding_devices
+                )
+            embeddings = self.embedding_model.encode_multi_process(
+                documents,
+                self._encode_pool,
+                batch_size=self.embedding_batch_size
+            )
+        else:
+            embeddings = self.embedding_model.encode(
+                documents,
+                batch_size=self.embedding_batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+        
+        # Write to a temporary file so an interrupted run is not reused
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            staging_path = cache_path.with_suffix('.tmp')
+            with open(staging_path, 'wb') as f:
+                np.save(f, embeddings.astype(np.float16))
+            os.replace(staging_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Error caching document embeddings: {str(e)}")
+            return embeddings
+        
+        # Map the cached copy so fresh and cached fits see the same values
+        del embeddings
+        return np.load(cache_path, mmap_mode='r')
+    
     def _fit_lda(self, documents: List[str], num_topics: int) -> Dict:
         """
         Fit LDA model to documents
@@ -121,53 +395,57 @@ class TopicModeler:
             Dictionary with topic model results
         """
         try:
-            from sklearn.decomposition import LatentDirichletAllocation
+            from gensim.models import LdaMulticore
             
-            # Initialize vectorizer
-            self.vectorizer = CountVectorizer(
-                max_df=0.95,
-                min_df=2,
-                stop_words='english'
-            )
+            # Initialize vectorizer, used for its tokenizer and stop words; it is
+            # kept across fits so its token cache carries over
+            if self.vectorizer is None:
+                self.vectorizer = _CachedCountVectorizer(
+                    max_df=0.95,
+                    min_df=2,
+                    stop_words='english'
+                )
             
-            # Transform documents to document-term matrix
-            X = self.vectorizer.fit_transform(documents)
-            
-            # Initialize LDA model
-            self.model = LatentDirichletAllocation(
-                n_components=num_topics,
-                max_iter=10,
-                learning_method='online',
-                random_state=42,
-                batch_size=128,
-                verbose=0
-            )
+            # Build bag-of-words corpus
+            corpus = self._build_bow_corpus(documents)
             
-            # Fit model
-            self.model.fit(X)
-            
-            # Get feature names
-            feature_names = self.vectorizer.get_feature_names_out()
+            # Fit LDA model, one core is left for the coordinating process; the
+            # budget matches the former scikit-learn model: 10 passes (max_iter)
+            # of at most 100 E-step iterations per document (max_doc_update_iter)
+            self.model = LdaMulticore(
+                corpus=corpus,
+                id2word=self.dictionary,
+                num_topics=num_topics,
+                workers=max(1, (os.cpu_count() or 1) - 1),
+                passes=10,
+                iterations=100,
+                alpha='symmetric',
+                eta=0.01,
+                chunksize=2000,
+                random_state=42
+            )
             
             # Get top words for each topic
-            self.topic_words = {}
-            for topic_idx, topic in enumerate(self.model.components_):
-                top_words_idx = topic.argsort()[:-11:-1]
-                top_words = [(feature_names[i], topic[i]) for i in top_words_idx]
-                self.topic_words[topic_idx] = top_words
+            components = self.model.get_topics()
+            top_words_idx = _top_k_per_row(components, 10)
+            self.topic_words = {
+                topic_idx: [(self.dictionary[i], components[topic_idx, i]) for i in top_words_idx[topic_idx].tolist()]
+                for topic_idx in range(components.shape[0])
+            }
             
-            # Transform documents to get topic distributions
-            doc_topic_dists = self.model.transform(X)
+            # Get topic distributions of the training documents
+            doc_topic_dists = self._lda_topic_distributions(corpus)
             
             # Assign topics to documents
-            self.topics = doc_topic_dists.argmax(axis=1)
+            self.topics = doc_topic_dists.argmax(axis=1).astype(np.int32)
             
             # Group documents by topic
-            self.topic_docs = {}
-            for i, topic in enumerate(self.topics):
-                if topic not in self.topic_docs:
-                    self.topic_docs[topic] = []
-                self.topic_docs[topic].append(i)
+            indptr, indices = _bucket_docs_by_topic(self.topics, num_topics)
+            self.topic_docs = {
+                topic: indices[indptr[topic]:indptr[topic + 1]].tolist()
+                for topic in range(num_topics)
+                if indptr[topic + 1] > indptr[topic]
+            }
             
             # Format results
             results = {
@@ -175,7 +453,7 @@ class TopicModeler:
                 'num_topics': num_topics,
                 'topics': self.topics.tolist(),
                 'topic_words': {
-                    topic: [word for word, score in words]
+                    topic: list(map(itemgetter(0), words))
                     for topic, words in self.topic_words.items()
                 },
                 'topic_docs': {
@@ -189,37 +467,189 @@ class TopicModeler:
             logger.error(f"Error fitting LDA model: {str(e)}")
             raise ModelError("LDA", f"Error fitting model: {str(e)}")
     
-    def get_document_topics(self, document: str) -> List[Tuple[int, float]]:
+    def _build_bow_corpus(self, documents: List[str]):
+        """
+        Build the LDA dictionary and a bag-of-words corpus backed by a sparse matrix
+        
+        Documents are tokenized chunk by chunk, once to collect document
+        frequencies and once to count the terms kept after pruning with the
+        vectorizer's document frequency limits. Only the compact document-term
+        matrix is held in memory, and LDA streams documents from it.
+        
+        Args:
+            documents: List of document texts
+            
+        Returns:
+            Bag-of-words corpus yielding (term_id, count) pairs per document
+        """
+        from gensim.corpora import Dictionary
+        from gensim.matutils import Sparse2Corpus, corpus2csc
+        
+        cache_path = Path(settings.cache_dir) / f"bow_{self._corpus_hash(documents)}"
+        matrix_path = cache_path.with_suffix('.npz')
+        dictionary_path = cache_path.with_suffix('.dict')
+        
+        # Reuse the corpus of an earlier fit on the same documents
+        if matrix_path.exists() and dictionary_path.exists():
+            try:
+                self.dictionary = Dictionary.load(str(dictionary_path))
+                return Sparse2Corpus(load_npz(matrix_path), documents_columns=False)
+            except Exception as e:
+                logger.warning(f"Error loading cached corpus, rebuilding it: {str(e)}")
+        
+        analyzer = self.vectorizer.build_analyzer()
+        chunk_starts = range(0, len(documents), self.lda_chunk_size)
+        
+        # Collect document frequencies
+        self.dictionary = Dictionary()
+        for start in chunk_starts:
+            chunk = documents[start:start + self.lda_chunk_size]
+            self.dictionary.add_documents([analyzer(document) for document in chunk])
+        
+        self.dictionary.filter_extremes(
+            no_below=self.vectorizer.min_df,
+            no_above=self.vectorizer.max_df,
+            keep_n=None
+        )
+        
+        # Count the kept terms into a document-term matrix
+        num_terms = len(self.dictionary)
+        blocks = []
+        for start in chunk_starts:
+            chunk = documents[start:start + self.lda_chunk_size]
+            bows = [self.dictionary.doc2bow(analyzer(document)) for document in chunk]
+            blocks.append(corpus2csc(bows, num_terms=num_terms, num_docs=len(bows), dtype=np.int32).T)
+        
+        if blocks:
+            matrix = vstack(blocks, format='csr')
+        else:
+            matrix = csr_matrix((0, num_terms), dtype=np.int32)
+        
+        # Persist the document-term matrix; it is written last so its presence
+        # means the dictionary is complete
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            staging_path = cache_path.with_suffix('.tmp')
+            self.dictionary.save(str(staging_path))
+            os.replace(staging_path, dictionary_path)
+            with open(staging_path, 'wb') as f:
+                save_npz(f, matrix)
+            os.replace(staging_path, matrix_path)
+        except OSError as e:
+            logger.warning(f"Error caching corpus: {str(e)}")
+        
+        return Sparse2Corpus(matrix, documents_columns=False)
+    
+    def _corpus_hash(self, documents: List[str]) -> str:
+        """
+        Hash documents together with the vectorizer parameters that shape their tokens
+        
+        Args:
+            documents: List of document texts
+            
+        Returns:
+            Hexadecimal digest
+        """
+        params = sorted(self.vectorizer.get_params().items())
+        key = hashlib.blake2b(repr(params).encode('utf-8'), digest_size=16)
+        for document in documents:
+            encoded = document.encode('utf-8')
+            key.update(len(encoded).to_bytes(8, 'little'))
+            key.update(encoded)
+        
+        return key.hexdigest()
+    
+    def _lda_topic_distributions(self, corpus) -> np.ndarray:
         """
-        Get topic distribution for a new document
+        Infer dense topic distributions for a bag-of-words corpus
         
         Args:
-            document: Document text
+            corpus: Bag-of-words corpus
             
         Returns:
-            List of (topic_id, probability) tuples
+            Array of topic probabilities with one row per document
+        """
+        from gensim.matutils import corpus2dense
+        
+        doc_topics = self.model.get_document_topics(corpus, minimum_probability=0.0)
+        
+        return corpus2dense(
+            doc_topics,
+            num_terms=self.model.num_topics,
+            num_docs=len(corpus),
+            dtype=np.float32
+        ).T
+    
+    def get_document_topics(
+        self,
+        documents: Union[str, List[str]],
+        top_n: Optional[int] = None
+    ) -> Union[List[Tuple[int, float]], List[List[Tuple[int, float]]]]:
+        """
+        Get topic distributions for new documents
+        
+        Args:
+            documents: Document text, or list of document texts inferred in one batch
+            top_n: Number of most probable topics to return per document (all if None)
+            
+        Returns:
+            List of (topic_id, probability) tuples sorted by probability, or one
+            such list per document when a list is given
         """
         if self.model is None:
             raise ModelError("Topic Model", "Model not fitted")
         
+        single = isinstance(documents, str)
+        if single:
+            documents = [documents]
+        
         if self.use_bertopic:
-            # Get topics for new document with BERTopic
-            topics, probs = self.model.transform([document])
+            # Get topics for all documents with BERTopic
+            embeddings = None
+            if self.embedding_backend == 'tfidf':
+                embeddings = self._tfidf_embeddings(documents)
+            topics, probs = self.model.transform(documents, embeddings)
             
-            # Get top topics with probabilities
-            if len(probs) > 0:
-                topic_probs = list(zip(topics[0], probs[0]))
-                return sorted(topic_probs, key=lambda x: x[1], reverse=True)
+            if probs is None or np.ndim(probs) != 2:
+                topic_probs = [[] for _ in documents]
             else:
-                return []
+                topic_probs = self._rank_topics(np.asarray(probs), top_n)
         else:
-            # Get topics for new document with LDA
-            doc_vec = self.vectorizer.transform([document])
-            topic_dist = self.model.transform(doc_vec)[0]
+            # Get topics for all documents with LDA
+            analyzer = self.vectorizer.build_analyzer()
+            corpus = [self.dictionary.doc2bow(analyzer(document)) for document in documents]
+            topic_probs = self._rank_topics(self._lda_topic_distributions(corpus), top_n)
+        
+        return topic_probs[0] if single else topic_probs
+    
+    @staticmethod
+    def _rank_topics(topic_dists: np.ndarray, top_n: Optional[int] = None) -> List[List[Tuple[int, float]]]:
+        """
+        Sort each document's topics by descending probability
+        
+        Args:
+            topic_dists: Topic probabilities with one row per document
+            top_n: Number of most probable topics to keep per document (all if None)
             
-            # Get top topics with probabilities
-            topic_probs = [(i, prob) for i, prob in enumerate(topic_dist)]
-            return sorted(topic_probs, key=lambda x: x[1], reverse=True)
+        Returns:
+            List of (topic_id, probability) tuples per document
+        """
+        num_topics = topic_dists.shape[1]
+        if top_n is not None and 0 < top_n < num_topics:
+            # Select the top_n topics of each row, then sort only those
+            candidates = np.argpartition(-topic_dists, top_n - 1, axis=1)[:, :top_n]
+            candidate_probs = np.take_along_axis(topic_dists, candidates, axis=1)
+            order = np.take_along_axis(
+                candidates,
+                np.argsort(-candidate_probs, axis=1, kind='stable'),
+                axis=1
+            )
+        else:
+            order = np.argsort(-topic_dists, axis=1, kind='stable')
+        sorted_probs = np.take_along_axis(topic_dists, order, axis=1)
+        
+        return [list(zip(ids, probs)) for ids, probs in zip(order.tolist(), sorted_probs.tolist())]
     
     def get_topic_keywords(self, topic_id: int, top_n: int = 10) -> List[str]:
         """
@@ -310,3 +740,59 @@ class TopicModeler:
         except Exception as e:
             logger.error(f"Error visualizing topics: {str(e)}")
             return None
+    
+    def save(self, path: Union[str, Path]):
+        """
+        Save the fitted BERTopic model with safetensors serialization
+        
+        The saved model keeps topic embeddings but not the UMAP and HDBSCAN
+        models, so get_document_topics after load() assigns topics by cosine
+        similarity to the topic embeddings instead of a full transform.
+        
+        Args:
+            path: Directory to save the model to
+        """
+        if self.model is None:
+            raise ModelError("Topic Model", "Model not fitted")
+        
+        if not self.use_bertopic:
+            raise ModelError("Topic Model", "Only BERTopic models can be saved")
+        
+        if self.embedding_backend != 'sentence_transformer':
+            raise ModelError("Topic Model", "Only models fitted on Sentence Transformer embeddings can be saved")
+        
+        # Store a pointer to the embedding model on the hub rather than its weights
+        embedding_model_name = self.embedding_model_name
+        if '/' not in embedding_model_name:
+            embedding_model_name = f"sentence-transformers/{embedding_model_name}"
+        
+        self.model.save(
+            str(path),
+            serialization="safetensors",
+            save_ctfidf=True,
+            save_embedding_model=embedding_model_name
+        )
+    
+    def load(self, path: Union[str, Path]):
+        """
+        Load a BERTopic model saved with save()
+        
+        Args:
+            path: Directory the model was saved to
+        """
+        from bertopic import BERTopic
+        
+        try:
+            if self.embedding_model is not None:
+                self.model = BERTopic.load(str(path), embedding_model=self.embedding_model)
+            else:
+                self.model = BERTopic.load(str(path))
+        except Exception as e:
+            logger.error(f"Error loading BERTopic model: {str(e)}")
+            raise ModelError("BERTopic", f"Error loading model: {str(e)}")
+        
+        self.use_bertopic = True
+        self.embedding_backend = 'sentence_transformer'
+        self.topics = self.model.topics_
+        self.topic_words = self.model.get_topics()
+        self.topic_docs = self._group_docs_by_topic(self.topics)
@@ -5,12 +5,32 @@ This module configures the logging system for the application.
 It provides a centralized configuration for consistent logging across all components.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from pathlib import Path
 
+# Background listener that writes queued log records to the real handlers
+_queue_listener = None
+
+
+def _stop_queue_listener():
+    """Flush queued log records, stop the background listener and close its handlers"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        
+        for handler in _queue_listener.handlers:
+            handler.close()
+        
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def configure_logging(log_level=logging.INFO, log_dir="logs", log_filename="research_agent.log"):
     """
@@ -37,6 +57,7 @@ def configure_logging(log_level=logging.INFO, log_dir="logs", log_filename="rese
     # Remove any existing handlers to avoid duplicates when reconfiguring
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_queue_listener()
     
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -47,7 +68,8 @@ def configure_logging(log_level=logging.INFO, log_dir="logs", log_filename="rese
     )
     console_handler.setFormatter(console_format)
     
-    # Create file handler with rotation
+    # Create file handler with rotation; it runs on the listener thread, so
+    # its writes and size checks stay off the logging call path
     file_handler = logging.handlers.RotatingFileHandler(
         log_file,
         maxBytes=10 * 1024 * 1024,  # 10 MB
@@ -61,9 +83,17 @@ def configure_logging(log_level=logging.INFO, log_dir="logs", log_filename="rese
     )
     file_handler.setFormatter(file_format)
     
-    # Add handlers to logger
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    # Log calls only enqueue records; a background thread writes them out
+    global _queue_listener
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        respect_handler_level=True
+    )
+    _queue_listener.start()
     
     # Create application logger
     logger = logging.getLogger('autonomous_research_agent')
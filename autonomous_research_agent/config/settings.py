@@ -2,13 +2,21 @@
 Configuration settings for the Autonomous Research Agent
 """
 
+import copy
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
 import yaml
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, field_validator
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_settings import BaseSettings
 
 # Load environment variables from .env file
@@ -16,6 +24,8 @@ load_dotenv()
 
 class APIConfig(BaseModel):
     """Configuration for external API services"""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     base_url: str
     api_key: Optional[str] = None
@@ -26,6 +36,8 @@ class APIConfig(BaseModel):
 
 class ModelConfig(BaseModel):
     """Configuration for ML models"""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     type: str
     path: Optional[str] = None
@@ -42,6 +54,8 @@ class ModelConfig(BaseModel):
 
 class DatabaseConfig(BaseModel):
     """Configuration for database connections"""
+    model_config = ConfigDict(frozen=True)
+    
     type: str
     connection_string: str
     pool_size: int = 5
@@ -59,6 +73,8 @@ class DatabaseConfig(BaseModel):
 
 class CacheConfig(BaseModel):
     """Configuration for caching system"""
+    model_config = ConfigDict(frozen=True)
+    
     enabled: bool = True
     type: str = "memory"
     ttl: int = Field(default=3600, description="Time to live in seconds")
@@ -75,6 +91,8 @@ class CacheConfig(BaseModel):
 
 class LoggingConfig(BaseModel):
     """Configuration for logging"""
+    model_config = ConfigDict(frozen=True)
+    
     level: str = "INFO"
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     file: Optional[str] = None
@@ -90,6 +108,63 @@ class LoggingConfig(BaseModel):
             raise ValueError(f"Log level must be one of {allowed_levels}")
         return v
 
+def _default_api_configs() -> Dict[str, APIConfig]:
+    """Build the API configurations, reading API keys from environment variables"""
+    semantic_scholar_key = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
+    pubmed_key = os.getenv("PUBMED_API_KEY")
+    
+    return {
+        # ArXiv doesn't require an API key
+        "arxiv": APIConfig(
+            name="ArXiv",
+            base_url="http://export.arxiv.org/api/query",
+            rate_limit=100  # ArXiv allows 100 requests per minute
+        ),
+        
+        # Semantic Scholar
+        "semantic_scholar": APIConfig(
+            name="Semantic Scholar",
+            base_url="https://api.semanticscholar.org/graph/v1",
+            api_key=semantic_scholar_key,
+            rate_limit=100  # 100 requests per 5-minute window with API key
+        ),
+        
+        # PubMed
+        "pubmed": APIConfig(
+            name="PubMed",
+            base_url="https://eutils.ncbi.nlm.nih.gov/entrez/eutils",
+            api_key=pubmed_key,
+            rate_limit=10 if pubmed_key is None else 100  # Higher rate limit with API key
+        ),
+        
+        # CrossRef
+        "crossref": APIConfig(
+            name="CrossRef",
+            base_url="https://api.crossref.org",
+            rate_limit=50  # Standard rate limit
+        )
+    }
+
+def _default_model_configs() -> Dict[str, ModelConfig]:
+    """Build the configurations of hosted models whose API keys are set"""
+    models = {}
+    
+    # OpenAI (if used)
+    openai_key = os.getenv("OPENAI_API_KEY")
+    if openai_key:
+        models["openai_gpt4"] = ModelConfig(
+            name="GPT-4",
+            type="openai",
+            api_endpoint="https://api.openai.com/v1/chat/completions",
+            parameters={
+                "model": "gpt-4",
+                "temperature": 0.2,
+                "max_tokens": 4000
+            }
+        )
+    
+    return models
+
 class Settings(BaseSettings):
     """Main application settings"""
     # Application settings
@@ -98,10 +173,10 @@ class Settings(BaseSettings):
     debug: bool = False
     
     # API configurations
-    apis: Dict[str, APIConfig] = Field(default_factory=dict)
+    apis: Dict[str, APIConfig] = Field(default_factory=_default_api_configs)
     
     # Model configurations
-    models: Dict[str, ModelConfig] = Field(default_factory=dict)
+    models: Dict[str, ModelConfig] = Field(default_factory=_default_model_configs)
     
     # Database configuration
     database: DatabaseConfig = Field(default_factory=lambda: DatabaseConfig(
@@ -132,13 +207,20 @@ class Settings(BaseSettings):
     # Class methods
     @classmethod
     def load_from_file(cls, config_path: Union[str, Path]) -> 'Settings':
-        """Load settings from a YAML configuration file"""
+        """
+        Load settings from a YAML configuration file
+        
+        The parsed YAML is cached until the file is modified; each call builds
+        and validates a new Settings instance, so environment overrides apply.
+        """
         config_path = Path(config_path)
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
         
-        with open(config_path, 'r') as f:
-            config_data = yaml.safe_load(f)
+        # Copy the cached data, as it is converted in place below
+        config_data = copy.deepcopy(
+            cls._read_config_file(str(config_path.resolve()), config_path.stat().st_mtime_ns)
+        )
         
         # Process API configurations
         if 'apis' in config_data:
@@ -173,6 +255,13 @@ class Settings(BaseSettings):
         
         return cls(**config_data)
     
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _read_config_file(config_path: str, mtime_ns: int) -> Dict:
+        """Parse a YAML configuration file (memoized by path and modification time)"""
+        with open(config_path, 'r') as f:
+            return yaml.load(f, Loader=SafeLoader) or {}
+    
     def ensure_directories(self):
         """Ensure that required directories exist"""
         for directory in [self.data_dir, self.cache_dir, self.output_dir]:
@@ -187,54 +276,7 @@ class Settings(BaseSettings):
 # Create default settings instance
 settings = Settings()
 
-# Load API keys from environment variables
 def load_api_keys():
-    """Load API keys from environment variables"""
-    # ArXiv doesn't require an API key
-    settings.apis["arxiv"] = APIConfig(
-        name="ArXiv",
-        base_url="http://export.arxiv.org/api/query",
-        rate_limit=100  # ArXiv allows 100 requests per minute
-    )
-    
-    # Semantic Scholar
-    semantic_scholar_key = os.getenv("SEMANTIC_SCHOLAR_API_KEY")
-    settings.apis["semantic_scholar"] = APIConfig(
-        name="Semantic Scholar",
-        base_url="https://api.semanticscholar.org/graph/v1",
-        api_key=semantic_scholar_key,
-        rate_limit=100  # 100 requests per 5-minute window with API key
-    )
-    
-    # PubMed
-    pubmed_key = os.getenv("PUBMED_API_KEY")
-    settings.apis["pubmed"] = APIConfig(
-        name="PubMed",
-        base_url="https://eutils.ncbi.nlm.nih.gov/entrez/eutils",
-        api_key=pubmed_key,
-        rate_limit=10 if pubmed_key is None else 100  # Higher rate limit with API key
-    )
-    
-    # CrossRef
-    settings.apis["crossref"] = APIConfig(
-        name="CrossRef",
-        base_url="https://api.crossref.org",
-        rate_limit=50  # Standard rate limit
-    )
-    
-    # OpenAI (if used)
-    openai_key = os.getenv("OPENAI_API_KEY")
-    if openai_key:
-        settings.models["openai_gpt4"] = ModelConfig(
-            name="GPT-4",
-            type="openai",
-            api_endpoint="https://api.openai.com/v1/chat/completions",
-            parameters={
-                "model": "gpt-4",
-                "temperature": 0.2,
-                "max_tokens": 4000
-            }
-        )
-
-# Load API keys on module import
-load_api_keys()
+    """Reload API keys from environment variables into the default settings"""
+    settings.apis.update(_default_api_configs())
+    settings.models.update(_default_model_configs())
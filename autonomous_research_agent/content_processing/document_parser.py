@@ -6,20 +6,80 @@ and extract structured content from research papers.
 """
 
 import logging
+import multiprocessing
 import os
 import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
 import PyPDF2
 from bs4 import BeautifulSoup
+from lxml import etree
+from pdfminer.converter import TextConverter
 from pdfminer.high_level import extract_text as pdfminer_extract_text
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
 
 from autonomous_research_agent.core.exceptions import DocumentProcessingError
 
 logger = logging.getLogger(__name__)
 
+# Common section headers in academic papers
+SECTION_PATTERNS = [
+    (r'abstract', 'abstract'),
+    (r'introduction', 'introduction'),
+    (r'related\s+work', 'related_work'),
+    (r'background', 'background'),
+    (r'methodology|methods', 'methodology'),
+    (r'experiment(?:s|al setup)?', 'experiments'),
+    (r'results(?:\s+and\s+discussion)?', 'results'),
+    (r'discussion', 'discussion'),
+    (r'conclusion(?:s)?', 'conclusion'),
+    (r'reference(?:s)?|bibliography', 'references')
+]
+
+# All headers fused into one regex; the named group that matched is the section name
+SECTION_HEADER_PATTERN = re.compile(
+    r'^\s*(?:\d+\s*\.?\s*)?(?:'
+    + '|'.join(f'(?P<{section_name}>{pattern})' for pattern, section_name in SECTION_PATTERNS)
+    + r')\s*$',
+    re.IGNORECASE
+)
+
+# Runs of characters other than printable ASCII, newline and tab
+NON_PRINTABLE_CANDIDATE_PATTERN = re.compile(r'[^\x20-\x7e\n\t]+')
+
+def _keep_printable(match: re.Match) -> str:
+    """Drop the non-printable characters from a matched run"""
+    run = match.group()
+    if run.isprintable():
+        return run
+    return ''.join(c for c in run if c.isprintable())
+
+def _extract_page_range(file_path: str, start: int, stop: int, use_pdfminer: bool) -> str:
+    """
+    Extract the text of a range of PDF pages, run in a worker process
+    
+    Args:
+        file_path: Path to the PDF file
+        start: Index of the first page
+        stop: Index after the last page
+        use_pdfminer: Whether to use PDFMiner or PyPDF2
+        
+    Returns:
+        Text of the pages in order, formatted as the serial extraction formats it
+    """
+    if use_pdfminer:
+        return pdfminer_extract_text(file_path, page_numbers=range(start, stop))
+    
+    with open(file_path, 'rb') as f:
+        pdf_reader = PyPDF2.PdfReader(f)
+        return ''.join((pdf_reader.pages[i].extract_text() or "") + "\n\n" for i in range(start, stop))
+
 class DocumentParser(ABC):
     """Abstract base class for document parsers"""
     
@@ -53,15 +113,25 @@ class DocumentParser(ABC):
 class PDFParser(DocumentParser):
     """Parser for PDF documents"""
     
-    def __init__(self, use_pdfminer: bool = True):
+    # Documents with fewer pages are not worth starting worker processes for
+    parallel_min_pages = 16
+    
+    # Default cap on worker processes; each one parses the whole file again
+    default_max_workers = 4
+    
+    def __init__(self, use_pdfminer: bool = True, max_workers: Optional[int] = None):
         """
         Initialize PDF parser
         
         Args:
             use_pdfminer: Whether to use PDFMiner (more accurate but slower)
                          or PyPDF2 (faster but less accurate)
+            max_workers: Maximum number of worker processes for extracting pages of
+                         large documents (defaults to default_max_workers, at most
+                         the number of CPUs; 1 disables)
         """
         self.use_pdfminer = use_pdfminer
+        self.max_workers = max_workers
     
     def parse(self, file_path: Union[str, Path]) -> str:
         """
@@ -80,7 +150,7 @@ class PDFParser(DocumentParser):
         try:
             if self.use_pdfminer:
                 # Use PDFMiner for better text extraction
-                text = pdfminer_extract_text(file_path)
+                text = self._extract_with_pdfminer(file_path)
             else:
                 # Use PyPDF2 (faster but less accurate)
                 text = self._extract_with_pypdf2(file_path)
@@ -94,17 +164,70 @@ class PDFParser(DocumentParser):
             logger.error(f"Error parsing PDF {file_path}: {str(e)}")
             raise DocumentProcessingError("pdf", f"Error parsing PDF: {str(e)}")
     
+    def _extract_in_parallel(self, file_path: Path, page_count: int) -> Optional[str]:
+        """
+        Extract text from a large PDF in page ranges across worker processes
+        
+        Args:
+            file_path: Path to the PDF file
+            page_count: Number of pages in the document
+            
+        Returns:
+            Extracted text, or None if the document should be extracted serially
+        """
+        n_workers = min(
+            self.max_workers or min(self.default_max_workers, os.cpu_count() or 1),
+            page_count
+        )
+        if n_workers < 2 or page_count < self.parallel_min_pages:
+            return None
+        
+        # One contiguous page range per worker, so each process parses the file once
+        bounds = [page_count * i // n_workers for i in range(n_workers + 1)]
+        
+        # Spawn rather than fork, as the parser runs in a threaded process
+        mp_context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=n_workers, mp_context=mp_context) as executor:
+            chunks = executor.map(
+                _extract_page_range,
+                [str(file_path)] * n_workers,
+                bounds[:-1],
+                bounds[1:],
+                [self.use_pdfminer] * n_workers
+            )
+            return ''.join(chunks)
+    
+    def _extract_with_pdfminer(self, file_path: Path) -> str:
+        """Extract text using PDFMiner, as pdfminer's extract_text does"""
+        with open(file_path, 'rb') as f:
+            pages = list(PDFPage.get_pages(f))
+            
+            # Spread the pages of large documents over worker processes
+            text = self._extract_in_parallel(file_path, len(pages))
+            
+            if text is None:
+                # Reuse the pages loaded for counting
+                with StringIO() as output:
+                    resource_manager = PDFResourceManager()
+                    device = TextConverter(resource_manager, output, laparams=LAParams())
+                    interpreter = PDFPageInterpreter(resource_manager, device)
+                    for page in pages:
+                        interpreter.process_page(page)
+                    text = output.getvalue()
+        
+        return text
+    
     def _extract_with_pypdf2(self, file_path: Path) -> str:
         """Extract text using PyPDF2"""
-        text = ""
-        
         with open(file_path, 'rb') as f:
             pdf_reader = PyPDF2.PdfReader(f)
             
-            # Extract text from each page
-            for page_num in range(len(pdf_reader.pages)):
-                page = pdf_reader.pages[page_num]
-                text += page.extract_text() + "\n\n"
+            # Spread the pages of large documents over worker processes
+            text = self._extract_in_parallel(file_path, len(pdf_reader.pages))
+            
+            if text is None:
+                # Extract text from each page, joining once instead of growing a string
+                text = ''.join((page.extract_text() or "") + "\n\n" for page in pdf_reader.pages)
         
         return text
     
@@ -116,8 +239,8 @@ class PDFParser(DocumentParser):
         # Remove form feed characters
         text = text.replace('\f', '\n\n')
         
-        # Remove non-printable characters
-        text = ''.join(c for c in text if c.isprintable() or c in ['\n', '\t'])
+        # Remove non-printable characters, only inspecting runs outside printable ASCII
+        text = NON_PRINTABLE_CANDIDATE_PATTERN.sub(_keep_printable, text)
         
         return text
     
@@ -131,20 +254,6 @@ class PDFParser(DocumentParser):
         Returns:
             Dictionary mapping section names to content
         """
-        # Common section headers in academic papers
-        section_patterns = [
-            (r'abstract', 'abstract'),
-            (r'introduction', 'introduction'),
-            (r'related\s+work', 'related_work'),
-            (r'background', 'background'),
-            (r'methodology|methods', 'methodology'),
-            (r'experiment(s|al setup)?', 'experiments'),
-            (r'results(\s+and\s+discussion)?', 'results'),
-            (r'discussion', 'discussion'),
-            (r'conclusion(s)?', 'conclusion'),
-            (r'reference(s)?|bibliography', 'references')
-        ]
-        
         sections = {}
         
         # Split content into lines
@@ -156,15 +265,11 @@ class PDFParser(DocumentParser):
         
         for line in lines:
             # Check if line is a section header
-            is_header = False
-            for pattern, section_name in section_patterns:
-                if re.search(rf'^\s*(?:\d+\s*\.?\s*)?({pattern})\s*$', line.lower()):
-                    current_section = section_name
-                    sections[current_section] = []
-                    is_header = True
-                    break
-            
-            if not is_header:
+            header_match = SECTION_HEADER_PATTERN.match(line)
+            if header_match:
+                current_section = header_match.lastgroup
+                sections[current_section] = []
+            else:
                 sections[current_section].append(line)
         
         # Join section content
@@ -195,8 +300,8 @@ class HTMLParser(DocumentParser):
             with open(file_path, 'r', encoding='utf-8') as f:
                 html_content = f.read()
             
-            # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # Parse HTML with BeautifulSoup on the libxml2-backed parser
+            soup = BeautifulSoup(html_content, 'lxml')
             
             # Remove script and style elements
             for script in soup(["script", "style"]):
@@ -216,14 +321,11 @@ class HTMLParser(DocumentParser):
     
     def _clean_text(self, text: str) -> str:
         """Clean up extracted text"""
-        # Break into lines and remove leading and trailing space on each
-        lines = (line.strip() for line in text.splitlines())
-        
-        # Break multi-headlines into a line each
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+        # Break multi-headlines into a line each, then break into lines
+        lines = text.replace("  ", "\n").splitlines()
         
-        # Remove blank lines
-        text = '\n'.join(chunk for chunk in chunks if chunk)
+        # Remove leading and trailing space on each line and drop blank lines
+        text = '\n'.join(filter(None, map(str.strip, lines)))
         
         return text
     
@@ -239,21 +341,6 @@ class HTMLParser(DocumentParser):
         """
         # For HTML, we would typically use the document structure
         # This is a simplified implementation
-        
-        # Common section headers in academic papers
-        section_patterns = [
-            (r'abstract', 'abstract'),
-            (r'introduction', 'introduction'),
-            (r'related\s+work', 'related_work'),
-            (r'background', 'background'),
-            (r'methodology|methods', 'methodology'),
-            (r'experiment(s|al setup)?', 'experiments'),
-            (r'results(\s+and\s+discussion)?', 'results'),
-            (r'discussion', 'discussion'),
-            (r'conclusion(s)?', 'conclusion'),
-            (r'reference(s)?|bibliography', 'references')
-        ]
-        
         sections = {}
         
         # Split content into lines
@@ -265,15 +352,11 @@ class HTMLParser(DocumentParser):
         
         for line in lines:
             # Check if line is a section header
-            is_header = False
-            for pattern, section_name in section_patterns:
-                if re.search(rf'^\s*(?:\d+\s*\.?\s*)?({pattern})\s*$', line.lower()):
-                    current_section = section_name
-                    sections[current_section] = []
-                    is_header = True
-                    break
-            
-            if not is_header:
+            header_match = SECTION_HEADER_PATTERN.match(line)
+            if header_match:
+                current_section = header_match.lastgroup
+                sections[current_section] = []
+            else:
                 sections[current_section].append(line)
         
         # Join section content
@@ -301,14 +384,20 @@ class XMLParser(DocumentParser):
             raise DocumentProcessingError("xml", f"File not found: {file_path}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                xml_content = f.read()
-            
-            # Parse XML with BeautifulSoup
-            soup = BeautifulSoup(xml_content, 'xml')
+            # Parse XML with lxml directly, recovering from malformed markup as
+            # BeautifulSoup did but without building a Python object per node.
+            # Entities are left unexpanded and nothing is fetched over the network,
+            # so a document cannot pull in local files or remote resources
+            parser = etree.XMLParser(recover=True, resolve_entities=False, no_network=True)
+            try:
+                root = etree.parse(str(file_path), parser).getroot()
+            except etree.XMLSyntaxError:
+                # Nothing to recover, as in an empty file; BeautifulSoup returned no text here
+                root = None
             
-            # Get text
-            text = soup.get_text()
+            # Get text; text() skips the unexpanded entity references, which
+            # itertext() would return as literal "&name;"
+            text = ''.join(root.xpath('.//text()', smart_strings=False)) if root is not None else ''
             
             # Clean up the text
             text = self._clean_text(text)
@@ -7,13 +7,26 @@ publication details, keywords, and research methodologies.
 
 import logging
 import re
+import string
+from collections import Counter
 from typing import Dict, List, Optional, Set, Tuple, Union
 
 import nltk
+from nltk.corpus import stopwords
 from nltk.tokenize import sent_tokenize
 
 logger = logging.getLogger(__name__)
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+    logger.debug("pyahocorasick not available, methodology keywords are matched with re")
+
+def _is_word_char(char: str) -> bool:
+    """Return True if the character counts as a word character for \\b"""
+    return char.isalnum() or char == '_'
+
 class MetadataExtractor:
     """
     Extracts metadata from research papers
@@ -31,6 +44,37 @@ class MetadataExtractor:
         self.email_pattern = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
         self.url_pattern = re.compile(r'https?://\S+')
         self.year_pattern = re.compile(r'\b(19|20)\d{2}\b')
+        self.keyword_section_pattern = re.compile(
+            r'(keywords|key\s+words|index\s+terms)[\s\:]+([^\n\.]+)',
+            re.IGNORECASE
+        )
+        self.keyword_separator_pattern = re.compile(r'[,;]')
+        self.tool_version_pattern = re.compile(
+            r'([A-Za-z][A-Za-z0-9\-_\.]+)\s+(?:version|v)?\.?\s*([0-9]+(?:\.[0-9]+)*)'
+        )
+        
+        # Patterns for dataset mentions
+        self.dataset_patterns = [
+            re.compile(pattern, re.IGNORECASE)
+            for pattern in [
+                r'dataset\s+(?:called|named)?\s+["\']?([A-Za-z0-9\-_]+)["\']?',
+                r'data\s+from\s+(?:the\s+)?["\']?([A-Za-z0-9\-_]+)["\']?',
+                r'([A-Za-z0-9\-_]+)\s+dataset',
+                r'([A-Za-z0-9\-_]+)\s+corpus'
+            ]
+        ]
+        
+        # Patterns for funding acknowledgments
+        self.funding_patterns = [
+            re.compile(pattern, re.IGNORECASE)
+            for pattern in [
+                r'(?:funded|supported|financed)\s+by\s+(?:the\s+)?([^\.]+)',
+                r'(?:grant|award|contract)\s+(?:from|by)\s+(?:the\s+)?([^\.]+)',
+                r'(?:financial\s+)?support\s+(?:from|by)\s+(?:the\s+)?([^\.]+)',
+                r'(?:acknowledge|thank)(?:s|ing)?\s+(?:the\s+)?([^\.]+?)\s+for\s+(?:financial|funding)',
+                r'(?:under|through)\s+(?:the\s+)?grant\s+(?:number|#)?\s+([A-Za-z0-9\-_\/]+)'
+            ]
+        ]
         
         # Research methodology patterns
         self.methodology_patterns = {
@@ -45,6 +89,47 @@ class MetadataExtractor:
             'machine_learning': [r'\bmachine learning\b', r'\bdeep learning\b', r'\bneural network\b'],
             'data_mining': [r'\bdata mining\b', r'\bcluster\w+\b', r'\bclassif\w+\b']
         }
+        
+        # Match literal methodology keywords with one Aho-Corasick automaton, leaving
+        # only the patterns with wildcards to the regex
+        self.methodology_automaton = None
+        regex_patterns = self.methodology_patterns
+        if ahocorasick is not None:
+            self.methodology_automaton = ahocorasick.Automaton()
+            regex_patterns = {}
+            for methodology, patterns in self.methodology_patterns.items():
+                for pattern in patterns:
+                    literal = re.fullmatch(r'\\b([\w\- ]+)\\b', pattern)
+                    if literal:
+                        keyword = literal.group(1).lower()
+                        self.methodology_automaton.add_word(keyword, (len(keyword), methodology))
+                    else:
+                        regex_patterns.setdefault(methodology, []).append(pattern)
+            self.methodology_automaton.make_automaton()
+        
+        # Fuse the remaining patterns into one regex with a named group per methodology
+        self.methodology_pattern = None
+        if regex_patterns:
+            self.methodology_pattern = re.compile(
+                '|'.join(
+                    f"(?P<{methodology}>{'|'.join(patterns)})"
+                    for methodology, patterns in regex_patterns.items()
+                ),
+                re.IGNORECASE
+            )
+        
+        # Common software tools in research
+        self.common_tools = [
+            'Python', 'R', 'MATLAB', 'TensorFlow', 'PyTorch', 'Keras', 'scikit-learn',
+            'SPSS', 'SAS', 'Stata', 'NLTK', 'spaCy', 'Pandas', 'NumPy', 'Jupyter',
+            'GitHub', 'Git', 'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP',
+            'LaTeX', 'Overleaf', 'Excel', 'Word', 'PowerPoint', 'Tableau', 'Power BI'
+        ]
+        self.tool_names = {tool.casefold(): tool for tool in self.common_tools}
+        self.tool_pattern = re.compile(
+            r'\b(?:' + '|'.join(re.escape(tool) for tool in self.common_tools) + r')\b',
+            re.IGNORECASE
+        )
     
     def extract_metadata(self, content: str, structured_content: Dict) -> Dict:
         """
@@ -134,19 +219,14 @@ class MetadataExtractor:
         extracting important terms if no explicit keywords are found.
         """
         # Try to find explicit keywords section
-        keyword_section_pattern = re.compile(
-            r'(keywords|key\s+words|index\s+terms)[\s\:]+([^\n\.]+)', 
-            re.IGNORECASE
-        )
-        
-        keyword_match = keyword_section_pattern.search(content)
+        keyword_match = self.keyword_section_pattern.search(content)
         
         if keyword_match:
             # Extract keywords from explicit section
             keyword_text = keyword_match.group(2)
             
             # Split by common separators
-            keywords = re.split(r'[,;]', keyword_text)
+            keywords = self.keyword_separator_pattern.split(keyword_text)
             
             # Clean up keywords
             keywords = [k.strip().lower() for k in keywords if k.strip()]
@@ -155,8 +235,6 @@ class MetadataExtractor:
         
         # If no explicit keywords, extract important terms
         # This is a simplified implementation
-        from collections import Counter
-        import string
         
         # Tokenize and clean
         words = content.lower().split()
@@ -164,7 +242,6 @@ class MetadataExtractor:
         
         # Remove common words
         try:
-            from nltk.corpus import stopwords
             try:
                 stop_words = set(stopwords.words('english'))
             except LookupError:
@@ -191,17 +268,34 @@ class MetadataExtractor:
         This method looks for methodology-related terms and classifies
         the research approach based on pattern matching.
         """
-        methodologies = []
-        content_lower = content.lower()
-        
-        # Check each methodology pattern
-        for methodology, patterns in self.methodology_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, content_lower):
-                    methodologies.append(methodology)
+        methodologies = set()
+        
+        # Find literal keywords in a single automaton pass
+        if self.methodology_automaton is not None:
+            content_lower = content.lower()
+            content_length = len(content_lower)
+            
+            for end, (length, methodology) in self.methodology_automaton.iter(content_lower):
+                start = end - length + 1
+                
+                # Require word boundaries on both sides, as \b does
+                if start > 0 and _is_word_char(content_lower[start - 1]):
+                    continue
+                if end + 1 < content_length and _is_word_char(content_lower[end + 1]):
+                    continue
+                
+                methodologies.add(methodology)
+                if len(methodologies) == len(self.methodology_patterns):
+                    return list(methodologies)
+        
+        # Scan once for the remaining patterns, stopping as soon as every methodology has been seen
+        if self.methodology_pattern is not None:
+            for match in self.methodology_pattern.finditer(content):
+                methodologies.add(match.lastgroup)
+                if len(methodologies) == len(self.methodology_patterns):
                     break
         
-        return list(set(methodologies))
+        return list(methodologies)
     
     def _extract_datasets(self, content: str) -> List[str]:
         """
@@ -212,15 +306,8 @@ class MetadataExtractor:
         datasets = []
         
         # Look for dataset mentions
-        dataset_patterns = [
-            r'dataset\s+(?:called|named)?\s+["\']?([A-Za-z0-9\-_]+)["\']?',
-            r'data\s+from\s+(?:the\s+)?["\']?([A-Za-z0-9\-_]+)["\']?',
-            r'([A-Za-z0-9\-_]+)\s+dataset',
-            r'([A-Za-z0-9\-_]+)\s+corpus'
-        ]
-        
-        for pattern in dataset_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
+        for pattern in self.dataset_patterns:
+            matches = pattern.finditer(content)
             for match in matches:
                 dataset = match.group(1).strip()
                 if len(dataset) > 2:  # Filter out very short matches
@@ -234,24 +321,11 @@ class MetadataExtractor:
         
         This method looks for mentions of software tools in the content.
         """
-        tools = []
-        
-        # Common software tools in research
-        common_tools = [
-            'Python', 'R', 'MATLAB', 'TensorFlow', 'PyTorch', 'Keras', 'scikit-learn',
-            'SPSS', 'SAS', 'Stata', 'NLTK', 'spaCy', 'Pandas', 'NumPy', 'Jupyter',
-            'GitHub', 'Git', 'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP',
-            'LaTeX', 'Overleaf', 'Excel', 'Word', 'PowerPoint', 'Tableau', 'Power BI'
-        ]
-        
-        # Look for tool mentions
-        for tool in common_tools:
-            if re.search(r'\b' + re.escape(tool) + r'\b', content, re.IGNORECASE):
-                tools.append(tool)
+        # Look for tool mentions in a single pass
+        tools = [self.tool_names[match.group().casefold()] for match in self.tool_pattern.finditer(content)]
         
         # Look for tool mentions with version numbers
-        tool_version_pattern = r'([A-Za-z][A-Za-z0-9\-_\.]+)\s+(?:version|v)?\.?\s*([0-9]+(?:\.[0-9]+)*)'
-        matches = re.finditer(tool_version_pattern, content)
+        matches = self.tool_version_pattern.finditer(content)
         
         for match in matches:
             tool = match.group(1).strip()
@@ -270,16 +344,8 @@ class MetadataExtractor:
         funding_info = []
         
         # Look for funding acknowledgments
-        funding_patterns = [
-            r'(?:funded|supported|financed)\s+by\s+(?:the\s+)?([^\.]+)',
-            r'(?:grant|award|contract)\s+(?:from|by)\s+(?:the\s+)?([^\.]+)',
-            r'(?:financial\s+)?support\s+(?:from|by)\s+(?:the\s+)?([^\.]+)',
-            r'(?:acknowledge|thank)(?:s|ing)?\s+(?:the\s+)?([^\.]+?)\s+for\s+(?:financial|funding)',
-            r'(?:under|through)\s+(?:the\s+)?grant\s+(?:number|#)?\s+([A-Za-z0-9\-_\/]+)'
-        ]
-        
-        for pattern in funding_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
+        for pattern in self.funding_patterns:
+            matches = pattern.finditer(content)
             for match in matches:
                 funding = match.group(1).strip()
                 if len(funding) > 5:  # Filter out very short matches
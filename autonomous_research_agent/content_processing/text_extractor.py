@@ -7,9 +7,11 @@ identify key components like figures, tables, and equations, and structure the c
 
 import logging
 import re
+from collections import Counter
 from typing import Dict, List, Optional, Set, Tuple
 
 import nltk
+from nltk.corpus import stopwords
 from nltk.tokenize import sent_tokenize, word_tokenize
 
 from autonomous_research_agent.core.exceptions import DocumentProcessingError
@@ -351,7 +353,6 @@ class TextExtractor:
         words = word_tokenize(content.lower())
         
         # Remove stopwords and short words
-        from nltk.corpus import stopwords
         try:
             stop_words = set(stopwords.words('english'))
         except LookupError:
@@ -365,7 +366,6 @@ class TextExtractor:
         ]
         
         # Count word frequencies
-        from collections import Counter
         word_counts = Counter(filtered_words)
         
         # Get top keywords
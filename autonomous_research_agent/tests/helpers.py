@@ -0,0 +1,3 @@
+def kernel_implementations(kernel):
+    """The kernel as called, plus the Python function behind it when numba compiled it"""
+    return [kernel] + ([kernel.py_func] if hasattr(kernel, 'py_func') else [])
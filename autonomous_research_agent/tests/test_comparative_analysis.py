@@ -0,0 +1,138 @@
+import sys
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+from scipy.sparse.csgraph import connected_components
+
+from autonomous_research_agent.analysis.comparative_analysis import ComparativeAnalysis, _metric_stats
+from autonomous_research_agent.tests.helpers import kernel_implementations
+
+def _clustered_embeddings(num_clusters, per_cluster, dim=32, seed=0):
+    """Normalized embeddings in well separated clusters, with the cluster of each row"""
+    rng = np.random.default_rng(seed)
+    centers = np.linalg.qr(rng.standard_normal((dim, num_clusters)))[0].T
+    labels = np.repeat(np.arange(num_clusters), per_cluster)
+    embeddings = centers[labels] + 0.05 * rng.standard_normal((len(labels), dim))
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+    order = rng.permutation(len(labels))
+    return embeddings[order].astype(np.float32), labels[order]
+
+def _greedy_clusters(similarity_matrix, threshold=0.7):
+    """Clusters as the greedy star clustering formed them, as sets of finding indices"""
+    clusters = []
+    used = set()
+    for i in range(len(similarity_matrix)):
+        if i in used:
+            continue
+        members = {j for j in range(len(similarity_matrix)) if similarity_matrix[i, j] > threshold and j not in used}
+        members.add(i)
+        clusters.append(frozenset(members))
+        used.update(members)
+    return set(clusters)
+
+def _partition(labels):
+    """Set of index sets sharing a label"""
+    groups = {}
+    for i, label in enumerate(labels):
+        groups.setdefault(label, set()).add(i)
+    return {frozenset(group) for group in groups.values()}
+
+class TestMetricStats(unittest.TestCase):
+    def test_matches_numpy(self):
+        rng = np.random.default_rng(0)
+        for values in (np.array([0.5]), rng.random(7), rng.normal(80, 5, 1000), np.array([3.0, 3.0, 3.0])):
+            for implementation in kernel_implementations(_metric_stats):
+                minimum, maximum, mean, std = implementation(values)
+                self.assertAlmostEqual(minimum, values.min())
+                self.assertAlmostEqual(maximum, values.max())
+                self.assertAlmostEqual(mean, values.mean())
+                self.assertAlmostEqual(std, values.std())
+
+class TestCompareFindings(unittest.TestCase):
+    def setUp(self):
+        with patch.object(ComparativeAnalysis, '_initialize_models'):
+            self.analysis = ComparativeAnalysis()
+
+    def _findings_list(self, num_findings, num_papers=4):
+        findings_list = [[] for _ in range(num_papers)]
+        for i in range(num_findings):
+            findings_list[i % num_papers].append({'text': f'finding {i}', 'confidence': 0.5, 'source': 'results'})
+        flat_index = [int(finding['text'].split()[1]) for findings in findings_list for finding in findings]
+        return findings_list, flat_index
+
+    def _assert_matches_greedy_clusters(self, num_clusters, per_cluster):
+        embeddings, _ = _clustered_embeddings(num_clusters, per_cluster)
+        findings_list, flat_index = self._findings_list(len(embeddings))
+        flat_embeddings = embeddings[flat_index]
+
+        comparison = self.analysis.compare_findings(findings_list, embeddings=flat_embeddings)
+        clusters = {
+            frozenset(flat_index.index(int(finding['text'].split()[1])) for finding in cluster['findings'])
+            for cluster in comparison['clusters']
+        }
+
+        self.assertEqual(clusters, _greedy_clusters(flat_embeddings @ flat_embeddings.T))
+        self.assertEqual(comparison['unique_findings'], num_clusters)
+        self.assertEqual([cluster['size'] for cluster in comparison['clusters']], [per_cluster] * num_clusters)
+
+    def test_dense_clusters_match_greedy_clustering(self):
+        self._assert_matches_greedy_clusters(6, 20)
+
+    def test_neighbor_graph_clusters_match_greedy_clustering(self):
+        num_clusters = 12
+        per_cluster = self.analysis.dense_similarity_limit // num_clusters + 1
+        self.analysis.neighbor_count = per_cluster
+        self._assert_matches_greedy_clusters(num_clusters, per_cluster)
+
+    def test_neighbor_graph_matches_dense_graph(self):
+        embeddings, _ = _clustered_embeddings(8, 30, seed=1)
+        self.analysis.neighbor_count = 30
+        dense = self.analysis._similarity_matrix(embeddings) > self.analysis.similarity_threshold
+
+        # Without FAISS installed, the blocked NumPy search is used
+        graphs = {'default': self.analysis._neighbor_graph(embeddings)}
+        with patch.dict(sys.modules, {'faiss': None}):
+            graphs['numpy'] = self.analysis._neighbor_graph(embeddings, block_size=64)
+
+        for name, graph in graphs.items():
+            with self.subTest(search=name):
+                self.assertEqual(
+                    _partition(connected_components(graph, directed=False)[1]),
+                    _partition(connected_components(dense, directed=False)[1])
+                )
+
+class TestCompareNumericalResults(unittest.TestCase):
+    def setUp(self):
+        with patch.object(ComparativeAnalysis, '_initialize_models'):
+            self.analysis = ComparativeAnalysis()
+
+    def test_rmse_is_not_counted_as_mse(self):
+        papers = [
+            {'findings': [{'text': 'The model reaches an RMSE of 0.25 and a MAE of 0.1.'}]},
+            {'findings': [{'text': 'Our MSE is 0.04 with accuracy of 91%.'}]}
+        ]
+        metrics = self.analysis.compare_numerical_results(papers)['metrics']
+
+        self.assertEqual(sorted(metrics), ['accuracy', 'mae', 'mse', 'rmse'])
+        self.assertEqual([result['value'] for result in metrics['rmse']['results']], [0.25])
+        self.assertEqual([result['value'] for result in metrics['mse']['results']], [0.04])
+        self.assertEqual(metrics['mse']['results'][0]['paper_idx'], 1)
+
+    def test_first_value_per_metric_and_percentages(self):
+        papers = [
+            {'findings': [{'text': 'Accuracy of 90% on CIFAR and accuracy of 80% on SVHN.'}]},
+            {'findings': [{'text': 'F1 score of 0.7, precision is 0.6 and recall was 50 percent.'}]},
+            {'findings': [{'text': 'No metrics reported here.'}]},
+            {'title': 'Paper without findings'}
+        ]
+        metrics = self.analysis.compare_numerical_results(papers)['metrics']
+
+        self.assertEqual(sorted(metrics), ['accuracy', 'f1 score', 'precision', 'recall'])
+        self.assertEqual(metrics['accuracy']['count'], 1)
+        self.assertAlmostEqual(metrics['accuracy']['mean'], 0.9)
+        self.assertAlmostEqual(metrics['recall']['mean'], 0.5)
+        self.assertAlmostEqual(metrics['f1 score']['mean'], 0.7)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import re
+import tempfile
+import unittest
+
+from autonomous_research_agent.content_processing.document_parser import PDFParser, XMLParser
+
+def _build_pdf(page_texts):
+    """Build a minimal PDF with one line of Helvetica text per page"""
+    objects = [b'<< /Type /Catalog /Pages 2 0 R >>', b'', b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    kids = []
+    for text in page_texts:
+        stream = f'BT /F1 12 Tf 72 720 Td ({text}) Tj ET'.encode('ascii')
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % len(objects)
+        )
+        kids.append(b'%d 0 R' % len(objects))
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (b' '.join(kids), len(kids))
+
+    pdf = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+
+    xref_offset = len(pdf)
+    pdf += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        pdf += b'%010d 00000 n \n' % offset
+    pdf += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref_offset)
+    return bytes(pdf)
+
+def _baseline_extract_sections(content):
+    """Section splitting as it was done with one regex search per header pattern"""
+    section_patterns = [
+        (r'abstract', 'abstract'),
+        (r'introduction', 'introduction'),
+        (r'related\s+work', 'related_work'),
+        (r'background', 'background'),
+        (r'methodology|methods', 'methodology'),
+        (r'experiment(s|al setup)?', 'experiments'),
+        (r'results(\s+and\s+discussion)?', 'results'),
+        (r'discussion', 'discussion'),
+        (r'conclusion(s)?', 'conclusion'),
+        (r'reference(s)?|bibliography', 'references')
+    ]
+    sections = {'preamble': []}
+    current_section = 'preamble'
+    for line in content.split('\n'):
+        for pattern, section_name in section_patterns:
+            if re.search(rf'^\s*(?:\d+\s*\.?\s*)?({pattern})\s*$', line.lower()):
+                current_section = section_name
+                sections[current_section] = []
+                break
+        else:
+            sections[current_section].append(line)
+    return {section: '\n'.join(lines) for section, lines in sections.items()}
+
+class TestPDFParser(unittest.TestCase):
+    def _write(self, content):
+        fd, path = tempfile.mkstemp(suffix='.pdf')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_parallel_extraction_matches_serial(self):
+        path = self._write(_build_pdf([f'Results on page {i}' for i in range(PDFParser.parallel_min_pages + 4)]))
+
+        for use_pdfminer in (True, False):
+            with self.subTest(use_pdfminer=use_pdfminer):
+                serial = PDFParser(use_pdfminer=use_pdfminer, max_workers=1)
+                parallel = PDFParser(use_pdfminer=use_pdfminer, max_workers=3)
+
+                text = serial.parse(path)
+                self.assertIn('Results on page 19', text)
+                self.assertIsNotNone(parallel._extract_in_parallel(path, PDFParser.parallel_min_pages + 4))
+                self.assertEqual(parallel.parse(path), text)
+
+    def test_short_documents_are_extracted_serially(self):
+        path = self._write(_build_pdf(['Abstract', 'Introduction']))
+        parser = PDFParser(max_workers=4)
+
+        self.assertIsNone(parser._extract_in_parallel(path, 2))
+        self.assertIn('Introduction', parser.parse(path))
+
+    def test_extract_sections_matches_per_pattern_search(self):
+        content = '\n'.join([
+            'Title of the paper', 'ABSTRACT', 'We study things.', '1. Introduction', 'Intro text',
+            '2 Related   Work', 'related', 'Methods', 'Experimental setup', 'exp', 'Results and Discussion',
+            'res', '  Discussion  ', 'Conclusions', 'Introduction to results', 'References', '[1] A.',
+            'Bibliography', 'experiments', '3.Methodology', 'Results and discussion of results'
+        ])
+
+        self.assertEqual(PDFParser().extract_sections(content), _baseline_extract_sections(content))
+
+class TestXMLParser(unittest.TestCase):
+    def _write(self, content):
+        fd, path = tempfile.mkstemp(suffix='.xml')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_parse_extracts_text(self):
+        path = self._write(b'<paper><title>Deep  Learning</title>\n<abstract>We study\tnets.</abstract></paper>')
+        self.assertEqual(XMLParser().parse(path), 'Deep Learning We study nets.')
+
+    def test_parse_recovers_malformed_markup(self):
+        path = self._write(b'<paper><title>Deep Learning</title><abstract>We study nets.')
+        self.assertEqual(XMLParser().parse(path), 'Deep LearningWe study nets.')
+
+    def test_parse_does_not_expand_external_entities(self):
+        secret = self._write(b'secret contents')
+        path = self._write(
+            b'<!DOCTYPE paper [<!ENTITY leak SYSTEM "file://%s">]><paper>Deep &leak; Learning</paper>' % secret.encode()
+        )
+        self.assertEqual(XMLParser().parse(path), 'Deep Learning')
+
+    def test_parse_empty_document_returns_empty_text(self):
+        # BeautifulSoup returned no text for these; lxml reports "Document is empty"
+        for content in (b'', b'   \n', b'\x00\x01'):
+            with self.subTest(content=content):
+                self.assertEqual(XMLParser().parse(self._write(content)), '')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import random
+import re
+import unittest
+from collections import OrderedDict
+
+import numpy as np
+
+from autonomous_research_agent.analysis import findings_extractor
+from autonomous_research_agent.analysis.findings_extractor import FindingsExtractor, _select_unique
+from autonomous_research_agent.tests.helpers import kernel_implementations
+
+def _greedy_unique(token_sets, threshold, limit):
+    """Selection as the pairwise Jaccard loop made it, as a list of booleans"""
+    kept = []
+    selected = []
+    for tokens in token_sets:
+        if len(kept) == limit:
+            selected.append(False)
+            continue
+        is_duplicate = any(
+            tokens | other and len(tokens & other) / len(tokens | other) >= threshold
+            for other in kept
+        )
+        selected.append(not is_duplicate)
+        if not is_duplicate:
+            kept.append(tokens)
+    return selected
+
+def _pack(token_sets):
+    """Sorted token hashes and offsets in the layout _select_unique takes"""
+    arrays = [np.unique(np.array([hash(str(token)) for token in tokens], dtype=np.int64)) for tokens in token_sets]
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum([array.shape[0] for array in arrays], out=offsets[1:])
+    return np.concatenate(arrays), offsets
+
+class TestSelectUnique(unittest.TestCase):
+    def test_matches_pairwise_jaccard(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            # Near-duplicates of a few base sets, so that many pairs are close to the threshold
+            bases = [set(rng.sample(range(40), rng.randint(0, 12))) for _ in range(6)]
+            token_sets = []
+            for _ in range(rng.randint(1, 40)):
+                tokens = set(rng.choice(bases))
+                for _ in range(rng.randint(0, 3)):
+                    if tokens and rng.random() < 0.5:
+                        tokens.discard(rng.choice(sorted(tokens)))
+                    else:
+                        tokens.add(rng.randrange(40))
+                token_sets.append(tokens)
+
+            threshold = rng.choice([0.5, 0.8, 0.9])
+            limit = rng.randint(1, len(token_sets))
+            tokens, offsets = _pack(token_sets)
+            expected = _greedy_unique(token_sets, threshold, limit)
+
+            for implementation in kernel_implementations(_select_unique):
+                self.assertEqual(implementation(tokens, offsets, threshold, limit).tolist(), expected)
+
+class TestFindingsExtractor(unittest.TestCase):
+    def setUp(self):
+        self.extractor = FindingsExtractor(use_transformer=False)
+
+    def test_deduplicate_matches_pairwise_jaccard(self):
+        findings = [
+            {'text': 'We found that the model improves accuracy.', 'confidence': 0.6},
+            {'text': 'We found that the model improves accuracy!', 'confidence': 0.9},
+            {'text': 'Results show a large gain on all benchmarks.', 'confidence': 0.7},
+            {'text': 'Results show a large gain on most benchmarks.', 'confidence': 0.5},
+            {'text': 'In conclusion, the approach is robust.', 'confidence': 0.8},
+            {'text': '...', 'confidence': 0.4},
+            {'text': '!!!', 'confidence': 0.3}
+        ]
+        sorted_findings = sorted(findings, key=lambda finding: finding['confidence'], reverse=True)
+        word_sets = [set(self.extractor._normalize_text(finding['text']).split()) for finding in sorted_findings]
+        expected = [
+            finding for finding, keep in zip(sorted_findings, _greedy_unique(word_sets, 0.8, len(findings))) if keep
+        ]
+
+        self.assertEqual(self.extractor._deduplicate_findings(findings), expected)
+
+    def test_finding_sentences_match_per_pattern_search(self):
+        sentences = [
+            'We found that scaling helps.', 'The weather was nice.', 'Our results show a clear trend.',
+            'THIS PAPER DEMONSTRATES a new method.', 'A key finding is robustness.', '',
+            'In summary, it works.', 'Die Ergebnisse zeigen nichts. We show gains.', 'données: we identified two',
+            'Findings suggest otherwise.', 'Results\xa0show x', 'Results\u2009show x', 'We\u3000found that'
+        ]
+        expected = [
+            index for index, sentence in enumerate(sentences)
+            if any(re.search(pattern, sentence, re.IGNORECASE) for pattern in self.extractor.finding_patterns)
+        ]
+
+        self.assertEqual(self.extractor._find_finding_sentences(sentences), expected)
+
+        # Without Hyperscan the fused regex is used
+        self.extractor._hyperscan_db = None
+        self.assertEqual(self.extractor._find_finding_sentences(sentences), expected)
+
+    def test_summarizer_failure_only_drops_the_failing_section(self):
+        calls = []
+
+        def summarizer(texts, **kwargs):
+            calls.append(texts)
+            self.assertTrue(kwargs['truncation'])
+            self.assertEqual(kwargs['batch_size'], self.extractor.summary_batch_size)
+            if any(text.startswith('broken') for text in texts):
+                raise RuntimeError("Input is too long")
+            return [{'summary_text': f"Results show that {text.split()[0]} works."} for text in texts]
+
+        self.extractor.summarizer = summarizer
+        self.extractor._summary_cache_prefix = 'summary|test'
+        self.extractor._inference_cache = OrderedDict()
+        texts = [f"{name} " + 'word ' * 60 for name in ('alpha', 'broken', 'gamma')] + ['too short']
+        section_names = ['results', 'methods', 'discussion', 'conclusion']
+
+        findings = self.extractor._summarize_sections(texts, section_names)
+        self.assertEqual(
+            [[finding['text'] for finding in section] for section in findings],
+            [["Results show that alpha works."], [], ["Results show that gamma works."], []]
+        )
+
+        # The other summaries were cached, so only the failing section is retried
+        calls.clear()
+        findings = self.extractor._summarize_sections(texts, section_names)
+        self.assertEqual([len(section) for section in findings], [1, 0, 1, 0])
+        self.assertTrue(calls)
+        self.assertTrue(all(batch == [texts[1]] for batch in calls))
+
+    @unittest.skipIf(findings_extractor.hyperscan is None, "Hyperscan not installed")
+    def test_hyperscan_database_is_compiled(self):
+        self.assertIsNotNone(self.extractor._hyperscan_db)
+
+if __name__ == '__main__':
+    unittest.main()
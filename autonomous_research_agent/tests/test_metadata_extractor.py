@@ -0,0 +1,62 @@
+import random
+import re
+import unittest
+from unittest.mock import patch
+
+from autonomous_research_agent.content_processing import metadata_extractor
+from autonomous_research_agent.content_processing.metadata_extractor import MetadataExtractor
+
+class TestMetadataExtractor(unittest.TestCase):
+    def setUp(self):
+        self.extractor = MetadataExtractor()
+
+        vocabulary = (
+            'survey review meta-analysis experiment control group randomized case study case-study '
+            'simulation model Model modeling qualitative interview ethnography quantitative statistics '
+            'regression mixed method framework conceptual machine learning deep learning neural network '
+            'data mining clustering classification the and , . SURVEY Case Study _survey survey_ 1model '
+            'model2 multi-method Ethno x-review Python R r MATLAB scikit-learn Power BI Word word GitGit '
+            'Git-hub GitHub spaCy Überblick études'
+        ).split()
+        rng = random.Random(0)
+        self.texts = [
+            rng.choice([' ', '']).join(rng.choice(vocabulary) for _ in range(rng.randint(0, 30)))
+            for _ in range(2000)
+        ]
+
+    def _expected_methodologies(self, content):
+        """Methodologies as one re.search per pattern found them"""
+        content_lower = content.lower()
+        return {
+            methodology
+            for methodology, patterns in self.extractor.methodology_patterns.items()
+            if any(re.search(pattern, content_lower) for pattern in patterns)
+        }
+
+    def _expected_tools(self, content):
+        """Tools as one re.search per tool found them, without versioned mentions"""
+        return {
+            tool for tool in self.extractor.common_tools
+            if re.search(r'\b' + re.escape(tool) + r'\b', content, re.IGNORECASE)
+        }
+
+    def test_methodologies_match_per_pattern_search(self):
+        for text in self.texts:
+            self.assertEqual(set(self.extractor._extract_methodologies(text)), self._expected_methodologies(text))
+
+    def test_methodologies_without_automaton_match_per_pattern_search(self):
+        with patch.object(metadata_extractor, 'ahocorasick', None):
+            extractor = MetadataExtractor()
+
+        self.assertIsNone(extractor.methodology_automaton)
+        for text in self.texts:
+            self.assertEqual(set(extractor._extract_methodologies(text)), self._expected_methodologies(text))
+
+    def test_tools_match_per_tool_search(self):
+        for text in self.texts:
+            # Versioned mentions are found by a separate pattern, unchanged
+            versioned = {tool for tool in self.extractor._extract_tools(text) if ' v' in tool}
+            self.assertEqual(set(self.extractor._extract_tools(text)) - versioned, self._expected_tools(text))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import random
+import re
+import unittest
+
+import numpy as np
+
+from autonomous_research_agent.analysis import methodology_classifier
+from autonomous_research_agent.analysis.methodology_classifier import MethodologyClassifier, _count_keywords
+from autonomous_research_agent.tests.helpers import kernel_implementations
+
+class TestRuleBasedClassification(unittest.TestCase):
+    def setUp(self):
+        self.classifier = MethodologyClassifier(use_transformer=False)
+
+        # Texts mixing keywords with near misses at word boundaries
+        vocabulary = [
+            keyword for info in self.classifier.methodology_categories.values() for keyword in info['keywords']
+        ] + ['the', 'and', 'of', '.', ',', 'models', 'surveys', 'pre-survey', 'svm_', 'x-ray', 'Survey', 'LSTM', '']
+        rng = random.Random(0)
+        self.texts = [
+            rng.choice([' ', '', '-', '\n']).join(rng.choice(vocabulary) for _ in range(rng.randint(0, 40)))
+            for _ in range(300)
+        ] + ['', 'survey survey survey', 'surveysurvey', 'interview and interviews']
+
+    def _expected_scores(self, text):
+        """Scores as one re.findall per keyword computed them"""
+        text_lower = text.lower()
+        return np.array([
+            min(1.0, sum(
+                len(re.findall(r'\b' + re.escape(keyword) + r'\b', text_lower)) for keyword in info['keywords']
+            ) / (len(info['keywords']) * 0.5))
+            for info in self.classifier.methodology_categories.values()
+        ])
+
+    def test_compiled_counter_matches_per_keyword_search(self):
+        keyword_arrays = self.classifier._build_keyword_arrays()
+
+        for text in self.texts:
+            text_bytes = np.frombuffer(text.lower().encode('ascii'), dtype=np.uint8)
+            for implementation in kernel_implementations(_count_keywords):
+                counts = implementation(text_bytes, *keyword_arrays)
+                np.testing.assert_allclose(
+                    np.minimum(1.0, counts / self.classifier._keyword_norms), self._expected_scores(text)
+                )
+
+    @unittest.skipIf(methodology_classifier.ahocorasick is None, "pyahocorasick not installed")
+    def test_automaton_matches_per_keyword_search(self):
+        self.classifier._keyword_arrays = None
+
+        for text in self.texts + ['Überblick: survey of qualitative études', 'ﬁeld survey']:
+            np.testing.assert_allclose(self.classifier._classify_with_rules(text), self._expected_scores(text))
+
+    def test_classify_many_matches_single_texts(self):
+        self.classifier.parallel_min_texts = 1
+
+        scores = self.classifier._classify_many_with_rules(self.texts, n_workers=4)
+        np.testing.assert_allclose(scores, [self._expected_scores(text) for text in self.texts])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+import importlib.util
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from autonomous_research_agent.analysis import models
+from autonomous_research_agent.analysis.comparative_analysis import ComparativeAnalysis
+
+@unittest.skipIf(importlib.util.find_spec('optimum') is None, "optimum not installed")
+class TestQuantizedSentenceTransformer(unittest.TestCase):
+    def setUp(self):
+        # Load outside the process-wide cache, on CPU where the encoder is quantized
+        with patch('torch.cuda.is_available', return_value=False), \
+                patch('torch.backends.mps.is_available', return_value=False):
+            self.model = models._load_sentence_transformer.__wrapped__('all-MiniLM-L6-v2', True)
+
+    def test_encoder_is_quantized_on_cpu(self):
+        self.assertIsInstance(self.model[0].auto_model, models._ORTFeatureExtractor)
+        self.assertEqual(self.model.device.type, 'cpu')
+
+    def test_encode_all(self):
+        with patch.object(ComparativeAnalysis, '_initialize_models'):
+            analysis = ComparativeAnalysis()
+        analysis.sentence_transformer = self.model
+
+        embeddings = analysis.encode_all(['We found that scaling helps.', 'The weather was nice.'])
+        self.assertEqual(embeddings.shape, (2, self.model.get_sentence_embedding_dimension()))
+        np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, rtol=1e-5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+import numpy as np
+
+from autonomous_research_agent.analysis.topic_modeling import _bucket_docs_by_topic, _top_k_per_row
+from autonomous_research_agent.tests.helpers import kernel_implementations
+
+class TestTopKPerRow(unittest.TestCase):
+    def test_matches_argsort(self):
+        rng = np.random.default_rng(0)
+
+        # Small integer weights give many ties
+        for components in (rng.random((5, 200)), rng.integers(0, 4, (6, 50)).astype(np.float64), rng.random((3, 4))):
+            for k in (1, 10):
+                # Top words as taken from argsort()[:-k - 1:-1]
+                expected = np.argsort(components, axis=1, kind='stable')[:, :-k - 1:-1]
+                for implementation in kernel_implementations(_top_k_per_row):
+                    np.testing.assert_array_equal(implementation(components, k), expected)
+
+class TestBucketDocsByTopic(unittest.TestCase):
+    def test_matches_grouping(self):
+        topics = np.random.default_rng(0).integers(0, 5, 100).astype(np.int32)
+        for implementation in kernel_implementations(_bucket_docs_by_topic):
+            indptr, indices = implementation(topics, 6)
+            for topic in range(6):
+                self.assertEqual(indices[indptr[topic]:indptr[topic + 1]].tolist(), np.flatnonzero(topics == topic).tolist())
+
+if __name__ == '__main__':
+    unittest.main()